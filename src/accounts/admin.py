@@ -1,18 +1,52 @@
 """Admin registrations for accounts app."""
 
+from django import forms
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
-from django.utils.html import mark_safe
+from django.core.exceptions import ValidationError
+from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
+from core.admin import ReplicaChangelistMixin
+from search.admin import FullTextSearchAdminMixin
+
 from .models import User, UserProfile
 
+class UserProfileAdminForm(forms.ModelForm):
+    """Accepts an uploaded image and stores it through ``UserProfile.set_avatar``."""
+
+    avatar_upload = forms.FileField(
+        required=False,
+        label="Upload avatar",
+        help_text="Any common image format; it is cropped and resized to 128*128 and 40*40 PNGs.",
+    )
+    clear_avatar = forms.BooleanField(required=False, label="Remove avatar")
+
+    class Meta:
+        model = UserProfile
+        fields = ("user", "gender_orientation")
+
+    def clean(self):
+        cleaned_data = super().clean()
+        upload = cleaned_data.get("avatar_upload")
+        if upload:
+            try:
+                self.instance.set_avatar(upload.read())
+            except ValidationError as exc:
+                self.add_error("avatar_upload", exc)
+        elif cleaned_data.get("clear_avatar"):
+            self.instance.set_avatar(None)
+        return cleaned_data
+
+
 @admin.register(UserProfile)
-class UserProfileAdmin(admin.ModelAdmin):
+class UserProfileAdmin(ReplicaChangelistMixin, admin.ModelAdmin):
     """
     Admin configuration for the UserProfile model.
     """
 
+    form = UserProfileAdminForm
+
     # Fields to display in the main list view
     list_display = (
         'user',
@@ -20,6 +54,7 @@ class UserProfileAdmin(admin.ModelAdmin):
         'gender_orientation',
         'get_avatar_preview_list'
     )
+    list_select_related = ('user',)
 
     # Enable search on these fields
     search_fields = ('user__username', 'user__email', 'user_uuid')
@@ -36,19 +71,25 @@ class UserProfileAdmin(admin.ModelAdmin):
             'fields': ('user', 'user_uuid')
         }),
         ('Profile Details', {
-            'fields': ('gender_orientation', 'user_profile_img', 'get_avatar_preview_detail')
+            'fields': ('gender_orientation', 'get_avatar_preview_detail', 'avatar_upload', 'clear_avatar')
         }),
     )
 
+    def get_queryset(self, request):
+        # Avatars are served by URL, so the blobs never need to be loaded here.
+        return super().get_queryset(request).without_avatar()
+
     def get_avatar_preview_list(self, obj):
         """
         Returns a small, circular <img> tag for the list_display.
         """
-        if obj.user_profile_img:
+        url = obj.get_avatar_url('thumb')
+        if url:
             # Display a small, rounded avatar in the list
-            return mark_safe(
-                f'<img src="data:image/png;base64,{obj.user_profile_img}" '
-                'style="width: 40px; height: 40px; border-radius: 50%; object-fit: cover;" />'
+            return format_html(
+                '<img src="{}" loading="lazy" '
+                'style="width: 40px; height: 40px; border-radius: 50%; object-fit: cover;" />',
+                url,
             )
         return "No Avatar"
 
@@ -58,11 +99,13 @@ class UserProfileAdmin(admin.ModelAdmin):
         """
         Returns a larger <img> tag for the readonly_fields in the detail view.
         """
-        if obj.user_profile_img:
+        url = obj.get_avatar_url('full')
+        if url:
             # Display the 128x128 avatar in the detail view
-            return mark_safe(
-                f'<img src="data:image/png;base64,{obj.user_profile_img}" '
-                'style="max-width: 128px; max-height: 128px; border: 1px solid #ddd; border-radius: 4px;" />'
+            return format_html(
+                '<img src="{}" '
+                'style="max-width: 128px; max-height: 128px; border: 1px solid #ddd; border-radius: 4px;" />',
+                url,
             )
         return "No avatar provided"
 
@@ -70,10 +113,11 @@ class UserProfileAdmin(admin.ModelAdmin):
 
 
 @admin.register(User)
-class UserAdmin(DjangoUserAdmin):
+class UserAdmin(ReplicaChangelistMixin, FullTextSearchAdminMixin, DjangoUserAdmin):
     list_display = ("email", "first_name", "last_name", "is_staff", "is_active")
     list_filter = ("is_staff", "is_superuser", "is_active")
     search_fields = ("email", "first_name", "last_name")
+    fulltext_lookups = {"pk": "user"}
     ordering = ("email",)
 
     fieldsets = (
@@ -1,21 +1,37 @@
 """API layer for the accounts app."""
 
-from .serializers import LoginSerializer, RegisterSerializer, UserSerializer
+from .base import AsyncAPIView
+from .serializers import (
+    LoginCredentialsSerializer,
+    RegisterSerializer,
+    UserProfileSerializer,
+    UserSerializer,
+)
 from .views import (
+    AvatarView,
+    LoginThrottleMetricsView,
     LoginView,
     LogoutView,
     ProfileView,
+    ProvisionJobView,
+    ProvisionUsersView,
     RefreshTokenView,
     RegisterView,
 )
 
 __all__ = [
-    "LoginSerializer",
+    "AsyncAPIView",
+    "LoginCredentialsSerializer",
     "RegisterSerializer",
+    "UserProfileSerializer",
     "UserSerializer",
+    "AvatarView",
+    "LoginThrottleMetricsView",
     "LoginView",
     "LogoutView",
     "ProfileView",
+    "ProvisionJobView",
+    "ProvisionUsersView",
     "RefreshTokenView",
     "RegisterView",
 ]
@@ -0,0 +1,85 @@
+"""Async base view for the accounts API."""
+
+from __future__ import annotations
+
+import json
+
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import (
+    APIException,
+    NotAuthenticated,
+    ParseError,
+)
+
+from ..auth.authentication import CookieJWTAuthentication
+from ..auth.hashing import PasswordHashingSaturated
+
+
+class AsyncAPIView(View):
+    """Minimal async counterpart of DRF's ``APIView``.
+
+    DRF's views are sync-only, so under ASGI every call is shipped to a
+    worker thread. This view keeps the parts of ``APIView`` the accounts API
+    relies on (JSON parsing, cookie JWT authentication, ``APIException``
+    rendering, CSRF exemption) while running natively on the event loop.
+    """
+
+    authentication_required = False
+    authenticator = CookieJWTAuthentication()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Authentication is cookie/header JWT only, same as the DRF views.
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request: HttpRequest, *args, **kwargs):
+        try:
+            request.data = self.parse_body(request)
+            await self.perform_authentication(request)
+            return await super().dispatch(request, *args, **kwargs)
+        except PasswordHashingSaturated:
+            return JsonResponse(
+                {"detail": "Server is busy, please retry."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": "1"},
+            )
+        except APIException as exc:
+            return self.handle_exception(exc)
+
+    def parse_body(self, request: HttpRequest) -> dict:
+        if request.method not in ("POST", "PUT", "PATCH"):
+            return {}
+        if request.content_type == "application/json":
+            if not request.body:
+                return {}
+            try:
+                data = json.loads(request.body)
+            except ValueError as exc:
+                raise ParseError(f"JSON parse error - {exc}") from exc
+            if not isinstance(data, dict):
+                raise ParseError("Expected a JSON object.")
+            return data
+        return request.POST.dict()
+
+    async def perform_authentication(self, request: HttpRequest) -> None:
+        auth_result = await self.authenticator.aauthenticate(request)
+        if auth_result is not None:
+            request.user, request.auth = auth_result
+        elif self.authentication_required:
+            raise NotAuthenticated()
+
+    def handle_exception(self, exc: APIException) -> JsonResponse:
+        headers = {}
+        if isinstance(exc, NotAuthenticated) or exc.status_code == status.HTTP_401_UNAUTHORIZED:
+            headers["WWW-Authenticate"] = 'Bearer realm="api"'
+        if getattr(exc, "wait", None):
+            headers["Retry-After"] = "%d" % exc.wait
+        if isinstance(exc.detail, (list, dict)):
+            data = exc.detail
+        else:
+            data = {"detail": exc.detail}
+        return JsonResponse(data, status=exc.status_code, headers=headers, safe=False)
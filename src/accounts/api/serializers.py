@@ -1,10 +1,8 @@
 """Serializers for the accounts API."""
 
-from django.contrib.auth import authenticate
-from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
-from ..models import User
+from ..models import User, UserProfile
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -19,6 +17,29 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ("id",)
 
 
+class UserProfileSerializer(serializers.ModelSerializer):
+    """Profile fields plus avatar URLs; the avatar blobs are never serialized."""
+
+    avatar_url = serializers.SerializerMethodField()
+    avatar_thumbnail_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UserProfile
+        fields = (
+            "user_uuid",
+            "gender_orientation",
+            "avatar_url",
+            "avatar_thumbnail_url",
+        )
+        read_only_fields = fields
+
+    def get_avatar_url(self, obj):
+        return obj.get_avatar_url("full")
+
+    def get_avatar_thumbnail_url(self, obj):
+        return obj.get_avatar_url("thumb")
+
+
 class RegisterSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, min_length=8)
 
@@ -40,22 +61,8 @@ class RegisterSerializer(serializers.ModelSerializer):
         return user
 
 
-class LoginSerializer(serializers.Serializer):
+class LoginCredentialsSerializer(serializers.Serializer):
+    """Validates the login payload shape without checking the password."""
+
     email = serializers.EmailField()
     password = serializers.CharField(write_only=True)
-
-    def validate(self, attrs):
-        email = attrs.get("email")
-        password = attrs.get("password")
-        if email and password:
-            user = authenticate(email=email, password=password)
-            if not user:
-                msg = _("Unable to log in with provided credentials.")
-                raise serializers.ValidationError(msg, code="authorization")
-        else:
-            msg = _("Must include \"email\" and \"password\".")
-            raise serializers.ValidationError(msg, code="authorization")
-
-        attrs["user"] = user
-        return attrs
-
@@ -3,9 +3,13 @@
 from django.urls import path
 
 from .views import (
+    AvatarView,
+    LoginThrottleMetricsView,
     LoginView,
     LogoutView,
     ProfileView,
+    ProvisionJobView,
+    ProvisionUsersView,
     RefreshTokenView,
     RegisterView,
 )
@@ -15,8 +19,12 @@ app_name = "accounts"
 urlpatterns = [
     path("register/", RegisterView.as_view(), name="register"),
     path("login/", LoginView.as_view(), name="login"),
+    path("login/metrics/", LoginThrottleMetricsView.as_view(), name="login-metrics"),
     path("refresh/", RefreshTokenView.as_view(), name="refresh"),
     path("logout/", LogoutView.as_view(), name="logout"),
     path("profile/", ProfileView.as_view(), name="profile"),
+    path("provision/", ProvisionUsersView.as_view(), name="provision"),
+    path("provision/<str:job_id>/", ProvisionJobView.as_view(), name="provision-job"),
+    path("avatars/<uuid:user_uuid>/<str:size>.png", AvatarView.as_view(), name="avatar"),
 ]
 
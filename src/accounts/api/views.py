@@ -1,21 +1,43 @@
 """API views for authentication flows."""
 
+import tempfile
+
+from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.views import View
+from django.utils.translation import gettext_lazy as _
 from rest_framework import permissions, status
-from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from ..auth.constants import REFRESH_COOKIE_NAME
 from ..auth.services import (
-    blacklist_refresh_token,
+    aauthenticate_credentials,
+    ablacklist_refresh_token,
+    agenerate_tokens,
     clear_jwt_cookies,
     generate_tokens,
     set_jwt_cookies,
 )
-from .serializers import LoginSerializer, RegisterSerializer, UserSerializer
+from ..auth.throttling import get_login_throttle
+from ..avatars import AVATAR_SIZES
+from ..models import UserProfile
+from ..provisioning import get_provisioning_jobs
+from .base import AsyncAPIView
+from .serializers import (
+    LoginCredentialsSerializer,
+    RegisterSerializer,
+    UserProfileSerializer,
+    UserSerializer,
+)
 
 
 User = get_user_model()
@@ -35,62 +57,174 @@ class RegisterView(APIView):
         return response
 
 
-class LoginView(APIView):
-    permission_classes = (permissions.AllowAny,)
+class ProvisionUsersView(APIView):
+    """Queue bulk user creation from an uploaded CSV or JSONL roster (staff only).
+
+    Hashing thousands of passwords takes far longer than a request may, so
+    the roster is processed as a background job; poll ``status_url`` for
+    progress and the final totals.
+    """
+
+    permission_classes = (permissions.IsAdminUser,)
+    parser_classes = (MultiPartParser,)
 
     def post(self, request):
-        serializer = LoginSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        user = serializer.validated_data["user"]
-        access_token, refresh_token = generate_tokens(user)
+        upload = request.FILES.get("roster")
+        if upload is None:
+            raise ValidationError({"roster": ["Upload a roster file."]})
+        fmt = request.data.get("format") or upload.name.rsplit(".", 1)[-1].lower()
+        if fmt not in ("csv", "jsonl"):
+            raise ValidationError({"format": ["Expected \"csv\" or \"jsonl\"."]})
+
+        with tempfile.NamedTemporaryFile(suffix=f".{fmt}", delete=False) as roster:
+            for chunk in upload.chunks():
+                roster.write(chunk)
+        job_id = get_provisioning_jobs().submit(roster.name, fmt)
+        return Response(
+            {
+                "job": job_id,
+                "status_url": reverse("accounts:provision-job", args=[job_id], request=request),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class ProvisionJobView(APIView):
+    """Status and running totals of a provisioning job (staff only)."""
+
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request, job_id):
+        job = get_provisioning_jobs().status(job_id)
+        if job is None:
+            raise Http404
+        return Response(job)
+
+
+class LoginThrottleMetricsView(APIView):
+    """This worker's login throttle counters (staff only)."""
+
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request):
+        return Response(get_login_throttle().snapshot())
+
 
-        response = Response(UserSerializer(user).data, status=status.HTTP_200_OK)
+class LoginView(AsyncAPIView):
+    """Log in with email and password; hashing runs on the bounded executor."""
+
+    async def post(self, request):
+        serializer = LoginCredentialsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        await get_login_throttle().acheck(request, serializer.validated_data["email"])
+        user = await aauthenticate_credentials(
+            serializer.validated_data["email"],
+            serializer.validated_data["password"],
+            request=request,
+        )
+        if user is None:
+            raise ValidationError(
+                {"non_field_errors": [_("Unable to log in with provided credentials.")]},
+                code="authorization",
+            )
+        access_token, refresh_token = await agenerate_tokens(user)
+
+        response = JsonResponse(UserSerializer(user).data, status=status.HTTP_200_OK)
         set_jwt_cookies(response, access_token, refresh_token)
         return response
 
 
-class RefreshTokenView(APIView):
-    permission_classes = (permissions.AllowAny,)
-
-    def post(self, request):
+class RefreshTokenView(AsyncAPIView):
+    async def post(self, request):
         raw_refresh = request.COOKIES.get(REFRESH_COOKIE_NAME)
         if not raw_refresh:
             raise AuthenticationFailed("Refresh token missing.")
 
         try:
-            refresh = RefreshToken(raw_refresh)
+            # Token verification consults the blacklist tables, so it goes
+            # through sync_to_async rather than running on the loop.
+            refresh = await sync_to_async(RefreshToken)(raw_refresh)
         except TokenError as exc:  # pragma: no cover - defensive branch
             raise AuthenticationFailed("Invalid refresh token.") from exc
 
         try:
-            user = User.objects.get(pk=refresh["user_id"])
+            user = await User.objects.aget(pk=refresh["user_id"])
         except User.DoesNotExist as exc:
             raise AuthenticationFailed("User not found.") from exc
 
-        blacklist_refresh_token(raw_refresh)
+        await ablacklist_refresh_token(raw_refresh)
 
-        new_access, new_refresh = generate_tokens(user)
-        response = Response({"detail": "Token refreshed."}, status=status.HTTP_200_OK)
+        new_access, new_refresh = await agenerate_tokens(user)
+        response = JsonResponse({"detail": "Token refreshed."}, status=status.HTTP_200_OK)
         set_jwt_cookies(response, new_access, new_refresh)
         return response
 
 
-class LogoutView(APIView):
-    permission_classes = (permissions.IsAuthenticated,)
+class LogoutView(AsyncAPIView):
+    authentication_required = True
 
-    def post(self, request):
+    async def post(self, request):
         raw_refresh = request.COOKIES.get(REFRESH_COOKIE_NAME)
-        blacklist_refresh_token(raw_refresh)
+        await ablacklist_refresh_token(raw_refresh)
 
-        response = Response({"detail": "Logged out."}, status=status.HTTP_200_OK)
+        response = JsonResponse({"detail": "Logged out."}, status=status.HTTP_200_OK)
         clear_jwt_cookies(response)
         return response
 
 
-class ProfileView(APIView):
-    permission_classes = (permissions.IsAuthenticated,)
+class ProfileView(AsyncAPIView):
+    authentication_required = True
 
-    def get(self, request):
+    async def get(self, request):
         data = UserSerializer(request.user).data
-        return Response(data, status=status.HTTP_200_OK)
+        profile = await UserProfile.objects.without_avatar().filter(user=request.user).afirst()
+        data["profile"] = UserProfileSerializer(profile).data if profile else None
+        return JsonResponse(data, status=status.HTTP_200_OK)
+
+
+class AvatarView(View):
+    """Serve a stored avatar rendition with validators and long cache lifetimes.
+
+    URLs produced by ``UserProfile.get_avatar_url`` carry a ``v`` content hash,
+    so a matching request can be cached as immutable; anything else is
+    revalidated cheaply through ETag / Last-Modified.
+    """
 
+    FIELDS = {"full": "avatar", "thumb": "avatar_thumbnail"}
+
+    async def get(self, request, user_uuid, size):
+        field = self.FIELDS.get(size)
+        if field is None or size not in AVATAR_SIZES:
+            raise Http404("Unknown avatar size.")
+
+        try:
+            meta = await UserProfile.objects.values("avatar_etag", "avatar_updated_at").aget(
+                user_uuid=user_uuid
+            )
+        except UserProfile.DoesNotExist as exc:
+            raise Http404("Profile not found.") from exc
+        if not meta["avatar_etag"]:
+            raise Http404("No avatar.")
+
+        etag = f'"{meta["avatar_etag"]}-{size}"'
+        # HTTP dates have whole-second precision; compare at the same precision.
+        last_modified = (
+            int(meta["avatar_updated_at"].timestamp()) if meta["avatar_updated_at"] else None
+        )
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is None:
+            data = await UserProfile.objects.filter(user_uuid=user_uuid).values_list(
+                field, flat=True
+            ).aget()
+            response = HttpResponse(bytes(data), content_type="image/png")
+        else:
+            response = not_modified
+
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        if request.GET.get("v") == meta["avatar_etag"][:16]:
+            patch_cache_control(response, public=True, max_age=31536000, immutable=True)
+        else:
+            patch_cache_control(response, public=True, max_age=300)
+        return response
@@ -8,8 +8,13 @@ from .constants import (
     REFRESH_COOKIE_NAME,
     REFRESH_COOKIE_PATH,
 )
+from .hashing import PasswordHashingExecutor, PasswordHashingSaturated, get_password_executor
 from .middleware import JWTCookieMiddleware
+from .throttling import LoginThrottle, SlidingWindowLimiter, get_login_throttle
 from .services import (
+    aauthenticate_credentials,
+    ablacklist_refresh_token,
+    agenerate_tokens,
     blacklist_refresh_token,
     clear_jwt_cookies,
     generate_tokens,
@@ -19,11 +24,20 @@ from .services import (
 __all__ = [
     "CookieJWTAuthentication",
     "JWTCookieMiddleware",
+    "LoginThrottle",
+    "SlidingWindowLimiter",
+    "get_login_throttle",
+    "PasswordHashingExecutor",
+    "PasswordHashingSaturated",
+    "get_password_executor",
     "ACCESS_COOKIE_NAME",
     "ACCESS_COOKIE_PATH",
     "COOKIE_SAMESITE",
     "REFRESH_COOKIE_NAME",
     "REFRESH_COOKIE_PATH",
+    "aauthenticate_credentials",
+    "ablacklist_refresh_token",
+    "agenerate_tokens",
     "blacklist_refresh_token",
     "clear_jwt_cookies",
     "generate_tokens",
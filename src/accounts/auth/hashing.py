@@ -0,0 +1,96 @@
+"""Bounded executor for CPU-heavy password hashing."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, TypeVar
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+
+T = TypeVar("T")
+
+
+class PasswordHashingSaturated(RuntimeError):
+    """Raised when the hashing queue is full and the work must be refused."""
+
+
+class PasswordHashingExecutor:
+    """Run password hashing on a small, dedicated thread pool.
+
+    Hashing is deliberately slow, so running it on the event loop (or on the
+    shared ``sync_to_async`` thread) would stall every other request. Work is
+    capped at ``max_workers`` concurrent hashes plus ``max_pending`` queued
+    ones; anything beyond that is refused instead of piling up.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hash",
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_pending:
+                raise PasswordHashingSaturated("Password hashing queue is full.")
+            self._in_flight += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, func, *args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+_executor: Optional[PasswordHashingExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_password_executor() -> PasswordHashingExecutor:
+    """Return the process-wide hashing executor, creating it on first use."""
+
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = PasswordHashingExecutor(
+                    max_workers=settings.PASSWORD_HASHING_WORKERS,
+                    max_pending=settings.PASSWORD_HASHING_MAX_PENDING,
+                )
+    return _executor
+
+
+def _verify(password: str, encoded: str) -> Tuple[bool, bool]:
+    """Return ``(is_valid, must_update)`` for a raw password and stored hash."""
+
+    needs_update = []
+    is_valid = check_password(password, encoded, setter=needs_update.append)
+    return is_valid, bool(needs_update)
+
+
+async def averify_password(password: str, encoded: str) -> Tuple[bool, bool]:
+    """Check a password against its hash on the hashing executor."""
+
+    return await get_password_executor().run(_verify, password, encoded)
+
+
+async def amake_password(password: Optional[str]) -> str:
+    """Hash a password on the hashing executor."""
+
+    return await get_password_executor().run(make_password, password)
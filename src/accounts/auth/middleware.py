@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from channels.auth import AuthMiddlewareStack
+from channels.middleware import BaseMiddleware
 from django.contrib.auth.models import AnonymousUser
 from django.utils.deprecation import MiddlewareMixin
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
 
 from .authentication import CookieJWTAuthentication
+from .constants import ACCESS_COOKIE_NAME
 
 
 class JWTCookieMiddleware(MiddlewareMixin):
@@ -30,3 +34,41 @@ class JWTCookieMiddleware(MiddlewareMixin):
         elif not getattr(request, "user", None):
             request.user = AnonymousUser()
 
+
+
+class JWTCookieWebSocketMiddleware(BaseMiddleware):
+    """Channels middleware that authenticates WebSocket handshakes from the JWT access cookie.
+
+    Sits inside :func:`JWTCookieAuthMiddlewareStack`, so a session login
+    still works; the cookie is only read when the session left the user
+    anonymous. An invalid or expired token leaves the user anonymous and the
+    consumer decides how to refuse the connection.
+    """
+
+    def __init__(self, inner):
+        super().__init__(inner)
+        self.authenticator = CookieJWTAuthentication()
+
+    async def __call__(self, scope, receive, send):
+        user = scope.get("user")
+        if user is None or not user.is_authenticated:
+            authenticated = await self._authenticate(scope)
+            if authenticated is not None:
+                scope = dict(scope, user=authenticated)
+        return await super().__call__(scope, receive, send)
+
+    async def _authenticate(self, scope):
+        raw_token = scope.get("cookies", {}).get(ACCESS_COOKIE_NAME)
+        if raw_token is None:
+            return None
+        try:
+            validated_token = self.authenticator.get_validated_token(raw_token)
+            return await self.authenticator.aget_user(validated_token)
+        except (AuthenticationFailed, InvalidToken):
+            return None
+
+
+def JWTCookieAuthMiddlewareStack(inner):
+    """Channels' ``AuthMiddlewareStack`` with JWT cookie authentication added."""
+
+    return AuthMiddlewareStack(JWTCookieWebSocketMiddleware(inner))
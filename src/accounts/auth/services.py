@@ -1,10 +1,12 @@
 """Service helpers for authentication flows."""
 
-from typing import Tuple
+from typing import Optional, Tuple
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.contrib.auth.signals import user_login_failed
+from django.http import HttpResponse
 from django.utils import timezone
-from rest_framework.response import Response
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 
@@ -16,6 +18,7 @@ from .constants import (
     REFRESH_COOKIE_NAME,
     REFRESH_COOKIE_PATH,
 )
+from .hashing import amake_password, averify_password
 
 
 SECURE_COOKIE = not settings.DEBUG
@@ -31,7 +34,7 @@ def generate_tokens(user: User) -> Tuple[str, str]:
     return str(access), str(refresh)
 
 
-def set_jwt_cookies(response: Response, access_token: str, refresh_token: str) -> None:
+def set_jwt_cookies(response: HttpResponse, access_token: str, refresh_token: str) -> None:
     """Attach JWT cookies to the response."""
 
     response.set_cookie(
@@ -54,7 +57,7 @@ def set_jwt_cookies(response: Response, access_token: str, refresh_token: str) -
     )
 
 
-def clear_jwt_cookies(response: Response) -> None:
+def clear_jwt_cookies(response: HttpResponse) -> None:
     """Remove JWT cookies by setting expired cookies."""
 
     expired = timezone.now()
@@ -90,3 +93,44 @@ def blacklist_refresh_token(refresh_token: str) -> None:
     except TokenError:
         return
 
+
+async def _login_failed(email: str, request) -> None:
+    # Same payload as ``authenticate()``, with the password masked as Django does.
+    await sync_to_async(user_login_failed.send)(
+        sender=__name__,
+        credentials={"email": email, "password": "********************"},
+        request=request,
+    )
+
+
+async def aauthenticate_credentials(email: str, password: str, request=None) -> Optional[User]:
+    """Async counterpart of ``authenticate()`` for email/password logins.
+
+    The user lookup uses the async ORM and the hash check runs on the
+    dedicated password executor, so the event loop never blocks on hashing.
+    Failures send ``user_login_failed`` like ``authenticate()`` does.
+    """
+
+    try:
+        user = await User.objects.aget(**{User.USERNAME_FIELD: email})
+    except User.DoesNotExist:
+        # Pay for one hash anyway so response timing does not leak whether
+        # the account exists (mirrors ModelBackend).
+        await amake_password(password)
+        await _login_failed(email, request)
+        return None
+
+    is_valid, must_update = await averify_password(password, user.password)
+    if not is_valid or not user.is_active:
+        await _login_failed(email, request)
+        return None
+
+    if must_update:
+        user.password = await amake_password(password)
+        await User.objects.filter(pk=user.pk).aupdate(password=user.password)
+
+    return user
+
+
+agenerate_tokens = sync_to_async(generate_tokens)
+ablacklist_refresh_token = sync_to_async(blacklist_refresh_token)
@@ -0,0 +1,184 @@
+"""Sliding-window login throttling that runs before any password hashing."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpRequest
+from rest_framework.exceptions import Throttled
+from rest_framework.throttling import BaseThrottle
+
+
+logger = logging.getLogger("accounts.throttle")
+
+_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """Parse a DRF-style rate string such as ``"10/min"`` into ``(limit, seconds)``."""
+
+    num, period = rate.split("/")
+    return int(num), _PERIODS[period[0]]
+
+
+class SlidingWindowLimiter:
+    """Approximate sliding-window counter keyed by an arbitrary identity.
+
+    Attempts are counted in fixed buckets stored in the shared cache so every
+    worker sees the same totals; the previous bucket is weighted by how much
+    of it still overlaps the window. Once an identity trips the limit it is
+    also remembered locally until the window clears, so a flood from one
+    source is rejected without another cache round-trip.
+    """
+
+    MAX_LOCAL_ENTRIES = 10_000
+
+    def __init__(
+        self,
+        scope: str,
+        rate: str,
+        cache_alias: str = "default",
+        key_prefix: str = "login-throttle",
+    ):
+        self.scope = scope
+        self.limit, self.window = parse_rate(rate)
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+        self._blocked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _keys(self, ident: str, now: float) -> Tuple[str, str, float]:
+        bucket = int(now // self.window)
+        elapsed = (now % self.window) / self.window
+        prefix = f"{self.key_prefix}:{self.scope}:{ident}"
+        return f"{prefix}:{bucket}", f"{prefix}:{bucket - 1}", elapsed
+
+    def _local_wait(self, ident: str, now: float) -> Optional[float]:
+        with self._lock:
+            until = self._blocked.get(ident)
+            if until is None:
+                return None
+            if until <= now:
+                del self._blocked[ident]
+                return None
+            return until - now
+
+    def _evaluate(
+        self, ident: str, now: float, elapsed: float, current: int, previous: int
+    ) -> Optional[float]:
+        estimated = previous * (1 - elapsed) + current
+        if estimated <= self.limit:
+            return None
+        wait = self.window * (1 - elapsed)
+        with self._lock:
+            if len(self._blocked) >= self.MAX_LOCAL_ENTRIES:
+                self._blocked = {key: until for key, until in self._blocked.items() if until > now}
+            self._blocked[ident] = now + wait
+        return wait
+
+    def _count(self, ident: str, now: float, amount: int) -> Optional[float]:
+        current_key, previous_key, elapsed = self._keys(ident, now)
+        cache = self.cache
+        cache.add(current_key, 0, timeout=self.window * 2)
+        try:
+            current = cache.incr(current_key, amount)
+        except ValueError:  # evicted between add and incr
+            cache.set(current_key, amount, timeout=self.window * 2)
+            current = amount
+        previous = cache.get(previous_key, 0)
+        return self._evaluate(ident, now, elapsed, current, previous)
+
+    def hit(self, ident: str, amount: int = 1) -> Optional[float]:
+        """Record ``amount`` units of use; return seconds to wait if over the limit, else ``None``."""
+
+        now = time.time()
+        wait = self._local_wait(ident, now)
+        if wait is not None:
+            return wait
+        return self._count(ident, now, amount)
+
+    async def ahit(self, ident: str, amount: int = 1) -> Optional[float]:
+        now = time.time()
+        wait = self._local_wait(ident, now)
+        if wait is not None:
+            return wait
+        # Django's ``aincr`` is a non-atomic get-then-set on every backend, so
+        # concurrent attempts would overwrite each other's count; the sync
+        # ``incr`` is atomic (INCRBY on Redis).
+        return await sync_to_async(self._count, thread_sensitive=False)(ident, now, amount)
+
+
+class LoginThrottle:
+    """Per-IP and per-email login limiter with in-process metrics."""
+
+    def __init__(self):
+        rates = settings.LOGIN_THROTTLE_RATES
+        self.limiters = {
+            scope: SlidingWindowLimiter(scope, rate) for scope, rate in rates.items()
+        }
+        self.metrics: Counter = Counter()
+        self._metrics_lock = threading.Lock()
+        self._ident = BaseThrottle()
+
+    def _identities(self, request: Optional[HttpRequest], email: str) -> Dict[str, str]:
+        identities = {}
+        if request is not None:
+            identities["ip"] = self._ident.get_ident(request)
+        identities["email"] = (email or "").strip().lower()
+        return {scope: ident for scope, ident in identities.items() if ident and scope in self.limiters}
+
+    def _record(self, scope: Optional[str], wait: Optional[float], ident: str = "") -> None:
+        with self._metrics_lock:
+            self.metrics["checked"] += 1
+            if wait is None:
+                self.metrics["allowed"] += 1
+            else:
+                self.metrics["throttled"] += 1
+                self.metrics[f"throttled.{scope}"] += 1
+        if wait is not None:
+            logger.warning("Login throttled by %s limit for %s (retry in %.0fs)", scope, ident, wait)
+
+    def check(self, request: Optional[HttpRequest], email: str) -> None:
+        """Raise ``Throttled`` if this login attempt exceeds any limit."""
+
+        for scope, ident in self._identities(request, email).items():
+            wait = self.limiters[scope].hit(ident)
+            if wait is not None:
+                self._record(scope, wait, ident)
+                raise Throttled(wait=wait)
+        self._record(None, None)
+
+    async def acheck(self, request: Optional[HttpRequest], email: str) -> None:
+        for scope, ident in self._identities(request, email).items():
+            wait = await self.limiters[scope].ahit(ident)
+            if wait is not None:
+                self._record(scope, wait, ident)
+                raise Throttled(wait=wait)
+        self._record(None, None)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._metrics_lock:
+            return dict(self.metrics)
+
+
+_login_throttle: Optional[LoginThrottle] = None
+
+
+def get_login_throttle() -> LoginThrottle:
+    """Return the process-wide login throttle."""
+
+    global _login_throttle
+    if _login_throttle is None:
+        _login_throttle = LoginThrottle()
+    return _login_throttle
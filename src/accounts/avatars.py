@@ -0,0 +1,58 @@
+"""Avatar image processing helpers."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from typing import Dict
+
+from django.core.exceptions import ValidationError
+from PIL import Image, UnidentifiedImageError
+
+
+# Pixel size of each stored rendition, keyed by the name used in URLs.
+AVATAR_SIZES = {
+    "full": 128,
+    "thumb": 40,
+}
+
+AVATAR_MAX_UPLOAD_BYTES = 2 * 1024 * 1024
+# Compressed images can decode to far more memory than their upload size.
+AVATAR_MAX_PIXELS = 5000 * 5000
+
+
+def render_avatar(data: bytes) -> Dict[str, bytes]:
+    """Return a PNG rendition of ``data`` for every entry in ``AVATAR_SIZES``."""
+
+    if len(data) > AVATAR_MAX_UPLOAD_BYTES:
+        raise ValidationError("Avatar images must be 2 MB or smaller.")
+
+    try:
+        image = Image.open(io.BytesIO(data))
+        if image.width * image.height > AVATAR_MAX_PIXELS:
+            raise ValidationError("Avatar images must be at most 5000×5000 pixels.")
+        image.load()
+    except Image.DecompressionBombError as exc:
+        raise ValidationError("Avatar images must be at most 5000×5000 pixels.") from exc
+    except (UnidentifiedImageError, OSError) as exc:
+        raise ValidationError("Upload a valid image file.") from exc
+
+    image = image.convert("RGBA")
+    # Centre-crop to a square before scaling so avatars are never stretched.
+    side = min(image.size)
+    left = (image.width - side) // 2
+    top = (image.height - side) // 2
+    image = image.crop((left, top, left + side, top + side))
+
+    renditions = {}
+    for name, size in AVATAR_SIZES.items():
+        buffer = io.BytesIO()
+        image.resize((size, size), Image.LANCZOS).save(buffer, format="PNG", optimize=True)
+        renditions[name] = buffer.getvalue()
+    return renditions
+
+
+def avatar_etag(data: bytes) -> str:
+    """Content hash used for the avatar ETag and cache-busting URLs."""
+
+    return hashlib.sha256(data).hexdigest()
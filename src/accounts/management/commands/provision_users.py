@@ -0,0 +1,68 @@
+"""Provision users in bulk from a CSV or JSONL roster."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.provisioning import UserProvisioner, iter_roster
+
+
+class Command(BaseCommand):
+    help = (
+        "Create users (and their profiles) from a roster with columns "
+        "email, first_name, last_name and optional password."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("roster", help="Path to the roster file, or '-' for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=("csv", "jsonl"),
+            help="Roster format; inferred from the file extension when omitted.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Password hashing processes (defaults to the CPU count; 0 hashes in this process).",
+        )
+
+    def handle(self, *args, **options):
+        path = options["roster"]
+        fmt = options["format"] or Path(path).suffix.lstrip(".").lower()
+        if fmt not in ("csv", "jsonl"):
+            raise CommandError("Cannot infer the roster format; pass --format csv|jsonl.")
+
+        provisioner = UserProvisioner(
+            batch_size=options["batch_size"],
+            workers=options["workers"],
+            on_progress=self._report,
+        )
+        if path == "-":
+            stats = provisioner.run(iter_roster(sys.stdin, fmt))
+        else:
+            try:
+                with open(path, newline="", encoding="utf-8") as stream:
+                    stats = provisioner.run(iter_roster(stream, fmt))
+            except OSError as exc:
+                raise CommandError(str(exc)) from exc
+
+        for error in stats.errors:
+            self.stderr.write(error)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {stats.created} users, {stats.existing} already existed, "
+                f"{stats.invalid} invalid rows in {stats.elapsed:.1f}s "
+                f"({stats.users_per_second:.0f} users/s)."
+            )
+        )
+
+    def _report(self, stats):
+        self.stdout.write(
+            f"  processed {stats.processed} rows, created {stats.created} "
+            f"({stats.users_per_second:.0f} users/s)"
+        )
@@ -0,0 +1,209 @@
+# Generated by Django 4.2.11 on 2026-10-18 22:07
+
+import accounts.models.user
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="User",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("password", models.CharField(max_length=128, verbose_name="password")),
+                (
+                    "last_login",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="last login"
+                    ),
+                ),
+                (
+                    "is_superuser",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Designates that this user has all permissions without explicitly assigning them.",
+                        verbose_name="superuser status",
+                    ),
+                ),
+                (
+                    "first_name",
+                    models.CharField(
+                        blank=True, max_length=150, verbose_name="first name"
+                    ),
+                ),
+                (
+                    "last_name",
+                    models.CharField(
+                        blank=True, max_length=150, verbose_name="last name"
+                    ),
+                ),
+                (
+                    "is_staff",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Designates whether the user can log into this admin site.",
+                        verbose_name="staff status",
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(
+                        default=True,
+                        help_text="Designates whether this user should be treated as active. Unselect this instead of deleting accounts.",
+                        verbose_name="active",
+                    ),
+                ),
+                (
+                    "date_joined",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="date joined"
+                    ),
+                ),
+                (
+                    "email",
+                    models.EmailField(
+                        max_length=254, unique=True, verbose_name="email address"
+                    ),
+                ),
+                (
+                    "groups",
+                    models.ManyToManyField(
+                        blank=True,
+                        help_text="The groups this user belongs to. A user will get all permissions granted to each of their groups.",
+                        related_name="user_set",
+                        related_query_name="user",
+                        to="auth.group",
+                        verbose_name="groups",
+                    ),
+                ),
+                (
+                    "user_permissions",
+                    models.ManyToManyField(
+                        blank=True,
+                        help_text="Specific permissions for this user.",
+                        related_name="user_set",
+                        related_query_name="user",
+                        to="auth.permission",
+                        verbose_name="user permissions",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "User",
+                "verbose_name_plural": "Users",
+            },
+            managers=[
+                ("objects", accounts.models.user.UserManager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="UserProfile",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "user_uuid",
+                    models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                (
+                    "gender_orientation",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("male", "Male"),
+                            ("female", "Female"),
+                            ("transgender_male", "Transgender Male"),
+                            ("transgender_female", "Transgender Female"),
+                            ("trans_masculine", "Transmasculine"),
+                            ("trans_feminine", "Transfeminine"),
+                            ("non_binary", "Non-binary"),
+                            ("genderqueer", "Genderqueer"),
+                            ("genderfluid", "Genderfluid"),
+                            ("agender", "Agender"),
+                            ("bigender", "Bigender"),
+                            ("pangender", "Pangender"),
+                            ("androgyne", "Androgyne"),
+                            ("neutrois", "Neutrois"),
+                            ("demiboy", "Demiboy"),
+                            ("demigirl", "Demigirl"),
+                            ("polygender", "Polygender"),
+                            ("third_gender", "Third Gender"),
+                            ("two_spirit", "Two-Spirit (Indigenous)"),
+                            ("genderflux", "Genderflux"),
+                            ("genderfae", "Genderfae"),
+                            ("genderfluid_flux", "Genderfluid Flux"),
+                            ("gender_apath", "Apathgender"),
+                            ("maverique", "Maverique"),
+                            ("intergender", "Intergender"),
+                            ("intersex", "Intersex"),
+                            ("hijra", "Hijra (South Asian)"),
+                            ("fa_afafine", "Fa'afafine (Samoa)"),
+                            ("fa_tama", "Fa’atama (Samoa)"),
+                            ("bakla", "Bakla (Philippines)"),
+                            ("kathoey", "Kathoey (Thailand)"),
+                            ("waria", "Waria (Indonesia)"),
+                            ("muxhe", "Muxhe (Zapotec, Mexico)"),
+                            ("sworn_virgin", "Sworn Virgin (Balkan)"),
+                            ("butch", "Butch"),
+                            ("femme", "Femme"),
+                            ("androgynous", "Androgynous"),
+                            ("masculine_presenting", "Masculine-presenting"),
+                            ("feminine_presenting", "Feminine-presenting"),
+                            ("questioning", "Questioning"),
+                            ("other", "Other"),
+                            ("prefer_not_to_say", "Prefer not to say"),
+                        ],
+                        max_length=100,
+                        null=True,
+                    ),
+                ),
+                (
+                    "user_profile_img",
+                    models.TextField(
+                        blank=True,
+                        help_text="Base64 encoded PNG of the user's 128*128 avatar. No data-URI prefix.",
+                        null=True,
+                        verbose_name="avatar (Base64)",
+                    ),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="profile",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "User Profile",
+                "verbose_name_plural": "User Profiles",
+            },
+        ),
+    ]
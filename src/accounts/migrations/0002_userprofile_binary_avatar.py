@@ -0,0 +1,107 @@
+# Generated by Django 4.2.11 on 2026-10-18 22:08
+
+import base64
+import binascii
+import hashlib
+import io
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+# accounts.avatars.AVATAR_MAX_PIXELS, frozen here like the rest of the migration.
+MAX_PIXELS = 5000 * 5000
+
+
+def _render(data, size):
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    if image.width * image.height > MAX_PIXELS:
+        raise ValueError("Avatar is too large.")
+    image = image.convert("RGBA")
+    side = min(image.size)
+    left = (image.width - side) // 2
+    top = (image.height - side) // 2
+    image = image.crop((left, top, left + side, top + side))
+    buffer = io.BytesIO()
+    image.resize((size, size), Image.LANCZOS).save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def convert_base64_avatars(apps, schema_editor):
+    from PIL import Image
+
+    UserProfile = apps.get_model("accounts", "UserProfile")
+    now = timezone.now()
+    profiles = (
+        UserProfile.objects.exclude(user_profile_img__isnull=True)
+        .exclude(user_profile_img="")
+        .only("pk", "user_profile_img")
+    )
+    for profile in profiles.iterator(chunk_size=200):
+        try:
+            data = base64.b64decode(profile.user_profile_img, validate=False)
+            full = _render(data, 128)
+            thumbnail = _render(data, 40)
+        except (binascii.Error, OSError, ValueError, Image.DecompressionBombError):
+            # Unreadable or oversized legacy data: drop it rather than fail the migration.
+            continue
+        UserProfile.objects.filter(pk=profile.pk).update(
+            avatar=full,
+            avatar_thumbnail=thumbnail,
+            avatar_etag=hashlib.sha256(full).hexdigest(),
+            avatar_updated_at=now,
+        )
+
+
+def restore_base64_avatars(apps, schema_editor):
+    UserProfile = apps.get_model("accounts", "UserProfile")
+    profiles = UserProfile.objects.exclude(avatar__isnull=True).only("pk", "avatar")
+    for profile in profiles.iterator(chunk_size=200):
+        UserProfile.objects.filter(pk=profile.pk).update(
+            user_profile_img=base64.b64encode(bytes(profile.avatar)).decode("ascii"),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userprofile",
+            name="avatar",
+            field=models.BinaryField(
+                blank=True,
+                help_text="PNG bytes of the user's 128*128 avatar.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="userprofile",
+            name="avatar_etag",
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="userprofile",
+            name="avatar_thumbnail",
+            field=models.BinaryField(
+                blank=True,
+                help_text="PNG bytes of the 40*40 avatar used in lists.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="userprofile",
+            name="avatar_updated_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(convert_base64_avatars, restore_base64_avatars),
+        migrations.RemoveField(
+            model_name="userprofile",
+            name="user_profile_img",
+        ),
+    ]
@@ -1,6 +1,6 @@
 """Accounts app model exports."""
 
-from .user import User, UserManager, UserProfile
+from .user import User, UserManager, UserProfile, UserProfileQuerySet
 
-__all__ = ["User", "UserManager", "UserProfile"]
+__all__ = ["User", "UserManager", "UserProfile", "UserProfileQuerySet"]
 
@@ -6,6 +6,10 @@ import uuid
 
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
+from django.urls import reverse
+from django.utils import timezone
+
+from ..avatars import avatar_etag, render_avatar
 
 
 class UserManager(BaseUserManager):
@@ -55,6 +59,15 @@ class User(AbstractUser):
         verbose_name_plural = "Users"
 
 
+class UserProfileQuerySet(models.QuerySet):
+    AVATAR_FIELDS = ("avatar", "avatar_thumbnail")
+
+    def without_avatar(self):
+        """Skip the avatar blobs; list views and serializers never need them."""
+
+        return self.defer(*self.AVATAR_FIELDS)
+
+
 class UserProfile(models.Model):
     """Stores additional profile information for users."""
 
@@ -115,14 +128,20 @@ class UserProfile(models.Model):
         null=True,
         blank=True,
     )
-    user_profile_img = models.TextField(
+    avatar = models.BinaryField(
+        null=True,
+        blank=True,
+        help_text="PNG bytes of the user's 128*128 avatar.",
+    )
+    avatar_thumbnail = models.BinaryField(
         null=True,
         blank=True,
-        help_text=(
-            "Base64 encoded PNG of the user's 128*128 avatar. No data-URI prefix."
-        ),
-        verbose_name="avatar (Base64)",
+        help_text="PNG bytes of the 40*40 avatar used in lists.",
     )
+    avatar_etag = models.CharField(max_length=64, blank=True, editable=False)
+    avatar_updated_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    objects = UserProfileQuerySet.as_manager()
 
     class Meta:
         verbose_name = "User Profile"
@@ -131,6 +150,33 @@ class UserProfile(models.Model):
     def __str__(self) -> str:
         return f"Profile of {self.user.email}"
 
+    @property
+    def has_avatar(self) -> bool:
+        return bool(self.avatar_etag)
+
+    def set_avatar(self, data: bytes | None) -> None:
+        """Store (or clear) the avatar and its precomputed renditions.
+
+        Raises ``ValidationError`` if ``data`` is not a readable image.
+        """
+
+        if not data:
+            self.avatar = None
+            self.avatar_thumbnail = None
+            self.avatar_etag = ""
+        else:
+            renditions = render_avatar(data)
+            self.avatar = renditions["full"]
+            self.avatar_thumbnail = renditions["thumb"]
+            self.avatar_etag = avatar_etag(renditions["full"])
+        self.avatar_updated_at = timezone.now()
+
+    def get_avatar_url(self, size: str = "full") -> str | None:
+        if not self.has_avatar:
+            return None
+        url = reverse("accounts:avatar", kwargs={"user_uuid": self.user_uuid, "size": size})
+        return f"{url}?v={self.avatar_etag[:16]}"
+
 
-__all__ = ["User", "UserManager", "UserProfile"]
+__all__ = ["User", "UserManager", "UserProfile", "UserProfileQuerySet"]
 
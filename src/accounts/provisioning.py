@@ -0,0 +1,303 @@
+"""Bulk user provisioning from CSV or JSONL rosters."""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from typing import Callable, Dict, IO, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import close_old_connections, transaction
+
+from .models import User, UserProfile
+from .workers import setup_django
+
+
+logger = logging.getLogger(__name__)
+
+ROSTER_FIELDS = ("email", "first_name", "last_name", "password")
+
+
+class RosterError(NamedTuple):
+    """A roster line that could not be parsed into a row."""
+
+    line: int
+    message: str
+
+
+@dataclass
+class ProvisionStats:
+    """Running totals for a provisioning run."""
+
+    processed: int = 0
+    created: int = 0
+    existing: int = 0
+    invalid: int = 0
+    errors: List[str] = field(default_factory=list)
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def users_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.created / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict:
+        data = asdict(self)
+        data.pop("started_at")
+        data["elapsed_seconds"] = round(self.elapsed, 3)
+        data["users_per_second"] = round(self.users_per_second, 1)
+        return data
+
+
+def iter_roster(stream: IO[str], fmt: str) -> Iterator[Union[Dict[str, str], RosterError]]:
+    """Yield roster rows one at a time from a text stream.
+
+    Malformed JSONL lines are yielded as :class:`RosterError` so the caller
+    can report them and carry on, as it does for rows with a bad email.
+    """
+
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            yield {key: (row.get(key) or "").strip() for key in ROSTER_FIELDS}
+    elif fmt == "jsonl":
+        for number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield RosterError(number, f"invalid JSON ({exc.msg})")
+                continue
+            if not isinstance(row, dict):
+                yield RosterError(number, "expected a JSON object")
+                continue
+            yield {key: str(row.get(key) or "").strip() for key in ROSTER_FIELDS}
+    else:
+        raise ValueError(f"Unsupported roster format: {fmt!r}")
+
+
+def bulk_create_users(users: List[User]) -> Dict[str, int]:
+    """Insert unsaved users plus their profiles; return ``{email: id}`` of new rows.
+
+    Emails that already exist (including ones inserted concurrently) are
+    skipped rather than raising.
+    """
+
+    if not users:
+        return {}
+    with transaction.atomic():
+        User.objects.bulk_create(users, ignore_conflicts=True)
+        # ignore_conflicts leaves PKs unset, so read them back by email.
+        created_ids = dict(
+            User.objects.filter(email__in=[user.email for user in users])
+            .exclude(profile__isnull=False)
+            .values_list("email", "id")
+        )
+        UserProfile.objects.bulk_create(
+            [UserProfile(user_id=user_id) for user_id in created_ids.values()],
+            ignore_conflicts=True,
+        )
+    return created_ids
+
+
+def _batched(rows: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class UserProvisioner:
+    """Create users and profiles in batches, hashing passwords in a process pool.
+
+    Rows whose email already exists are counted as ``existing`` and left
+    untouched; the inserts use ``ignore_conflicts`` so a concurrent signup
+    for the same address cannot abort the batch. Passwords that fail
+    ``AUTH_PASSWORD_VALIDATORS`` mark the row invalid. ``workers=0`` hashes
+    in the calling thread instead of starting a pool; ``mp_context`` picks
+    how pool workers are started.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        workers: Optional[int] = None,
+        on_progress: Optional[Callable[[ProvisionStats], None]] = None,
+        mp_context=None,
+    ):
+        self.batch_size = batch_size
+        self.workers = workers
+        self.on_progress = on_progress
+        self.mp_context = mp_context
+        self.stats = ProvisionStats()
+
+    def run(self, rows: Iterable) -> ProvisionStats:
+        self.stats = ProvisionStats()
+        if self.workers == 0:
+            self._run(rows, None)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=self.mp_context, initializer=setup_django
+            ) as pool:
+                self._run(rows, pool)
+        return self.stats
+
+    def _run(self, rows: Iterable, pool: Optional[ProcessPoolExecutor]) -> None:
+        for batch in _batched(rows, self.batch_size):
+            self._process_batch(batch, pool)
+            if self.on_progress is not None:
+                self.on_progress(self.stats)
+
+    def _clean(self, batch: List) -> Dict[str, Dict[str, str]]:
+        cleaned: Dict[str, Dict[str, str]] = {}
+        for row in batch:
+            self.stats.processed += 1
+            if isinstance(row, RosterError):
+                self.stats.invalid += 1
+                self.stats.errors.append(f"Invalid line {row.line}: {row.message}")
+                continue
+            email = User.objects.normalize_email(row.get("email", ""))
+            try:
+                validate_email(email)
+            except ValidationError:
+                self.stats.invalid += 1
+                self.stats.errors.append(f"Invalid email on row {self.stats.processed}: {email!r}")
+                continue
+            if email in cleaned:
+                self.stats.existing += 1
+                continue
+            if row.get("password"):
+                candidate = User(
+                    email=email,
+                    first_name=row.get("first_name", ""),
+                    last_name=row.get("last_name", ""),
+                )
+                try:
+                    validate_password(row["password"], candidate)
+                except ValidationError as exc:
+                    self.stats.invalid += 1
+                    self.stats.errors.append(
+                        f"Rejected password on row {self.stats.processed}: {' '.join(exc.messages)}"
+                    )
+                    continue
+            cleaned[email] = row
+        return cleaned
+
+    def _process_batch(
+        self, batch: List, pool: Optional[ProcessPoolExecutor]
+    ) -> None:
+        rows = self._clean(batch)
+        existing = set(User.objects.filter(email__in=rows).values_list("email", flat=True))
+        self.stats.existing += len(existing)
+        pending = [(email, row) for email, row in rows.items() if email not in existing]
+        if not pending:
+            return
+
+        # Hash real passwords in parallel; blank ones become unusable without hashing.
+        to_hash = [row["password"] for _, row in pending if row.get("password")]
+        if pool is None:
+            hashed = map(make_password, to_hash)
+        else:
+            chunksize = max(1, len(to_hash) // ((self.workers or 4) * 4))
+            hashed = iter(pool.map(make_password, to_hash, chunksize=chunksize))
+
+        users = [
+            User(
+                email=email,
+                first_name=row.get("first_name", ""),
+                last_name=row.get("last_name", ""),
+                password=next(hashed) if row.get("password") else make_password(None),
+            )
+            for email, row in pending
+        ]
+
+        created_ids = bulk_create_users(users)
+        self.stats.created += len(created_ids)
+        self.stats.existing += len(pending) - len(created_ids)
+
+
+# -- background jobs -----------------------------------------------------------
+
+JOB_TIMEOUT = 24 * 60 * 60
+
+
+def _job_key(job_id: str) -> str:
+    return f"provision-job:{job_id}"
+
+
+class ProvisioningJobs:
+    """Run uploaded rosters off the request thread, one at a time per process.
+
+    Each job uses the same pooled :class:`UserProvisioner` as the
+    ``provision_users`` command; hash workers are spawned rather than forked
+    since the web process is multi-threaded. Status and running totals are
+    kept in the shared cache, so any worker can answer a status request.
+    """
+
+    def __init__(self):
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="provision-users")
+
+    def submit(self, path: str, fmt: str) -> str:
+        """Queue the roster at ``path`` (deleted once processed); return the job id."""
+
+        job_id = uuid.uuid4().hex
+        cache.set(_job_key(job_id), {"status": "queued"}, JOB_TIMEOUT)
+        self._pool.submit(self._run, job_id, path, fmt)
+        return job_id
+
+    def status(self, job_id: str) -> Optional[Dict]:
+        return cache.get(_job_key(job_id))
+
+    def _run(self, job_id: str, path: str, fmt: str) -> None:
+        key = _job_key(job_id)
+
+        def report(stats: ProvisionStats) -> None:
+            cache.set(key, {"status": "running", **stats.as_dict()}, JOB_TIMEOUT)
+
+        close_old_connections()
+        try:
+            provisioner = UserProvisioner(
+                on_progress=report, mp_context=multiprocessing.get_context("spawn")
+            )
+            with open(path, newline="", encoding="utf-8") as stream:
+                stats = provisioner.run(iter_roster(stream, fmt))
+        except Exception as exc:
+            logger.exception("Provisioning job %s failed", job_id)
+            cache.set(key, {"status": "failed", "error": str(exc)}, JOB_TIMEOUT)
+        else:
+            cache.set(key, {"status": "finished", **stats.as_dict()}, JOB_TIMEOUT)
+        finally:
+            os.unlink(path)
+            close_old_connections()
+
+
+_jobs: Optional[ProvisioningJobs] = None
+_jobs_lock = threading.Lock()
+
+
+def get_provisioning_jobs() -> ProvisioningJobs:
+    """Return the process-wide provisioning job runner, creating it on first use."""
+
+    global _jobs
+    if _jobs is None:
+        with _jobs_lock:
+            if _jobs is None:
+                _jobs = ProvisioningJobs()
+    return _jobs
@@ -0,0 +1,30 @@
+import io
+
+from django.test import TestCase
+
+from accounts.models import User
+from accounts.provisioning import RosterError, UserProvisioner, iter_roster
+
+
+class IterRosterTests(TestCase):
+    def test_malformed_jsonl_lines_are_reported_per_line(self):
+        stream = io.StringIO(
+            '{"email": "ada@example.com"}\n'
+            "{not json\n"
+            "\n"
+            '["a", "list"]\n'
+            '{"email": "grace@example.com"}\n'
+        )
+        rows = list(iter_roster(stream, "jsonl"))
+        self.assertEqual(rows[0]["email"], "ada@example.com")
+        self.assertIsInstance(rows[1], RosterError)
+        self.assertEqual(rows[1].line, 2)
+        self.assertEqual(rows[2], RosterError(4, "expected a JSON object"))
+        self.assertEqual(rows[3]["email"], "grace@example.com")
+
+    def test_provisioner_counts_bad_lines_as_invalid(self):
+        stream = io.StringIO('{"email": "ada@example.com"}\n42\n{oops\n')
+        stats = UserProvisioner(workers=0).run(iter_roster(stream, "jsonl"))
+        self.assertEqual((stats.created, stats.invalid), (1, 2))
+        self.assertEqual(stats.errors[0], "Invalid line 2: expected a JSON object")
+        self.assertTrue(User.objects.filter(email="ada@example.com").exists())
@@ -0,0 +1,44 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from accounts.auth.throttling import SlidingWindowLimiter
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "throttling-tests",
+        }
+    }
+)
+class SlidingWindowLimiterTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_sync_hits_beyond_limit_are_blocked(self):
+        limiter = SlidingWindowLimiter("ip", "5/min")
+        results = [limiter.hit("10.0.0.1") for _ in range(8)]
+        self.assertEqual(results[:5], [None] * 5)
+        self.assertTrue(all(wait is not None for wait in results[5:]))
+
+    def test_concurrent_sync_hits_count_every_attempt(self):
+        limiter = SlidingWindowLimiter("ip", "5/min")
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(lambda _: limiter.hit("10.0.0.2"), range(100)))
+        self.assertEqual(sum(wait is None for wait in results), 5)
+
+    async def test_concurrent_async_hits_count_every_attempt(self):
+        limiter = SlidingWindowLimiter("ip", "5/min")
+        results = await asyncio.gather(*(limiter.ahit("10.0.0.3") for _ in range(100)))
+        self.assertEqual(sum(wait is None for wait in results), 5)
+
+    async def test_async_and_sync_share_counters(self):
+        limiter = SlidingWindowLimiter("email", "3/min")
+        for _ in range(3):
+            self.assertIsNone(await limiter.ahit("a@example.com"))
+        other_worker = SlidingWindowLimiter("email", "3/min")
+        self.assertIsNotNone(other_worker.hit("a@example.com"))
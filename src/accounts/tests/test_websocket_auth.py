@@ -0,0 +1,38 @@
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.auth.constants import ACCESS_COOKIE_NAME
+from accounts.auth.middleware import JWTCookieWebSocketMiddleware
+from accounts.models import User
+
+
+class JWTCookieWebSocketMiddlewareTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="ada@example.com", password="x")
+        self.scopes = []
+
+        async def inner(scope, receive, send):
+            self.scopes.append(scope)
+
+        self.middleware = JWTCookieWebSocketMiddleware(inner)
+
+    async def _user(self, cookies, user=None):
+        scope = {"type": "websocket", "cookies": cookies, "user": user or AnonymousUser()}
+        await self.middleware(scope, None, None)
+        return self.scopes[-1]["user"]
+
+    async def test_access_cookie_authenticates_the_socket(self):
+        token = str(AccessToken.for_user(self.user))
+        user = await self._user({ACCESS_COOKIE_NAME: token})
+        self.assertEqual(user.pk, self.user.pk)
+
+    async def test_invalid_or_missing_cookie_stays_anonymous(self):
+        self.assertFalse((await self._user({ACCESS_COOKIE_NAME: "not-a-token"})).is_authenticated)
+        self.assertFalse((await self._user({})).is_authenticated)
+
+    async def test_session_user_is_kept(self):
+        other = await User.objects.acreate(email="grace@example.com")
+        token = str(AccessToken.for_user(self.user))
+        user = await self._user({ACCESS_COOKIE_NAME: token}, user=other)
+        self.assertEqual(user.pk, other.pk)
@@ -0,0 +1,12 @@
+"""Process-pool initializers; must stay importable before the app registry is ready."""
+
+
+def setup_django() -> None:
+    # Workers started with "spawn" do not inherit the configured app registry,
+    # and unpickling the initializer imports this module first, so it must not
+    # import models at module level.
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
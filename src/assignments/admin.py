@@ -2,18 +2,24 @@
 
 from django.contrib import admin
 
+from core.admin import ReplicaChangelistMixin
+from search.admin import FullTextSearchAdminMixin
+
 from .models import Assignment, AssignmentExtension, AssignmentQuestion
 
 
 @admin.register(Assignment)
-class AssignmentAdmin(admin.ModelAdmin):
+class AssignmentAdmin(ReplicaChangelistMixin, FullTextSearchAdminMixin, admin.ModelAdmin):
     list_display = ("title", "course", "publish_at", "due_at", "points")
     list_filter = ("course", "publish_at", "due_at")
+    list_select_related = ("course",)
     search_fields = ("title", "course__title")
+    fulltext_lookups = {"pk": "assignment", "course_id": "course"}
+    readonly_fields = ("instructions_html",)
 
 
 @admin.register(AssignmentQuestion)
-class AssignmentQuestionAdmin(admin.ModelAdmin):
+class AssignmentQuestionAdmin(ReplicaChangelistMixin, admin.ModelAdmin):
     list_display = ("assignment", "order_index", "type", "weight")
     list_filter = ("type", "assignment__course")
     search_fields = ("assignment__title", "title")
@@ -21,7 +27,7 @@ class AssignmentQuestionAdmin(admin.ModelAdmin):
 
 
 @admin.register(AssignmentExtension)
-class AssignmentExtensionAdmin(admin.ModelAdmin):
+class AssignmentExtensionAdmin(ReplicaChangelistMixin, admin.ModelAdmin):
     list_display = ("assignment", "user", "due_at", "created_at")
     list_filter = ("assignment__course",)
     search_fields = ("assignment__title", "user__email")
@@ -6,3 +6,6 @@ class AssignmentsConfig(AppConfig):
     name = "assignments"
     verbose_name = "Assignments"
 
+
+    def ready(self):
+        from . import signals  # noqa: F401
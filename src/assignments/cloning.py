@@ -0,0 +1,132 @@
+"""Bulk copying of assignments and their question links between courses."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Mapping, Optional
+
+from django.db import transaction
+
+from core.caching import course_tags, invalidate_tags
+from courses import feed
+from courses.stats import reconcile_course_stats
+from search.indexing import INDEXED_MODELS, index_objects
+
+from .deadlines import invalidate_course_deadlines
+from .gradebook import invalidate_gradebook
+from .models import Assignment, AssignmentQuestion
+
+
+@dataclass
+class CloneReport:
+    assignments: int = 0
+    questions: int = 0
+    offset: Optional[timedelta] = None
+
+    def as_dict(self) -> Dict:
+        return {
+            "assignments": self.assignments,
+            "questions": self.questions,
+            "offset_days": self.offset.days if self.offset else 0,
+        }
+
+
+def course_offset(source, target) -> Optional[timedelta]:
+    """Shift between two offerings, from their start dates when both are set."""
+
+    if source.start_date and target.start_date:
+        return target.start_date - source.start_date
+    return None
+
+
+def _shift(value: Optional[datetime], offset: Optional[timedelta]) -> Optional[datetime]:
+    if value is None or offset is None:
+        return value
+    return value + offset
+
+
+def clone_assignments(
+    source,
+    target,
+    offset: Optional[timedelta] = None,
+    assignment_ids: Optional[Iterable[int]] = None,
+    free_response_map: Optional[Mapping[int, int]] = None,
+    multiple_choice_map: Optional[Mapping[int, int]] = None,
+    batch_size: int = 500,
+) -> CloneReport:
+    """Copy ``source``'s assignments (or the given subset) into ``target``.
+
+    Everything happens in one transaction with one ``bulk_create`` per batch
+    for assignments and for question links. Question links are re-pointed at
+    the new assignments; bank questions are kept unless the ``*_map``
+    arguments remap them (e.g. after copying the question bank too).
+    ``publish_at`` and ``due_at`` move by ``offset``.
+    """
+
+    free_response_map = free_response_map or {}
+    multiple_choice_map = multiple_choice_map or {}
+    report = CloneReport(offset=offset)
+
+    sources = Assignment.objects.filter(course=source).order_by("pk")
+    if assignment_ids is not None:
+        sources = sources.filter(pk__in=list(assignment_ids))
+    sources = list(sources)
+    if not sources:
+        return report
+
+    with transaction.atomic():
+        # bulk_create bypasses Assignment.save(), so the already rendered
+        # instructions_html is copied rather than rendered again.
+        copies = Assignment.objects.bulk_create(
+            [
+                Assignment(
+                    course=target,
+                    title=assignment.title,
+                    instructions_md=assignment.instructions_md,
+                    instructions_html=assignment.instructions_html,
+                    points=assignment.points,
+                    publish_at=_shift(assignment.publish_at, offset),
+                    due_at=_shift(assignment.due_at, offset),
+                )
+                for assignment in sources
+            ],
+            batch_size=batch_size,
+        )
+        new_ids = {original.pk: copy.pk for original, copy in zip(sources, copies)}
+
+        questions = AssignmentQuestion.objects.filter(assignment_id__in=list(new_ids)).order_by(
+            "assignment_id", "order_index", "pk"
+        )
+        created = AssignmentQuestion.objects.bulk_create(
+            [
+                AssignmentQuestion(
+                    assignment_id=new_ids[question.assignment_id],
+                    order_index=question.order_index,
+                    type=question.type,
+                    weight=question.weight,
+                    title=question.title,
+                    free_response_question_id=free_response_map.get(
+                        question.free_response_question_id, question.free_response_question_id
+                    ),
+                    multiple_choice_question_id=multiple_choice_map.get(
+                        question.multiple_choice_question_id,
+                        question.multiple_choice_question_id,
+                    ),
+                )
+                for question in questions.iterator(chunk_size=batch_size)
+            ],
+            batch_size=batch_size,
+        )
+
+        # Signal handlers did not run for the bulk inserts; bring derived data up to date.
+        reconcile_course_stats([target.pk])
+        index_objects(INDEXED_MODELS["assignment"], copies)
+        feed.rebuild([target.pk])
+        transaction.on_commit(lambda: invalidate_course_deadlines(target.pk))
+        transaction.on_commit(lambda: invalidate_gradebook(target.pk))
+        transaction.on_commit(lambda: invalidate_tags(course_tags("assignment", [target.pk])))
+
+    report.assignments = len(copies)
+    report.questions = len(created)
+    return report
@@ -0,0 +1,156 @@
+"""Effective due dates: ``Assignment.due_at`` unless an extension overrides it."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from core.db.replicas import primary_reads
+
+from .models import Assignment
+
+
+CACHE_TIMEOUT = 60 * 15
+
+
+def _cache_key(course_id: int) -> str:
+    return f"course-deadlines:{course_id}"
+
+
+def invalidate_course_deadlines(course_id: int) -> None:
+    """Drop the cached deadline table for a course."""
+
+    cache.delete(_cache_key(course_id))
+
+
+def invalidate_course_deadlines_many(course_ids: Iterable[int]) -> None:
+    """Drop cached deadline tables after bulk writes that bypass signals."""
+
+    keys = [_cache_key(course_id) for course_id in set(course_ids)]
+    if keys:
+        cache.delete_many(keys)
+
+
+class CourseDeadlines:
+    """Due dates and per-user extensions for every assignment in one course.
+
+    Built from a single query and answered from dictionaries, so resolving a
+    full roster × assignment grid costs no further database work.
+    """
+
+    def __init__(
+        self,
+        course_id: int,
+        due: Dict[int, Optional[datetime]],
+        extensions: Dict[int, Dict[int, datetime]],
+    ):
+        self.course_id = course_id
+        self.due = due
+        self.extensions = extensions
+
+    @classmethod
+    def build(cls, course_id: int, rows) -> "CourseDeadlines":
+        due: Dict[int, Optional[datetime]] = {}
+        extensions: Dict[int, Dict[int, datetime]] = defaultdict(dict)
+        for assignment_id, due_at, user_id, extended_due_at in rows:
+            due[assignment_id] = due_at
+            if user_id is not None:
+                extensions[assignment_id][user_id] = extended_due_at
+        return cls(course_id, due, dict(extensions))
+
+    def effective_due(self, assignment_id: int, user_id: int) -> Optional[datetime]:
+        extended = self.extensions.get(assignment_id, {}).get(user_id)
+        return extended if extended is not None else self.due.get(assignment_id)
+
+    def for_user(self, user_id: int) -> Dict[int, Optional[datetime]]:
+        """``{assignment_id: effective due}`` for every assignment in the course."""
+
+        return {
+            assignment_id: self.effective_due(assignment_id, user_id) for assignment_id in self.due
+        }
+
+    def grid(
+        self, user_ids: Iterable[int], assignment_ids: Optional[Iterable[int]] = None
+    ) -> Dict[Tuple[int, int], Optional[datetime]]:
+        """``{(assignment_id, user_id): effective due}`` for the requested cells."""
+
+        assignment_ids = list(self.due if assignment_ids is None else assignment_ids)
+        user_ids = list(user_ids)
+        return {
+            (assignment_id, user_id): self.effective_due(assignment_id, user_id)
+            for assignment_id in assignment_ids
+            for user_id in user_ids
+        }
+
+    def is_late(
+        self, assignment_id: int, user_id: int, submitted_at: Optional[datetime] = None
+    ) -> bool:
+        due_at = self.effective_due(assignment_id, user_id)
+        if due_at is None:
+            return False
+        return (submitted_at or timezone.now()) > due_at
+
+
+def _rows_for(course_ids: Iterable[int]):
+    # LEFT JOIN onto extensions: one row per assignment, or per extension.
+    return Assignment.objects.filter(course_id__in=list(course_ids)).values_list(
+        "course_id", "id", "due_at", "extensions__user_id", "extensions__due_at"
+    ).order_by()
+
+
+def get_deadlines_many(course_ids: Iterable[int]) -> Dict[int, CourseDeadlines]:
+    """Deadline tables for several courses, loading all cache misses in one query."""
+
+    course_ids = set(course_ids)
+    keys = {_cache_key(course_id): course_id for course_id in course_ids}
+    cached = cache.get_many(keys)
+    tables = {keys[key]: table for key, table in cached.items()}
+
+    missing = course_ids - tables.keys()
+    if missing:
+        rows = defaultdict(list)
+        # The tables are shared through the cache, so build them from the primary.
+        with primary_reads():
+            for course_id, *row in _rows_for(missing):
+                rows[course_id].append(row)
+        fresh = {
+            course_id: CourseDeadlines.build(course_id, rows.get(course_id, ()))
+            for course_id in missing
+        }
+        cache.set_many(
+            {_cache_key(course_id): table for course_id, table in fresh.items()}, CACHE_TIMEOUT
+        )
+        tables.update(fresh)
+    return tables
+
+
+def get_course_deadlines(course_id: int) -> CourseDeadlines:
+    return get_deadlines_many([course_id])[course_id]
+
+
+def resolve_deadlines(
+    assignments: Iterable[Assignment], user_ids: Iterable[int]
+) -> Dict[Tuple[int, int], Optional[datetime]]:
+    """Effective due dates for every ``(assignment.pk, user_id)`` pair."""
+
+    assignments = list(assignments)
+    user_ids = list(user_ids)
+    tables = get_deadlines_many({assignment.course_id for assignment in assignments})
+    resolved = {}
+    for assignment in assignments:
+        table = tables[assignment.course_id]
+        for user_id in user_ids:
+            resolved[(assignment.pk, user_id)] = table.effective_due(assignment.pk, user_id)
+    return resolved
+
+
+def is_submission_late(
+    assignment: Assignment, user_id: int, submitted_at: Optional[datetime] = None
+) -> bool:
+    """Whether a submission at ``submitted_at`` (default: now) misses the user's deadline."""
+
+    return get_course_deadlines(assignment.course_id).is_late(assignment.pk, user_id, submitted_at)
@@ -0,0 +1,89 @@
+"""Row generators for gradebook and extension CSV exports."""
+
+from __future__ import annotations
+
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from courses.models import CourseMembership
+
+from .deadlines import get_course_deadlines
+from .gradebook import get_gradebook
+from .models import Assignment, AssignmentExtension
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXTENSIONS_HEADER = ("email", "assignment", "due_at", "extended_due_at", "granted_at")
+
+
+def _format(value: float) -> str:
+    return "" if np.isnan(value) else f"{value:.2f}"
+
+
+def gradebook_header(course_id: int) -> List[str]:
+    titles = dict(Assignment.objects.filter(course_id=course_id).values_list("id", "title"))
+    gradebook = get_gradebook(course_id)
+    header = ["email", "first_name", "last_name", "total"]
+    for assignment_id in gradebook.assignment_ids:
+        title = titles.get(int(assignment_id), str(assignment_id))
+        header += [title, f"{title} due"]
+    return header
+
+
+def iter_gradebook_rows(
+    course_id: int, drop_lowest: int = 0, using: Optional[str] = None
+) -> Iterator[Tuple]:
+    """One row per student: identity, course total, then a percentage and due date per assignment.
+
+    Scores come from the cached gradebook arrays and due dates (with the
+    student's extensions applied) from the cached deadline table; student
+    details are read through a server-side cursor and matched to their row
+    by user id.
+    """
+
+    gradebook = get_gradebook(course_id)
+    deadlines = get_course_deadlines(course_id)
+    totals = gradebook.totals(drop_lowest)
+    percent = gradebook.percent * 100
+    assignment_ids = gradebook.assignment_ids.tolist()
+    index = {user_id: position for position, user_id in enumerate(gradebook.user_ids.tolist())}
+
+    students = (
+        CourseMembership.objects.using(using)
+        .filter(course_id=course_id, role=CourseMembership.Roles.STUDENT)
+        .order_by("user__email")
+        .values_list("user_id", "user__email", "user__first_name", "user__last_name")
+    )
+    for user_id, email, first_name, last_name in students.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        position = index.get(user_id)
+        row = [email, first_name, last_name, "" if position is None else _format(totals[position])]
+        for column, assignment_id in enumerate(assignment_ids):
+            due_at = deadlines.effective_due(assignment_id, user_id)
+            row += [
+                "" if position is None else _format(percent[position, column]),
+                due_at.isoformat() if due_at is not None else "",
+            ]
+        yield tuple(row)
+
+
+def iter_extension_rows(course_id: int, using: Optional[str] = None) -> Iterator[Tuple]:
+    queryset = (
+        AssignmentExtension.objects.using(using)
+        .filter(assignment__course_id=course_id)
+        .order_by("assignment_id", "user__email")
+        .values_list(
+            "user__email", "assignment__title", "assignment__due_at", "due_at", "created_at"
+        )
+    )
+    for email, title, due_at, extended_due_at, created_at in queryset.iterator(
+        chunk_size=EXPORT_CHUNK_SIZE
+    ):
+        yield (
+            email,
+            title,
+            due_at.isoformat() if due_at else "",
+            extended_due_at.isoformat(),
+            created_at.isoformat(),
+        )
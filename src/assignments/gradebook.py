@@ -0,0 +1,297 @@
+"""Vectorised gradebook computation for a course."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+from core.caching import cached
+from courses.models import CourseMembership
+
+from .deadlines import CourseDeadlines
+from .models import Assignment, AssignmentQuestion
+
+
+CACHE_TIMEOUT = 60 * 60
+
+HISTOGRAM_BINS = np.linspace(0, 100, 11)
+
+ScoreLoader = Callable[[List[int], List[int]], Iterable[Tuple[int, int, float]]]
+
+
+def _cache_key(course_id: int) -> str:
+    return f"gradebook:{course_id}"
+
+
+def invalidate_gradebook(course_id: int) -> None:
+    """Drop the cached gradebook so the next read rebuilds it."""
+
+    cache.delete(_cache_key(course_id))
+
+
+def invalidate_gradebooks_many(course_ids: Iterable[int]) -> None:
+    keys = [_cache_key(course_id) for course_id in set(course_ids)]
+    if keys:
+        cache.delete_many(keys)
+
+
+def get_score_loader() -> ScoreLoader:
+    """The configured ``(question_ids, user_ids) -> [(user_id, question_id, score)]`` loader.
+
+    Scores are in the same units as ``AssignmentQuestion.weight``; a question
+    without a score is treated as ungraded rather than zero.
+    """
+
+    path = getattr(settings, "GRADEBOOK_SCORE_LOADER", None)
+    if not path:
+        return lambda question_ids, user_ids: ()
+    return import_string(path)
+
+
+def _nan_stats(values: np.ndarray) -> Dict[str, Optional[float]]:
+    values = values[~np.isnan(values)]
+    if not values.size:
+        return {"count": 0, "mean": None, "median": None, "std": None, "min": None, "max": None}
+    return {
+        "count": int(values.size),
+        "mean": round(float(values.mean()), 2),
+        "median": round(float(np.median(values)), 2),
+        "std": round(float(values.std()), 2),
+        "min": round(float(values.min()), 2),
+        "max": round(float(values.max()), 2),
+    }
+
+
+@dataclass
+class Gradebook:
+    """Dense score matrices for one course.
+
+    ``scores`` is students × questions (``nan`` = ungraded). Questions map
+    onto assignments through ``question_assignment``, so per-assignment
+    percentages are a single matrix product, and totals, drop-lowest and
+    statistics are array operations over students × assignments.
+    """
+
+    course_id: int
+    user_ids: np.ndarray
+    assignment_ids: np.ndarray
+    points: np.ndarray
+    question_ids: np.ndarray
+    question_assignment: np.ndarray
+    weights: np.ndarray
+    scores: np.ndarray
+    percent: Optional[np.ndarray] = None
+
+    @classmethod
+    def load(cls, course_id: int, loader: Optional[ScoreLoader] = None) -> "Gradebook":
+        user_ids = np.fromiter(
+            CourseMembership.objects.filter(course_id=course_id, role=CourseMembership.Roles.STUDENT)
+            .order_by("user_id")
+            .values_list("user_id", flat=True),
+            dtype=np.int64,
+        )
+        assignments = list(
+            Assignment.objects.filter(course_id=course_id).order_by("id").values_list("id", "points")
+        )
+        assignment_ids = np.array([pk for pk, _ in assignments], dtype=np.int64)
+        points = np.array([float(value) for _, value in assignments], dtype=np.float64)
+        column = {pk: index for index, pk in enumerate(assignment_ids.tolist())}
+
+        questions = list(
+            AssignmentQuestion.objects.filter(assignment__course_id=course_id)
+            .order_by("assignment_id", "order_index", "id")
+            .values_list("id", "assignment_id", "weight")
+        )
+        question_ids = np.array([pk for pk, _, _ in questions], dtype=np.int64)
+        question_assignment = np.array(
+            [column[assignment_id] for _, assignment_id, _ in questions], dtype=np.int64
+        )
+        weights = np.array([float(weight) for _, _, weight in questions], dtype=np.float64)
+
+        gradebook = cls(
+            course_id=course_id,
+            user_ids=user_ids,
+            assignment_ids=assignment_ids,
+            points=points,
+            question_ids=question_ids,
+            question_assignment=question_assignment,
+            weights=weights,
+            scores=np.full((user_ids.size, question_ids.size), np.nan),
+        )
+        gradebook._fill_scores(gradebook.user_ids, gradebook.question_ids, loader)
+        gradebook.percent = gradebook._assignment_percent(gradebook.scores)
+        return gradebook
+
+    # -- loading -------------------------------------------------------------
+
+    def _fill_scores(
+        self, user_ids: np.ndarray, question_ids: np.ndarray, loader: Optional[ScoreLoader] = None
+    ) -> None:
+        if not user_ids.size or not question_ids.size:
+            return
+        loader = loader or get_score_loader()
+        rows = list(loader(question_ids.tolist(), user_ids.tolist()))
+        if not rows:
+            return
+        triples = np.array(rows, dtype=np.float64)
+        users = triples[:, 0].astype(np.int64)
+        questions = triples[:, 1].astype(np.int64)
+        # searchsorted returns an insertion point, which is past the end (or
+        # another id's slot) for ids the gradebook does not know; drop those rows.
+        row_index = np.searchsorted(self.user_ids, users)
+        row_known = row_index < self.user_ids.size
+        row_known[row_known] = self.user_ids[row_index[row_known]] == users[row_known]
+        order = np.argsort(self.question_ids)
+        sorted_index = np.searchsorted(self.question_ids, questions, sorter=order)
+        col_known = sorted_index < self.question_ids.size
+        col_index = np.zeros_like(sorted_index)
+        col_index[col_known] = order[sorted_index[col_known]]
+        col_known[col_known] = self.question_ids[col_index[col_known]] == questions[col_known]
+        known = row_known & col_known
+        self.scores[row_index[known], col_index[known]] = triples[known, 2]
+
+    # -- computation ---------------------------------------------------------
+
+    def _membership(self) -> np.ndarray:
+        """questions × assignments 0/1 matrix placing each question in its assignment."""
+
+        matrix = np.zeros((self.question_ids.size, self.assignment_ids.size))
+        matrix[np.arange(self.question_ids.size), self.question_assignment] = 1.0
+        return matrix
+
+    def _assignment_percent(self, scores: np.ndarray) -> np.ndarray:
+        membership = self._membership()
+        possible = self.weights @ membership
+        graded = ~np.isnan(scores)
+        earned = np.nan_to_num(scores) @ membership
+        answered = graded.astype(np.float64) @ membership
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percent = earned / possible
+        percent[(answered == 0) | (possible == 0)] = np.nan
+        return percent
+
+    def _kept(self, drop_lowest: int) -> np.ndarray:
+        """Mask of graded cells that count once each student's lowest ``drop_lowest`` are removed."""
+
+        graded = ~np.isnan(self.percent)
+        if drop_lowest <= 0:
+            return graded
+        # Rank graded cells per row; ungraded ones sort last and are never dropped.
+        ranks = np.argsort(np.argsort(np.where(graded, self.percent, np.inf), axis=1), axis=1)
+        to_drop = np.minimum(drop_lowest, np.maximum(graded.sum(axis=1) - 1, 0))
+        return graded & (ranks >= to_drop[:, np.newaxis])
+
+    def totals(self, drop_lowest: int = 0) -> np.ndarray:
+        """Course percentage per student, weighted by ``Assignment.points``."""
+
+        kept = self._kept(drop_lowest)
+        earned = np.where(kept, np.nan_to_num(self.percent) * self.points, 0.0).sum(axis=1)
+        possible = np.where(kept, self.points, 0.0).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(possible > 0, earned / possible * 100, np.nan)
+
+    def stats(self, drop_lowest: int = 0) -> Dict:
+        totals = self.totals(drop_lowest)
+        counts, edges = np.histogram(totals[~np.isnan(totals)], bins=HISTOGRAM_BINS)
+        return {
+            "course": _nan_stats(totals),
+            "histogram": {"edges": edges.tolist(), "counts": counts.tolist()},
+            "assignments": {
+                int(assignment_id): _nan_stats(self.percent[:, index] * 100)
+                for index, assignment_id in enumerate(self.assignment_ids)
+            },
+        }
+
+    def rows(
+        self, drop_lowest: int = 0, deadlines: Optional[CourseDeadlines] = None
+    ) -> Iterable[Dict]:
+        """One dict per student: total plus percentage per assignment.
+
+        With ``deadlines``, each row also carries the student's effective
+        due date per assignment (their extension, if any).
+        """
+
+        totals = self.totals(drop_lowest)
+        percent = self.percent * 100
+        assignment_ids = self.assignment_ids.tolist()
+        for index, user_id in enumerate(self.user_ids.tolist()):
+            row = {
+                "user_id": user_id,
+                "total": None if np.isnan(totals[index]) else round(float(totals[index]), 2),
+                "assignments": {
+                    assignment_id: None if np.isnan(value) else round(float(value), 2)
+                    for assignment_id, value in zip(assignment_ids, percent[index])
+                },
+            }
+            if deadlines is not None:
+                row["due_at"] = {
+                    assignment_id: deadlines.effective_due(assignment_id, user_id)
+                    for assignment_id in assignment_ids
+                }
+            yield row
+
+    # -- incremental updates -------------------------------------------------
+
+    def update_student(self, user_id: int, loader: Optional[ScoreLoader] = None) -> bool:
+        """Reload one student's scores; ``False`` if they are not on the roster."""
+
+        index = int(np.searchsorted(self.user_ids, user_id))
+        if index >= self.user_ids.size or self.user_ids[index] != user_id:
+            return False
+        self.scores[index, :] = np.nan
+        self._fill_scores(self.user_ids[index : index + 1], self.question_ids, loader)
+        self.percent[index] = self._assignment_percent(self.scores[index : index + 1])[0]
+        return True
+
+    def update_assignment(self, assignment_id: int, loader: Optional[ScoreLoader] = None) -> bool:
+        """Reload every student's scores for one assignment's questions."""
+
+        matches = np.flatnonzero(self.assignment_ids == assignment_id)
+        if not matches.size:
+            return False
+        columns = np.flatnonzero(self.question_assignment == matches[0])
+        self.scores[:, columns] = np.nan
+        self._fill_scores(self.user_ids, self.question_ids[columns], loader)
+        scores = self.scores[:, columns]
+        possible = self.weights[columns].sum()
+        answered = ~np.isnan(scores).all(axis=1)
+        percent = np.nansum(scores, axis=1) / possible if possible > 0 else np.nan
+        self.percent[:, matches[0]] = np.where(answered, percent, np.nan)
+        return True
+
+
+def get_gradebook(course_id: int) -> Gradebook:
+    """The cached gradebook for a course, built once on a miss however many readers wait."""
+
+    return cached(_cache_key(course_id), lambda: Gradebook.load(course_id), CACHE_TIMEOUT)
+
+
+def refresh_gradebook_student(course_id: int, user_id: int) -> None:
+    """Call after a student's scores change; recomputes only their row."""
+
+    key = _cache_key(course_id)
+    gradebook = cache.get(key)
+    if gradebook is None:
+        return
+    if gradebook.update_student(user_id):
+        cache.set(key, gradebook, CACHE_TIMEOUT)
+    else:
+        cache.delete(key)
+
+
+def refresh_gradebook_assignment(course_id: int, assignment_id: int) -> None:
+    """Call after an assignment's scores change; recomputes only its column."""
+
+    key = _cache_key(course_id)
+    gradebook = cache.get(key)
+    if gradebook is None:
+        return
+    if gradebook.update_assignment(assignment_id):
+        cache.set(key, gradebook, CACHE_TIMEOUT)
+    else:
+        cache.delete(key)
@@ -0,0 +1,59 @@
+"""Bulk re-rendering of ``Assignment.instructions_html``."""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional
+
+from django.db import transaction
+
+from core.caching import course_tags, invalidate_tags
+from core.markdown import content_hash, render_many
+
+from .models import Assignment
+
+
+def rerender_all_instructions(
+    batch_size: int = 500,
+    workers: Optional[int] = None,
+    on_progress: Optional[Callable[[Dict[str, int]], None]] = None,
+) -> Dict[str, int]:
+    """Re-render every assignment's instructions with the current renderer.
+
+    Run after ``RENDERER_VERSION`` changes. Each batch costs one cache lookup
+    plus rendering of content not seen before (in a worker pool); only rows
+    whose HTML actually changes are written.
+    """
+
+    totals = {"processed": 0, "updated": 0}
+    queryset = Assignment.objects.order_by("pk").only(
+        "pk", "course_id", "instructions_md", "instructions_html"
+    )
+    batch = []
+
+    def flush():
+        rendered = render_many((a.instructions_md for a in batch), workers=workers)
+        changed = []
+        for assignment in batch:
+            html = rendered[content_hash(assignment.instructions_md)]
+            if html != assignment.instructions_html:
+                assignment.instructions_html = html
+                changed.append(assignment)
+        # bulk_update bypasses Assignment.save(), which would render each row
+        # again, and the signals that drop cached responses with the old HTML.
+        Assignment.objects.bulk_update(changed, ["instructions_html"])
+        if changed:
+            tags = course_tags("assignment", {assignment.course_id for assignment in changed})
+            transaction.on_commit(lambda: invalidate_tags(tags))
+        totals["processed"] += len(batch)
+        totals["updated"] += len(changed)
+        if on_progress is not None:
+            on_progress(totals)
+
+    for assignment in queryset.iterator(chunk_size=batch_size):
+        batch.append(assignment)
+        if len(batch) >= batch_size:
+            flush()
+            batch = []
+    if batch:
+        flush()
+    return totals
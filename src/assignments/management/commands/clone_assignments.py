@@ -0,0 +1,57 @@
+"""Copy assignments from one course offering to another."""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from assignments.cloning import clone_assignments, course_offset
+from courses.models import Course
+
+
+class Command(BaseCommand):
+    help = (
+        "Clone assignments and their question links from SOURCE to TARGET, shifting "
+        "publish/due dates by --offset-days (default: the gap between start dates)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("source_course_id", type=int)
+        parser.add_argument("target_course_id", type=int)
+        parser.add_argument("--offset-days", type=int, default=None)
+        parser.add_argument(
+            "--assignment",
+            action="append",
+            type=int,
+            dest="assignment_ids",
+            help="Only clone this assignment id; repeatable.",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Roll back after reporting.")
+
+    def _course(self, pk):
+        try:
+            return Course.objects.get(pk=pk)
+        except Course.DoesNotExist as exc:
+            raise CommandError(f"Course {pk} does not exist.") from exc
+
+    def handle(self, *args, **options):
+        source = self._course(options["source_course_id"])
+        target = self._course(options["target_course_id"])
+        if source.pk == target.pk:
+            raise CommandError("Source and target must be different courses.")
+
+        if options["offset_days"] is not None:
+            offset = timedelta(days=options["offset_days"])
+        else:
+            offset = course_offset(source, target)
+
+        with transaction.atomic():
+            report = clone_assignments(
+                source, target, offset=offset, assignment_ids=options["assignment_ids"]
+            )
+            if options["dry_run"]:
+                transaction.set_rollback(True)
+
+        summary = ", ".join(f"{key}={value}" for key, value in report.as_dict().items())
+        prefix = "[dry run] " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(f"{prefix}Cloned {source} → {target}: {summary}"))
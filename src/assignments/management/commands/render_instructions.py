@@ -0,0 +1,35 @@
+"""Re-render assignment instructions after the markdown renderer changes."""
+
+from django.core.management.base import BaseCommand
+
+from assignments.instructions import rerender_all_instructions
+from core.markdown import RENDERER_VERSION, prune_rendered_markdown
+
+
+class Command(BaseCommand):
+    help = "Re-render Assignment.instructions_html with the current markdown renderer."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--workers", type=int, default=None, help="Render processes.")
+        parser.add_argument(
+            "--keep-old",
+            action="store_true",
+            help="Keep cached HTML produced by older renderer versions.",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Rendering with renderer v{RENDERER_VERSION}…")
+        totals = rerender_all_instructions(
+            batch_size=options["batch_size"],
+            workers=options["workers"],
+            on_progress=lambda t: self.stdout.write(f"  {t['processed']} processed"),
+        )
+        if not options["keep_old"]:
+            pruned = prune_rendered_markdown()
+            self.stdout.write(f"  pruned {pruned} stale cache rows")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {totals['processed']} assignments, updated {totals['updated']}."
+            )
+        )
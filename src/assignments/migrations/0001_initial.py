@@ -0,0 +1,172 @@
+# Generated by Django 4.2.11 on 2026-10-18 23:12
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("courses", "0001_initial"),
+        ("questions", "__first__"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Assignment",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title", models.CharField(max_length=255)),
+                ("instructions_md", models.TextField(blank=True)),
+                ("instructions_html", models.TextField(blank=True)),
+                (
+                    "points",
+                    models.DecimalField(decimal_places=2, default=100, max_digits=7),
+                ),
+                ("publish_at", models.DateTimeField(blank=True, null=True)),
+                ("due_at", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="assignments",
+                        to="courses.course",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Assignment",
+                "verbose_name_plural": "Assignments",
+                "ordering": ("-publish_at", "-created_at"),
+            },
+        ),
+        migrations.CreateModel(
+            name="AssignmentQuestion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("order_index", models.PositiveIntegerField(default=0)),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("free_response", "Free Response"),
+                            ("multiple_choice", "Multiple Choice"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "weight",
+                    models.DecimalField(decimal_places=2, default=1, max_digits=5),
+                ),
+                ("title", models.CharField(blank=True, max_length=255)),
+                (
+                    "assignment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="questions",
+                        to="assignments.assignment",
+                    ),
+                ),
+                (
+                    "free_response_question",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="assignment_links",
+                        to="questions.freeresponsequestion",
+                    ),
+                ),
+                (
+                    "multiple_choice_question",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="assignment_links",
+                        to="questions.multiplechoicequestion",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Assignment Question",
+                "verbose_name_plural": "Assignment Questions",
+                "ordering": ("assignment", "order_index"),
+            },
+        ),
+        migrations.CreateModel(
+            name="AssignmentExtension",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("due_at", models.DateTimeField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "assignment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="extensions",
+                        to="assignments.assignment",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="assignment_extensions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Assignment Extension",
+                "verbose_name_plural": "Assignment Extensions",
+                "unique_together": {("assignment", "user")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(
+                fields=["course", "-publish_at", "-created_at"],
+                name="assignment_course_publish",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(
+                condition=models.Q(("publish_at__isnull", False)),
+                fields=["publish_at"],
+                name="assignment_publish_at",
+            ),
+        ),
+    ]
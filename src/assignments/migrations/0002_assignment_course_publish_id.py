@@ -0,0 +1,24 @@
+# Generated by Django 4.2.11 on 2026-10-18 23:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assignments", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="assignment",
+            name="assignment_course_publish",
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(
+                fields=["course", "-publish_at", "-created_at", "id"],
+                name="assignment_course_publish",
+            ),
+        ),
+    ]
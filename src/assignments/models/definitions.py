@@ -3,6 +3,8 @@
 from django.conf import settings
 from django.db import models
 
+from core.markdown import render_cached
+
 
 class Assignment(models.Model):
     """Assignment definition for a course."""
@@ -23,12 +25,60 @@ class Assignment(models.Model):
 
     class Meta:
         ordering = ("-publish_at", "-created_at")
+        indexes = [
+            # Course listings and their keyset pages; ``id`` last to match
+            # graphql_api.pagination.ASSIGNMENT_ORDERING.
+            models.Index(
+                fields=("course", "-publish_at", "-created_at", "id"),
+                name="assignment_course_publish",
+            ),
+            # The feed scheduler's publish windows; drafts without a date are skipped.
+            models.Index(
+                fields=("publish_at",),
+                condition=models.Q(publish_at__isnull=False),
+                name="assignment_publish_at",
+            ),
+        ]
         verbose_name = "Assignment"
         verbose_name_plural = "Assignments"
 
     def __str__(self) -> str:
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # None when deferred; save() then only renders if the field was assigned.
+        instance._stored_instructions_md = instance.__dict__.get("instructions_md")
+        return instance
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "instructions_md" in update_fields:
+            changed = self._instructions_changed() and self.render_instructions()
+            if changed and update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "instructions_html"}
+        super().save(*args, **kwargs)
+        self._stored_instructions_md = self.__dict__.get("instructions_md")
+
+    def _instructions_changed(self) -> bool:
+        """Whether ``instructions_md`` differs from the value loaded from the database."""
+
+        if self._state.adding:
+            return True
+        if "instructions_md" not in self.__dict__:
+            return False
+        return self.instructions_md != getattr(self, "_stored_instructions_md", None)
+
+    def render_instructions(self) -> bool:
+        """Refresh ``instructions_html`` from the shared render cache; return whether it changed."""
+
+        html = render_cached(self.instructions_md)
+        if html == self.instructions_html:
+            return False
+        self.instructions_html = html
+        return True
+
 
 class AssignmentQuestion(models.Model):
     """Ordered question references within an assignment."""
@@ -0,0 +1,75 @@
+"""Signal handlers for the assignments app."""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from courses.signals import previous_course_id
+
+from .deadlines import invalidate_course_deadlines_many
+from .gradebook import invalidate_gradebooks_many
+from .models import Assignment, AssignmentExtension, AssignmentQuestion
+
+
+DEADLINE_FIELDS = {"course", "course_id", "due_at"}
+GRADEBOOK_FIELDS = {"course", "course_id", "points"}
+
+
+def _invalidate_on_commit(*course_ids, gradebook=False):
+    course_ids = {course_id for course_id in course_ids if course_id is not None}
+
+    def invalidate():
+        invalidate_course_deadlines_many(course_ids)
+        if gradebook:
+            invalidate_gradebooks_many(course_ids)
+
+    transaction.on_commit(invalidate)
+
+
+def _assignment_course_id(instance):
+    assignment = instance._state.fields_cache.get("assignment")
+    if assignment is not None:
+        return assignment.course_id
+    return (
+        Assignment._base_manager.filter(pk=instance.assignment_id)
+        .values_list("course_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Assignment)
+def assignment_saved(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    fields = DEADLINE_FIELDS | GRADEBOOK_FIELDS
+    if update_fields is not None and not fields.intersection(update_fields):
+        return
+    gradebook = created or update_fields is None or bool(GRADEBOOK_FIELDS.intersection(update_fields))
+    # The course stats pre_save stashed the stored course, so moving an
+    # assignment clears both courses' tables without another SELECT.
+    _invalidate_on_commit(instance.course_id, previous_course_id(instance), gradebook=gradebook)
+
+
+@receiver(post_delete, sender=Assignment)
+def assignment_deleted(sender, instance, **kwargs):
+    _invalidate_on_commit(instance.course_id, gradebook=True)
+
+
+@receiver(post_save, sender=AssignmentExtension)
+@receiver(post_delete, sender=AssignmentExtension)
+def extension_changed(sender, instance, **kwargs):
+    _invalidate_on_commit(_assignment_course_id(instance))
+
+
+@receiver(post_save, sender=AssignmentQuestion)
+@receiver(post_delete, sender=AssignmentQuestion)
+def question_changed(sender, instance, **kwargs):
+    course_id = _assignment_course_id(instance)
+    transaction.on_commit(lambda: invalidate_gradebooks_many([course_id]))
+
+
+@receiver(post_save, sender="courses.CourseMembership")
+@receiver(post_delete, sender="courses.CourseMembership")
+def roster_changed(sender, instance, **kwargs):
+    course_id = instance.course_id
+    transaction.on_commit(lambda: invalidate_gradebooks_many([course_id]))
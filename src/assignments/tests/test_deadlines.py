@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import User
+from assignments.deadlines import get_course_deadlines, is_submission_late, resolve_deadlines
+from assignments.exports import gradebook_header, iter_gradebook_rows
+from assignments.models import Assignment, AssignmentExtension
+from courses.models import Course, CourseMembership
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "deadline-tests",
+        }
+    }
+)
+class CourseDeadlinesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.now = timezone.now()
+        self.course = Course.objects.create(title="Compilers")
+        self.assignment = Assignment.objects.create(
+            course=self.course, title="Parser", due_at=self.now - timedelta(days=1)
+        )
+        self.ada = User.objects.create_user(email="ada@example.com", password="x")
+        self.grace = User.objects.create_user(email="grace@example.com", password="x")
+        for user in (self.ada, self.grace):
+            CourseMembership.objects.create(
+                course=self.course, user=user, role=CourseMembership.Roles.STUDENT
+            )
+
+    def _extend(self, user, days=2):
+        with self.captureOnCommitCallbacks(execute=True):
+            return AssignmentExtension.objects.create(
+                assignment=self.assignment, user=user, due_at=self.now + timedelta(days=days)
+            )
+
+    def test_extension_overrides_the_assignment_due_date(self):
+        extension = self._extend(self.ada)
+        resolved = resolve_deadlines([self.assignment], [self.ada.pk, self.grace.pk])
+        self.assertEqual(resolved[(self.assignment.pk, self.ada.pk)], extension.due_at)
+        self.assertEqual(resolved[(self.assignment.pk, self.grace.pk)], self.assignment.due_at)
+        self.assertFalse(is_submission_late(self.assignment, self.ada.pk, self.now))
+        self.assertTrue(is_submission_late(self.assignment, self.grace.pk, self.now))
+
+    def test_second_lookup_is_served_from_the_cache(self):
+        get_course_deadlines(self.course.pk)
+        with self.assertNumQueries(0):
+            table = get_course_deadlines(self.course.pk)
+        self.assertEqual(table.effective_due(self.assignment.pk, self.ada.pk), self.assignment.due_at)
+
+    def test_saving_an_extension_invalidates_the_table(self):
+        get_course_deadlines(self.course.pk)
+        extension = self._extend(self.ada)
+        table = get_course_deadlines(self.course.pk)
+        self.assertEqual(table.effective_due(self.assignment.pk, self.ada.pk), extension.due_at)
+
+        extension.due_at = self.now + timedelta(days=5)
+        with self.captureOnCommitCallbacks(execute=True):
+            extension.save()
+        table = get_course_deadlines(self.course.pk)
+        self.assertEqual(table.effective_due(self.assignment.pk, self.ada.pk), extension.due_at)
+
+    def test_deleting_an_extension_invalidates_the_table(self):
+        extension = self._extend(self.ada)
+        get_course_deadlines(self.course.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            extension.delete()
+        table = get_course_deadlines(self.course.pk)
+        self.assertEqual(table.effective_due(self.assignment.pk, self.ada.pk), self.assignment.due_at)
+
+    def test_gradebook_export_carries_effective_due_dates(self):
+        extension = self._extend(self.ada)
+        self.assertEqual(gradebook_header(self.course.pk)[-2:], ["Parser", "Parser due"])
+        rows = {row[0]: row for row in iter_gradebook_rows(self.course.pk)}
+        self.assertEqual(rows["ada@example.com"][-1], extension.due_at.isoformat())
+        self.assertEqual(rows["grace@example.com"][-1], self.assignment.due_at.isoformat())
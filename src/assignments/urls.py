@@ -2,7 +2,20 @@
 
 from django.urls import path
 
-app_name = "assignments"
+from .views import ExtensionExportView, GradebookExportView, GradebookView
 
-urlpatterns: list = []
+app_name = "assignments"
 
+urlpatterns = [
+    path("courses/<int:course_id>/gradebook/", GradebookView.as_view(), name="gradebook"),
+    path(
+        "courses/<int:course_id>/gradebook.csv",
+        GradebookExportView.as_view(),
+        name="gradebook-export",
+    ),
+    path(
+        "courses/<int:course_id>/extensions.csv",
+        ExtensionExportView.as_view(),
+        name="extension-export",
+    ),
+]
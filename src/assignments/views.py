@@ -0,0 +1,79 @@
+"""API views for the assignments app."""
+
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.db.replicas import replica_for, replica_reads
+from core.exports import csv_response
+from courses.permissions import IsCourseStaff
+
+from .deadlines import get_course_deadlines
+from .exports import EXTENSIONS_HEADER, gradebook_header, iter_extension_rows, iter_gradebook_rows
+from .gradebook import get_gradebook
+
+
+def _drop_lowest(request) -> int:
+    try:
+        return max(int(request.query_params.get("drop_lowest", 0)), 0)
+    except ValueError as exc:
+        raise ValidationError({"drop_lowest": ["Must be an integer."]}) from exc
+
+
+class GradebookView(APIView):
+    """Per-student assignment percentages and due dates, course totals and statistics.
+
+    ``?drop_lowest=N`` drops each student's N lowest graded assignments
+    before totals are computed.
+    """
+
+    permission_classes = (IsCourseStaff,)
+
+    def get(self, request, course_id):
+        drop_lowest = _drop_lowest(request)
+        with replica_reads(request):
+            gradebook = get_gradebook(course_id)
+            deadlines = get_course_deadlines(course_id)
+        data = {
+            "course_id": course_id,
+            "drop_lowest": drop_lowest,
+            "assignments": [
+                {"id": int(assignment_id), "points": float(points)}
+                for assignment_id, points in zip(gradebook.assignment_ids, gradebook.points)
+            ],
+            "students": list(gradebook.rows(drop_lowest, deadlines)),
+            "stats": gradebook.stats(drop_lowest),
+        }
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class GradebookExportView(APIView):
+    """Stream the gradebook as CSV (``?drop_lowest=N`` as for the JSON view)."""
+
+    permission_classes = (IsCourseStaff,)
+
+    def get(self, request, course_id):
+        drop_lowest = _drop_lowest(request)
+        with replica_reads(request) as using:
+            header = gradebook_header(course_id)
+        return csv_response(
+            request,
+            f"course-{course_id}-gradebook.csv",
+            header,
+            iter_gradebook_rows(course_id, drop_lowest, using=using),
+        )
+
+
+class ExtensionExportView(APIView):
+    """Stream every deadline extension in the course as CSV."""
+
+    permission_classes = (IsCourseStaff,)
+
+    def get(self, request, course_id):
+        return csv_response(
+            request,
+            f"course-{course_id}-extensions.csv",
+            EXTENSIONS_HEADER,
+            iter_extension_rows(course_id, using=replica_for(request)),
+        )
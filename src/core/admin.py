@@ -2,7 +2,26 @@
 
 from django.contrib import admin
 
+from core.db.replicas import replica_for
+
 admin.site.site_header = "CSE Plug Administration"
 admin.site.site_title = "CSE Plug Admin"
 admin.site.index_title = "Platform Management"
 
+
+class ReplicaChangelistMixin:
+    """Read changelist pages from a replica; edits and actions stay on the primary.
+
+    Only the listed rows move: related-field filters and the change form
+    still read through the router's default.
+    """
+
+    def changelist_view(self, request, extra_context=None):
+        if request.method == "GET":
+            request._changelist_alias = replica_for(request)
+        return super().changelist_view(request, extra_context)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        alias = getattr(request, "_changelist_alias", None)
+        return queryset if alias is None else queryset.using(alias)
@@ -2,21 +2,25 @@
 
 import os
 
-from channels.auth import AuthMiddlewareStack
 from channels.routing import ProtocolTypeRouter, URLRouter
 from django.core.asgi import get_asgi_application
 
-from whiteboard.routing import websocket_urlpatterns
-
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
 django_asgi_app = get_asgi_application()
 
+from accounts.auth.middleware import JWTCookieAuthMiddlewareStack  # noqa: E402
+from graphql_api.routing import websocket_urlpatterns as graphql_websocket_urlpatterns  # noqa: E402
+from whiteboard.routing import websocket_urlpatterns  # noqa: E402
+
 
 application = ProtocolTypeRouter(
     {
         "http": django_asgi_app,
-        "websocket": AuthMiddlewareStack(URLRouter(websocket_urlpatterns)),
+        # Session login or the JWT access cookie the REST and GraphQL APIs use.
+        "websocket": JWTCookieAuthMiddlewareStack(
+            URLRouter(websocket_urlpatterns + graphql_websocket_urlpatterns)
+        ),
     }
 )
 
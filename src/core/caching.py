@@ -0,0 +1,316 @@
+"""Shared cache tier: a per-process L1 in front of Redis, tags and single-flight fills."""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+
+from .db.replicas import primary_reads
+
+
+ALL_COURSES = "*"
+
+_MISSING = object()
+
+
+def key_family(key: str) -> str:
+    """``"course-roles:12"`` -> ``"course-roles"``; the unit metrics are reported in."""
+
+    return key.split(":", 1)[0]
+
+
+class CacheMetrics:
+    """Per-family counters for this worker: L1 and shared hits, misses, fills."""
+
+    def __init__(self):
+        self.counts: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def count(self, family: str, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counts.setdefault(family, Counter())[name] += amount
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            counts = {family: dict(counter) for family, counter in self.counts.items()}
+        for counter in counts.values():
+            hits = counter.get("l1_hits", 0) + counter.get("hits", 0)
+            lookups = hits + counter.get("misses", 0)
+            if lookups:
+                counter["hit_rate"] = round(hits / lookups, 4)
+        return counts
+
+
+_metrics = CacheMetrics()
+
+
+def get_cache_metrics() -> CacheMetrics:
+    return _metrics
+
+
+class TieredCache(BaseCache):
+    """Cache backend that keeps hot families in process memory in front of a shared cache.
+
+    ``OPTIONS["L2"]`` names the shared cache alias (Redis in production).
+    Only key families listed in ``OPTIONS["L1_TIMEOUTS"]`` are copied into
+    the in-process L1, each for at most its timeout; everything else, and
+    every write, counter and delete, goes straight to the shared cache.
+    A delete only clears this worker's L1, so list a family only if its
+    entries are content-addressed or validated with :func:`cached` tags.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.l2_alias = options.get("L2", "shared")
+        self.l1_timeouts: Dict[str, float] = dict(options.get("L1_TIMEOUTS", {}))
+        self.l1 = LocMemCache(
+            f"tiered-l1-{location or self.l2_alias}",
+            {"OPTIONS": {"MAX_ENTRIES": options.get("L1_MAX_ENTRIES", 1000)}},
+        )
+
+    @property
+    def l2(self) -> BaseCache:
+        return caches[self.l2_alias]
+
+    def _l1_timeout(self, key: str, timeout=DEFAULT_TIMEOUT) -> Optional[float]:
+        l1_timeout = self.l1_timeouts.get(key_family(key))
+        if l1_timeout is None:
+            return None
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            return min(l1_timeout, timeout)
+        return l1_timeout
+
+    # -- reads ---------------------------------------------------------------
+
+    def get(self, key, default=None, version=None):
+        family = key_family(key)
+        l1_timeout = self._l1_timeout(key)
+        if l1_timeout is not None:
+            value = self.l1.get(key, _MISSING, version)
+            if value is not _MISSING:
+                _metrics.count(family, "l1_hits")
+                return value
+        value = self.l2.get(key, _MISSING, version)
+        if value is _MISSING:
+            _metrics.count(family, "misses")
+            return default
+        _metrics.count(family, "hits")
+        if l1_timeout is not None:
+            self.l1.set(key, value, l1_timeout, version)
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        found = {}
+        for key in keys:
+            if self._l1_timeout(key) is not None:
+                value = self.l1.get(key, _MISSING, version)
+                if value is not _MISSING:
+                    found[key] = value
+                    _metrics.count(key_family(key), "l1_hits")
+        remaining = [key for key in keys if key not in found]
+        fetched = self.l2.get_many(remaining, version) if remaining else {}
+        for key in remaining:
+            if key in fetched:
+                _metrics.count(key_family(key), "hits")
+                l1_timeout = self._l1_timeout(key)
+                if l1_timeout is not None:
+                    self.l1.set(key, fetched[key], l1_timeout, version)
+            else:
+                _metrics.count(key_family(key), "misses")
+        found.update(fetched)
+        return found
+
+    def has_key(self, key, version=None):
+        return self.l2.has_key(key, version)
+
+    # -- writes --------------------------------------------------------------
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.l2.set(key, value, timeout, version)
+        l1_timeout = self._l1_timeout(key, timeout)
+        if l1_timeout is not None:
+            self.l1.set(key, value, l1_timeout, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.l2.set_many(data, timeout, version)
+        for key, value in data.items():
+            l1_timeout = self._l1_timeout(key, timeout)
+            if l1_timeout is not None and key not in failed:
+                self.l1.set(key, value, l1_timeout, version)
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.l1.delete(key, version)
+        return self.l2.add(key, value, timeout, version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.l2.touch(key, timeout, version)
+
+    def incr(self, key, delta=1, version=None):
+        self.l1.delete(key, version)
+        return self.l2.incr(key, delta, version)
+
+    def decr(self, key, delta=1, version=None):
+        self.l1.delete(key, version)
+        return self.l2.decr(key, delta, version)
+
+    def delete(self, key, version=None):
+        self.l1.delete(key, version)
+        return self.l2.delete(key, version)
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        self.l1.delete_many(keys, version)
+        self.l2.delete_many(keys, version)
+
+    def clear(self):
+        self.l1.clear()
+        self.l2.clear()
+
+    def close(self, **kwargs):
+        self.l2.close(**kwargs)
+
+
+# -- tags ----------------------------------------------------------------------
+
+
+def _tag_key(tag: str) -> str:
+    return f"tag:{tag}"
+
+
+def course_tags(family: str, course_ids: Iterable) -> List[str]:
+    """Tags to bump when ``family`` rows change in ``course_ids``."""
+
+    return [f"{family}:{ALL_COURSES}"] + [
+        f"{family}:{course_id}" for course_id in set(course_ids) if course_id is not None
+    ]
+
+
+def user_tag(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def tag_versions(tags: Iterable[str]) -> Dict[str, int]:
+    """Current version of each tag; a tag is bumped by :func:`invalidate_tags`."""
+
+    keys = {_tag_key(tag): tag for tag in tags}
+    found = cache.get_many(list(keys))
+    missing = [key for key in keys if key not in found]
+    if missing:
+        # Seed unknown (or evicted) tags from the clock rather than 0, so a
+        # recreated tag never matches entries cached under an older one.
+        seed = time.time_ns()
+        for key in missing:
+            cache.add(key, seed, None)
+        found.update(cache.get_many(missing))
+    return {tag: found.get(key, 0) for key, tag in keys.items()}
+
+
+def invalidate_tags(tags: Iterable[str]) -> None:
+    """Bump ``tags`` so every entry stored under an older version misses."""
+
+    for tag in set(tags):
+        try:
+            cache.incr(_tag_key(tag))
+        except ValueError:
+            # Nothing cached under an unknown tag yet; the next read seeds it.
+            pass
+        _metrics.count("tag", "invalidations")
+
+
+# -- single-flight fills -------------------------------------------------------
+
+
+class _Tagged(NamedTuple):
+    versions: tuple
+    value: Any
+
+
+# Keys being filled by a thread of this process -> set once the fill is stored.
+_flights: Dict[str, threading.Event] = {}
+_flights_lock = threading.Lock()
+
+FILL_LOCK_TIMEOUT = 30
+FILL_POLL_INTERVAL = 0.05
+
+
+def cached(
+    key: str,
+    compute: Callable[[], Any],
+    timeout=DEFAULT_TIMEOUT,
+    tags: Iterable[str] = (),
+    lock_timeout: float = FILL_LOCK_TIMEOUT,
+):
+    """Return the cached value of ``key``, computing it on a miss at most once at a time.
+
+    Concurrent misses wait for a single fill instead of all recomputing:
+    threads of this worker share an in-process flight, and workers contend
+    for a short-lived lock key in the shared cache. A waiter that outlives
+    ``lock_timeout`` computes the value itself. With ``tags`` the entry is
+    stored with the tags' versions and treated as a miss once any is bumped.
+    ``compute`` reads from the primary, since its result is shared.
+    """
+
+    tags = sorted(set(tags))
+    family = key_family(key)
+
+    def lookup():
+        versions = tuple(tag_versions(tags).values()) if tags else ()
+        entry = cache.get(key, _MISSING)
+        if tags:
+            if isinstance(entry, _Tagged) and entry.versions == versions:
+                return entry.value, versions
+            return _MISSING, versions
+        return entry, versions
+
+    value, versions = lookup()
+    if value is not _MISSING:
+        return value
+
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = threading.Event()
+    if not leader:
+        _metrics.count(family, "waits")
+        flight.wait(lock_timeout)
+        value, versions = lookup()
+        if value is not _MISSING:
+            return value
+
+    lock_key = f"fill:{key}"
+    token = uuid.uuid4().hex
+    try:
+        deadline = time.monotonic() + lock_timeout
+        while not cache.add(lock_key, token, lock_timeout):
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(FILL_POLL_INTERVAL)
+            value, versions = lookup()
+            if value is not _MISSING:
+                _metrics.count(family, "waits")
+                return value
+        try:
+            with primary_reads():
+                value = compute()
+            _metrics.count(family, "fills")
+            cache.set(key, _Tagged(versions, value) if tags else value, timeout)
+        finally:
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+        return value
+    finally:
+        if leader:
+            with _flights_lock:
+                _flights.pop(key, None)
+            flight.set()
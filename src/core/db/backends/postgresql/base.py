@@ -0,0 +1,88 @@
+"""PostgreSQL backend that borrows connections from a psycopg_pool pool."""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Tuple
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base
+from psycopg import IsolationLevel
+from psycopg_pool import ConnectionPool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """Django's ``postgresql`` backend with an optional per-process connection pool.
+
+    With a ``POOL`` dict in the database settings (keyword arguments for
+    :class:`psycopg_pool.ConnectionPool`), ``connect()`` takes a connection
+    from the pool and ``close()`` hands it back, so a request costs a
+    checkout rather than a TCP and auth handshake. Pools are created lazily,
+    after any worker fork, and connections are checked before they are
+    handed out. Without ``POOL`` this is the stock backend.
+    """
+
+    _pools: Dict[Tuple, ConnectionPool] = {}
+    _pools_lock = threading.Lock()
+
+    @property
+    def pool_options(self):
+        return self.settings_dict.get("POOL")
+
+    def _pool_key(self) -> Tuple:
+        # NAME changes when the test runner switches to the test database.
+        settings = self.settings_dict
+        return (self.alias, settings["NAME"], settings["HOST"], settings["PORT"], settings["USER"])
+
+    def _get_pool(self, conn_params) -> ConnectionPool:
+        key = self._pool_key()
+        pool = self._pools.get(key)
+        if pool is not None:
+            return pool
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(
+                    kwargs=conn_params,
+                    check=ConnectionPool.check_connection,
+                    name=self.alias,
+                    open=True,
+                    **self.pool_options,
+                )
+                self._pools[key] = pool
+        return pool
+
+    def get_new_connection(self, conn_params):
+        if not self.pool_options:
+            return super().get_new_connection(conn_params)
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        try:
+            self.isolation_level = IsolationLevel(
+                IsolationLevel.READ_COMMITTED if isolation_level is None else isolation_level
+            )
+        except ValueError:
+            raise ImproperlyConfigured(
+                f"Invalid transaction isolation level {isolation_level} specified. "
+                f"Use one of the psycopg.IsolationLevel values."
+            ) from None
+        connection = self._get_pool(conn_params).getconn()
+        if isolation_level is not None:
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self):
+        if self.connection is None or not self.pool_options:
+            return super()._close()
+        pool = self._pools.get(self._pool_key())
+        with self.wrap_database_errors:
+            if pool is None:
+                return self.connection.close()
+            # The pool rolls back anything left open and discards broken connections.
+            return pool.putconn(self.connection)
+
+    @classmethod
+    def close_pools(cls) -> None:
+        with cls._pools_lock:
+            for pool in cls._pools.values():
+                pool.close()
+            cls._pools.clear()
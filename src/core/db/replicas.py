@@ -0,0 +1,205 @@
+"""Read-replica selection with read-your-writes pinning and failover."""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+
+logger = logging.getLogger(__name__)
+
+# Alias reads are routed to while inside ``replica_reads()``; ``None`` means the primary.
+_read_alias: ContextVar[Optional[str]] = ContextVar("read_alias", default=None)
+# Per-request mutable marker so writes made in worker threads are still seen.
+_request_writes: ContextVar[Optional[Dict]] = ContextVar("request_writes", default=None)
+
+
+def _pin_key(user_id) -> str:
+    return f"db-pin:{user_id}"
+
+
+def current_read_alias() -> Optional[str]:
+    return _read_alias.get()
+
+
+def record_write() -> None:
+    writes = _request_writes.get()
+    if writes is not None:
+        writes["wrote"] = True
+
+
+class ReplicaHealth:
+    """Tracks which replicas may serve reads, re-checking each at most every ``interval``.
+
+    A replica that refuses connections, or whose replay lags more than
+    ``max_lag`` seconds behind the primary (PostgreSQL only), is skipped until
+    its next check; with none available reads go to the primary.
+    """
+
+    def __init__(self, interval: float, max_lag: float):
+        self.interval = interval
+        self.max_lag = max_lag
+        self._state: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _probe(self, alias: str) -> bool:
+        connection = connections[alias]
+        try:
+            with connection.cursor() as cursor:
+                if connection.vendor == "postgresql":
+                    # The last replayed commit's age overstates lag on an idle
+                    # primary; a replica that has replayed all WAL it received
+                    # is caught up however old that commit is.
+                    cursor.execute(
+                        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()"
+                        " THEN 0"
+                        " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+                        " END"
+                    )
+                    lag = float(cursor.fetchone()[0])
+                    if lag > self.max_lag:
+                        logger.warning("Replica %s is %.0fs behind; reading from primary", alias, lag)
+                        return False
+                else:
+                    cursor.execute("SELECT 1")
+        except DatabaseError:
+            logger.warning("Replica %s is unavailable; reading from primary", alias, exc_info=True)
+            connection.close()
+            return False
+        return True
+
+    def is_healthy(self, alias: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            healthy, checked_at = self._state.get(alias, (True, None))
+            if checked_at is not None and now - checked_at < self.interval:
+                return healthy
+            # Claim the check so concurrent requests keep using the last verdict.
+            self._state[alias] = (healthy, now)
+        healthy = self._probe(alias)
+        with self._lock:
+            self._state[alias] = (healthy, now)
+        return healthy
+
+    def mark_unhealthy(self, alias: str) -> None:
+        with self._lock:
+            self._state[alias] = (False, time.monotonic())
+
+
+_health: Optional[ReplicaHealth] = None
+
+
+def get_replica_health() -> ReplicaHealth:
+    global _health
+    if _health is None:
+        _health = ReplicaHealth(settings.DB_REPLICA_CHECK_INTERVAL, settings.DB_REPLICA_MAX_LAG)
+    return _health
+
+
+def is_pinned(request) -> bool:
+    """True while the request's user is inside the read-your-writes window."""
+
+    pinned = getattr(request, "_db_pinned", None)
+    if pinned is None:
+        user = getattr(request, "user", None)
+        pinned = bool(user is not None and user.is_authenticated and cache.get(_pin_key(user.pk)))
+        request._db_pinned = pinned
+    return pinned
+
+
+def replica_for(request=None) -> str:
+    """A healthy replica alias for read-only work, or the primary when there is none.
+
+    Users who wrote within ``DB_REPLICA_PIN_SECONDS`` stay on the primary so
+    they see their own changes.
+    """
+
+    replicas = list(settings.DB_READ_REPLICAS)
+    if not replicas or (request is not None and is_pinned(request)):
+        return DEFAULT_DB_ALIAS
+    random.shuffle(replicas)
+    health = get_replica_health()
+    for alias in replicas:
+        if health.is_healthy(alias):
+            return alias
+    return DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def replica_reads(request=None):
+    """Route ORM reads inside the block to a replica (see :func:`replica_for`)."""
+
+    alias = replica_for(request)
+    token = _read_alias.set(None if alias == DEFAULT_DB_ALIAS else alias)
+    try:
+        yield alias
+    finally:
+        _read_alias.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """Route ORM reads inside the block to the primary, even within ``replica_reads()``.
+
+    For values stored in a shared cache: a fill read from a lagging replica
+    would be served to everyone until it expires or is invalidated.
+    """
+
+    token = _read_alias.set(None)
+    try:
+        yield DEFAULT_DB_ALIAS
+    finally:
+        _read_alias.reset(token)
+
+
+class ReadYourWritesMiddleware:
+    """Pins a user to the primary for a short window after a request that wrote.
+
+    Must sit above the middleware that authenticates the user, since the
+    user is read after the response is produced.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def _pin(self, request, writes: Dict) -> None:
+        user = getattr(request, "user", None)
+        if writes.get("wrote") and user is not None and user.is_authenticated:
+            cache.set(_pin_key(user.pk), True, settings.DB_REPLICA_PIN_SECONDS)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        writes: Dict = {}
+        token = _request_writes.set(writes)
+        try:
+            return self.get_response(request)
+        finally:
+            _request_writes.reset(token)
+            self._pin(request, writes)
+
+    async def __acall__(self, request):
+        writes: Dict = {}
+        token = _request_writes.set(writes)
+        try:
+            return await self.get_response(request)
+        finally:
+            _request_writes.reset(token)
+            if writes.get("wrote"):
+                await sync_to_async(self._pin)(request, writes)
@@ -0,0 +1,27 @@
+"""Database routers."""
+
+from django.db import DEFAULT_DB_ALIAS
+
+from .replicas import current_read_alias, record_write
+
+
+class ReplicaRouter:
+    """Reads go to a replica only inside ``replica_reads()``; everything else uses the primary.
+
+    Writes always go to the primary, even for instances loaded from a
+    replica, and mark the request so ``ReadYourWritesMiddleware`` can pin the
+    user. Replicas mirror the primary's schema and are never migrated.
+    """
+
+    def db_for_read(self, model, **hints):
+        return current_read_alias() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        record_write()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
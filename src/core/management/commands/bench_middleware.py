@@ -0,0 +1,108 @@
+"""Benchmark per-request middleware overhead: full stack vs. path-routed stack."""
+
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from core.middleware import MiddlewareChain
+
+ROUTER = "core.middleware.PathRoutedMiddleware"
+
+
+def _noop_view(request):  # pragma: no cover - never called, only passed to hooks
+    return HttpResponse()
+
+
+class Command(BaseCommand):
+    help = (
+        "Time GET requests through the full middleware stack (the routed "
+        "default chain applied to every path) and through the configured "
+        "path-routed stack, and report the per-request overhead of each."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=5000)
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Timing rounds per configuration; the fastest round is reported.",
+        )
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help="Request path to benchmark; repeatable.",
+        )
+        parser.add_argument(
+            "--user-email",
+            help="Send a JWT access cookie for this existing user (exercises authentication).",
+        )
+
+    def handle(self, *args, **options):
+        if ROUTER not in settings.MIDDLEWARE:
+            raise CommandError(f"{ROUTER} is not in MIDDLEWARE; nothing to compare.")
+
+        full_stack = []
+        for path in settings.MIDDLEWARE:
+            full_stack.extend(settings.ROUTED_MIDDLEWARE["default"] if path == ROUTER else [path])
+
+        cookies = {}
+        if options["user_email"]:
+            from accounts.auth.constants import ACCESS_COOKIE_NAME
+            from accounts.auth.services import generate_tokens
+            from accounts.models import User
+
+            try:
+                user = User.objects.get(email=options["user_email"])
+            except User.DoesNotExist as exc:
+                raise CommandError(f"No user with email {options['user_email']!r}.") from exc
+            cookies[ACCESS_COOKIE_NAME] = generate_tokens(user)[0]
+
+        hosts = [host for host in settings.ALLOWED_HOSTS if host != "*"]
+        factory = RequestFactory(SERVER_NAME=hosts[0] if hosts else "localhost")
+        for name, value in cookies.items():
+            factory.cookies[name] = value
+
+        count = options["requests"]
+        repeat = options["repeat"]
+        paths = options["paths"] or ["/api/accounts/profile/", "/graphql/", "/admin/"]
+        self.stdout.write(f"{'path':<28}{'bare':>10}{'full':>10}{'routed':>10}{'saved':>10}  (µs/request)")
+        for path in paths:
+            bare = self._measure([], factory, path, count, repeat)
+            full = self._measure(full_stack, factory, path, count, repeat) - bare
+            routed = self._measure(settings.MIDDLEWARE, factory, path, count, repeat) - bare
+            self.stdout.write(
+                f"{path:<28}{bare:>10.1f}{full:>10.1f}{routed:>10.1f}{full - routed:>10.1f}"
+            )
+
+    def _measure(self, middleware, factory, path, count, repeat) -> float:
+        """Best-round mean microseconds per request, including request construction."""
+
+        holder = {}
+
+        def view(request):
+            # Stand-in for Django's URL resolution step: run process_view hooks.
+            for hook in holder["chain"].view_hooks:
+                if hook(request, _noop_view, (), {}) is not None:
+                    break
+            return HttpResponse("ok")
+
+        chain = MiddlewareChain(middleware, view, is_async=False)
+        holder["chain"] = chain
+
+        for _ in range(min(count, 200)):
+            chain.handler(factory.get(path))
+
+        rounds = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(count):
+                chain.handler(factory.get(path))
+            rounds.append((time.perf_counter() - start) / count * 1e6)
+        return min(rounds)
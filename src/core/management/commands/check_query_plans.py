@@ -0,0 +1,240 @@
+"""Fail when a hot query shape stops using its index."""
+
+from __future__ import annotations
+
+import re
+from datetime import timedelta
+from typing import Callable, List, NamedTuple
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from graphql_api.pagination import ASSIGNMENT_ORDERING, COURSE_MEMBERSHIP_ORDERING, KeysetPaginator
+
+
+class Shape(NamedTuple):
+    label: str
+    model: str
+    # Receives the seeded fixtures and returns the queryset to explain.
+    build: Callable[[dict], QuerySet]
+    # Whether the index must also provide the ORDER BY.
+    ordered: bool = True
+
+
+def _model(label: str):
+    return apps.get_model(label)
+
+
+def _keyset_page(queryset: QuerySet, ordering, size: int = 20) -> QuerySet:
+    """The second page of a connection field, seeking past the first page's last row."""
+
+    paginator = KeysetPaginator(queryset, ordering)
+    last_row = list(paginator.window()[:size])[-1]
+    return paginator.window(after=paginator.encode_cursor(last_row))[: size + 1]
+
+
+HOT_QUERIES: List[Shape] = [
+    Shape(
+        "whiteboard strokes replayed for a session",
+        "whiteboard.WhiteboardStroke",
+        lambda f: _model("whiteboard.WhiteboardStroke")
+        .objects.filter(session_id=f["session"])
+        .order_by("ts"),
+    ),
+    Shape(
+        "assignments listed for a course",
+        "assignments.Assignment",
+        lambda f: _model("assignments.Assignment")
+        .objects.filter(course_id=f["course"])
+        .order_by("-publish_at", "-created_at"),
+    ),
+    Shape(
+        "keyset page of a course's assignments",
+        "assignments.Assignment",
+        lambda f: _keyset_page(
+            _model("assignments.Assignment").objects.filter(course_id=f["course"]),
+            ASSIGNMENT_ORDERING,
+            size=5,
+        ),
+    ),
+    Shape(
+        "assignments published in a scheduler window",
+        "assignments.Assignment",
+        lambda f: _model("assignments.Assignment").objects.filter(
+            publish_at__gt=f["now"] - timedelta(minutes=5), publish_at__lte=f["now"]
+        ),
+        ordered=False,
+    ),
+    Shape(
+        "students of a course for the gradebook",
+        "courses.CourseMembership",
+        lambda f: _model("courses.CourseMembership")
+        .objects.filter(course_id=f["course"], role="student")
+        .order_by("user_id"),
+    ),
+    Shape(
+        "keyset page of a course's members",
+        "courses.CourseMembership",
+        lambda f: _keyset_page(
+            _model("courses.CourseMembership").objects.filter(course_id=f["course"]),
+            COURSE_MEMBERSHIP_ORDERING,
+        ),
+    ),
+    Shape(
+        "keyset page of a user's courses",
+        "courses.CourseMembership",
+        lambda f: _keyset_page(
+            _model("courses.CourseMembership").objects.filter(user_id=f["user"]),
+            COURSE_MEMBERSHIP_ORDERING,
+            size=5,
+        ),
+    ),
+    Shape(
+        "upcoming work on a student's dashboard",
+        "courses.UpcomingWork",
+        lambda f: _model("courses.UpcomingWork")
+        .objects.filter(user_id=f["user"])
+        .order_by("due_at"),
+    ),
+]
+
+
+def plan_problems(plan: str, vendor: str, table: str, ordered: bool) -> List[str]:
+    """Sequential scans of ``table`` (and sorts, for ordered shapes) in an EXPLAIN plan."""
+
+    problems = []
+    if vendor == "postgresql":
+        if re.search(rf"Seq Scan on {re.escape(table)}\b", plan):
+            problems.append("sequential scan")
+        if ordered and re.search(r"(^|->\s+)Sort\s+\(", plan, re.MULTILINE):
+            problems.append("sort")
+    else:
+        if re.search(rf"\bSCAN {re.escape(table)}\b(?! USING)", plan):
+            problems.append("sequential scan")
+        if ordered and "USE TEMP B-TREE FOR ORDER BY" in plan:
+            problems.append("sort")
+    return problems
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed representative rows inside a rolled-back transaction, EXPLAIN "
+        "each hot query shape, and exit non-zero when one falls back to a "
+        "sequential scan or an explicit sort. Run it in CI after migrate."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=20,
+            help="Courses to seed; every other table is sized relative to it.",
+        )
+        parser.add_argument("--verbose-plans", action="store_true", help="Print every plan.")
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        if connection.vendor not in ("postgresql", "sqlite"):
+            raise CommandError(f"Plan checks support PostgreSQL and SQLite, not {connection.vendor}.")
+
+        tables = set(connection.introspection.table_names())
+        shapes = []
+        failures = []
+        for shape in HOT_QUERIES:
+            if _model(shape.model)._meta.db_table in tables:
+                shapes.append(shape)
+            else:
+                # A shape whose table is missing is unchecked, not passing.
+                failures.append(shape.label)
+                self.stdout.write(self.style.ERROR(f"FAIL  {shape.label}: table not migrated"))
+
+        with transaction.atomic(using=options["database"]):
+            fixtures = self._seed(options["database"], options["scale"], tables)
+            with connection.cursor() as cursor:
+                for table in sorted({_model(shape.model)._meta.db_table for shape in shapes}):
+                    cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+                if connection.vendor == "postgresql":
+                    # Seeded tables are small; make an index the only way to avoid a penalty,
+                    # so a remaining Seq Scan means no usable index exists.
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for shape in shapes:
+                queryset = shape.build(fixtures).using(options["database"])
+                plan = queryset.explain()
+                problems = plan_problems(
+                    plan, connection.vendor, queryset.model._meta.db_table, shape.ordered
+                )
+                if problems:
+                    failures.append(shape.label)
+                    self.stdout.write(self.style.ERROR(f"FAIL  {shape.label}: {', '.join(problems)}"))
+                else:
+                    self.stdout.write(f"ok    {shape.label}")
+                if problems or options["verbose_plans"]:
+                    self.stdout.write(f"      {plan.replace(chr(10), chr(10) + '      ')}")
+            transaction.set_rollback(True, using=options["database"])
+
+        if failures:
+            raise CommandError(f"{len(failures)} query plan(s) regressed.")
+        self.stdout.write(self.style.SUCCESS(f"{len(shapes)} query plans use their indexes."))
+
+    def _seed(self, using: str, scale: int, tables: set) -> dict:
+        User = _model("accounts.User")
+        Course = _model("courses.Course")
+        CourseMembership = _model("courses.CourseMembership")
+        UpcomingWork = _model("courses.UpcomingWork")
+        now = timezone.now()
+
+        users = User.objects.using(using).bulk_create(
+            User(email=f"plan-check-{i}@example.invalid", password="!") for i in range(scale * 10)
+        )
+        courses = Course.objects.using(using).bulk_create(
+            Course(title=f"Plan check {i}") for i in range(scale)
+        )
+        roles = ("instructor", "teaching_assistant") + ("student",) * 8
+        CourseMembership.objects.using(using).bulk_create(
+            CourseMembership(user=user, course=course, role=roles[i % len(roles)])
+            for course in courses
+            for i, user in enumerate(users)
+        )
+
+        fixtures = {"now": now, "user": users[0].pk, "course": courses[0].pk}
+        Assignment = _model("assignments.Assignment")
+        if Assignment._meta.db_table in tables:
+            assignments = Assignment.objects.using(using).bulk_create(
+                Assignment(
+                    course=course,
+                    title="Plan check",
+                    publish_at=now - timedelta(hours=i) if i % 4 else None,
+                )
+                for course in courses
+                for i in range(20)
+            )
+            UpcomingWork.objects.using(using).bulk_create(
+                UpcomingWork(
+                    user=user,
+                    course_id=assignment.course_id,
+                    assignment=assignment,
+                    title="Plan check",
+                    points=10,
+                    due_at=now + timedelta(hours=i),
+                )
+                # Five distinct assignments per user, as the unique constraint requires.
+                for i, user in enumerate(users)
+                for assignment in assignments[i % 16 : i % 16 + 5]
+            )
+        WhiteboardSession = _model("whiteboard.WhiteboardSession")
+        WhiteboardStroke = _model("whiteboard.WhiteboardStroke")
+        if WhiteboardStroke._meta.db_table in tables:
+            sessions = WhiteboardSession.objects.using(using).bulk_create(
+                WhiteboardSession(course=course, instructor=users[0], title="Plan check")
+                for course in courses
+            )
+            WhiteboardStroke.objects.using(using).bulk_create(
+                WhiteboardStroke(session=session, data={}) for session in sessions for _ in range(50)
+            )
+            fixtures["session"] = sessions[0].pk
+        return fixtures
@@ -0,0 +1,110 @@
+"""Markdown to sanitized HTML, cached by content hash."""
+
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import markdown as markdown_lib
+import nh3
+
+from .models import RenderedMarkdown
+
+
+# Bump whenever extensions or the sanitizer allow-list change so stored HTML
+# is re-rendered by ``render_instructions``.
+RENDERER_VERSION = 1
+
+MARKDOWN_EXTENSIONS = ("extra", "sane_lists", "codehilite", "toc")
+MARKDOWN_EXTENSION_CONFIGS = {"codehilite": {"use_pygments": False}}
+
+ALLOWED_TAGS = {
+    "a", "abbr", "blockquote", "br", "code", "dd", "del", "div", "dl", "dt", "em",
+    "h1", "h2", "h3", "h4", "h5", "h6", "hr", "img", "li", "ol", "p", "pre", "span",
+    "strong", "sub", "sup", "table", "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+}
+ALLOWED_ATTRIBUTES = {
+    "*": {"class", "id"},
+    "a": {"href", "title"},
+    "abbr": {"title"},
+    "img": {"alt", "src", "title", "width", "height"},
+    "td": {"align"},
+    "th": {"align"},
+}
+
+# Below this many misses a process pool costs more than it saves.
+POOL_THRESHOLD = 16
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def render_markdown(text: str) -> str:
+    """Convert and sanitize ``text`` without touching the cache."""
+
+    if not text.strip():
+        return ""
+    html = markdown_lib.markdown(
+        text,
+        extensions=list(MARKDOWN_EXTENSIONS),
+        extension_configs=MARKDOWN_EXTENSION_CONFIGS,
+        output_format="html",
+    )
+    return nh3.clean(
+        html,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        url_schemes={"http", "https", "mailto"},
+        link_rel="noopener noreferrer",
+    )
+
+
+def render_many(texts: Iterable[str], workers: Optional[int] = None) -> Dict[str, str]:
+    """Return ``{content_hash: html}`` for ``texts``, rendering only cache misses.
+
+    Hits are read in one query; misses are rendered (in a process pool when
+    there are enough of them) and stored for every later caller.
+    """
+
+    sources = {content_hash(text): text for text in texts}
+    if not sources:
+        return {}
+    rendered = dict(
+        RenderedMarkdown.objects.filter(
+            renderer_version=RENDERER_VERSION, content_hash__in=list(sources)
+        ).values_list("content_hash", "html")
+    )
+    missing = [digest for digest in sources if digest not in rendered]
+    if missing:
+        texts_to_render = [sources[digest] for digest in missing]
+        if len(missing) >= POOL_THRESHOLD and workers != 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(missing) // ((workers or 4) * 4))
+                html = list(pool.map(render_markdown, texts_to_render, chunksize=chunksize))
+        else:
+            html = [render_markdown(text) for text in texts_to_render]
+        fresh = dict(zip(missing, html))
+        RenderedMarkdown.objects.bulk_create(
+            [
+                RenderedMarkdown(content_hash=digest, renderer_version=RENDERER_VERSION, html=body)
+                for digest, body in fresh.items()
+            ],
+            ignore_conflicts=True,
+        )
+        rendered.update(fresh)
+    return rendered
+
+
+def render_cached(text: str) -> str:
+    """Sanitized HTML for ``text``, rendering it only if this content is new."""
+
+    return render_many([text], workers=1)[content_hash(text)]
+
+
+def prune_rendered_markdown() -> int:
+    """Delete cache rows produced by older renderer versions."""
+
+    deleted, _ = RenderedMarkdown.objects.exclude(renderer_version=RENDERER_VERSION).delete()
+    return deleted
@@ -0,0 +1,139 @@
+"""Path-aware middleware routing."""
+
+from __future__ import annotations
+
+from typing import Callable, List, Sequence, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.core.handlers.base import BaseHandler
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.module_loading import import_string
+
+
+class MiddlewareChain(BaseHandler):
+    """A middleware stack built from an explicit list instead of ``settings.MIDDLEWARE``.
+
+    Mirrors ``BaseHandler.load_middleware`` so sync/async adaptation and the
+    ``process_view`` / ``process_template_response`` / ``process_exception``
+    hooks behave exactly as they would in the top-level stack. Hooks are kept
+    in sync mode; ``PathRoutedMiddleware`` exposes them as sync methods and
+    Django adapts those once at the outer layer.
+    """
+
+    def __init__(self, middleware: Sequence[str], get_response: Callable, is_async: bool):
+        self.middleware = list(middleware)
+        self.view_hooks: List[Callable] = []
+        self.template_response_hooks: List[Callable] = []
+        self.exception_hooks: List[Callable] = []
+
+        handler = convert_exception_to_response(get_response)
+        handler_is_async = is_async
+        for middleware_path in reversed(self.middleware):
+            middleware_cls = import_string(middleware_path)
+            can_sync = getattr(middleware_cls, "sync_capable", True)
+            can_async = getattr(middleware_cls, "async_capable", False)
+            if not can_sync and not can_async:
+                raise ImproperlyConfigured(
+                    f"Middleware {middleware_path} must be sync or async capable."
+                )
+            middleware_is_async = can_async if (handler_is_async or not can_sync) else False
+            try:
+                adapted_handler = self.adapt_method_mode(
+                    middleware_is_async, handler, handler_is_async
+                )
+                instance = middleware_cls(adapted_handler)
+            except MiddlewareNotUsed:
+                continue
+            handler = adapted_handler
+
+            if hasattr(instance, "process_view"):
+                self.view_hooks.insert(0, self.adapt_method_mode(False, instance.process_view))
+            if hasattr(instance, "process_template_response"):
+                self.template_response_hooks.append(
+                    self.adapt_method_mode(False, instance.process_template_response)
+                )
+            if hasattr(instance, "process_exception"):
+                self.exception_hooks.append(
+                    self.adapt_method_mode(False, instance.process_exception)
+                )
+
+            handler = convert_exception_to_response(instance)
+            handler_is_async = middleware_is_async
+
+        self.handler = self.adapt_method_mode(is_async, handler, handler_is_async)
+
+
+class PathRoutedMiddleware:
+    """Run a different middleware chain depending on the request path.
+
+    ``settings.ROUTED_MIDDLEWARE`` maps path prefixes to middleware lists; the
+    longest matching prefix wins and ``"default"`` covers everything else.
+    This lets stateless JWT routes (``/api/``, ``/graphql/``) skip sessions,
+    messages, CSRF and the session-backed auth user while ``/admin/`` keeps
+    the full stack.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+        routes = dict(settings.ROUTED_MIDDLEWARE)
+        try:
+            default = routes.pop("default")
+        except KeyError as exc:
+            raise ImproperlyConfigured("ROUTED_MIDDLEWARE needs a 'default' entry.") from exc
+
+        self.default_chain = MiddlewareChain(default, get_response, self.is_async)
+        self.routes: List[Tuple[str, MiddlewareChain]] = sorted(
+            (
+                (prefix, MiddlewareChain(middleware, get_response, self.is_async))
+                for prefix, middleware in routes.items()
+            ),
+            key=lambda route: len(route[0]),
+            reverse=True,
+        )
+
+    def chain_for(self, request) -> MiddlewareChain:
+        chain = getattr(request, "_middleware_chain", None)
+        if chain is None:
+            path = request.path_info
+            chain = next(
+                (chain for prefix, chain in self.routes if path.startswith(prefix)),
+                self.default_chain,
+            )
+            request._middleware_chain = chain
+        return chain
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return self.chain_for(request).handler(request)
+
+    async def __acall__(self, request):
+        return await self.chain_for(request).handler(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        for hook in self.chain_for(request).view_hooks:
+            response = hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    def process_template_response(self, request, response):
+        for hook in self.chain_for(request).template_response_hooks:
+            response = hook(request, response)
+        return response
+
+    def process_exception(self, request, exception):
+        for hook in self.chain_for(request).exception_hooks:
+            response = hook(request, exception)
+            if response is not None:
+                return response
+        return None
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.11 on 2026-10-18 22:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="RenderedMarkdown",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("content_hash", models.CharField(max_length=64)),
+                ("renderer_version", models.PositiveSmallIntegerField()),
+                ("html", models.TextField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "Rendered Markdown",
+                "verbose_name_plural": "Rendered Markdown",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="renderedmarkdown",
+            constraint=models.UniqueConstraint(
+                fields=("content_hash", "renderer_version"),
+                name="rendered_markdown_unique_version",
+            ),
+        ),
+    ]
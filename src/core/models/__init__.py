@@ -0,0 +1,3 @@
+"""Core models package exports."""
+
+from .definitions import *  # noqa: F401,F403
@@ -0,0 +1,34 @@
+"""Shared platform models."""
+
+from django.db import models
+
+
+class RenderedMarkdown(models.Model):
+    """Sanitized HTML for a markdown source, keyed by content hash and renderer version.
+
+    Shared by every object that renders markdown, so identical text (for
+    example an assignment cloned into several courses) is rendered once.
+    """
+
+    content_hash = models.CharField(max_length=64)
+    renderer_version = models.PositiveSmallIntegerField()
+    html = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=("content_hash", "renderer_version"),
+                name="rendered_markdown_unique_version",
+            ),
+        ]
+        verbose_name = "Rendered Markdown"
+        verbose_name_plural = "Rendered Markdown"
+
+    def __str__(self) -> str:
+        return f"{self.content_hash[:12]} (v{self.renderer_version})"
+
+
+__all__ = [
+    "RenderedMarkdown",
+]
@@ -3,6 +3,7 @@
 import os
 from datetime import timedelta
 from pathlib import Path
+from urllib.parse import urlsplit
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -41,6 +42,8 @@ INSTALLED_APPS = [
     "whiteboard",
     "support",
     "graphql_api",
+    "search",
+    "core",
 ]
 
 
@@ -50,15 +53,35 @@ SITE_ID = 1
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "accounts.auth.middleware.JWTCookieMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "core.db.replicas.ReadYourWritesMiddleware",
+    "core.middleware.PathRoutedMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Per-path middleware chains run by core.middleware.PathRoutedMiddleware.
+# The REST and GraphQL endpoints authenticate statelessly from JWT cookies,
+# so they skip sessions, CSRF and messages; everything else (notably
+# /admin/) keeps the full session-based stack.
+ROUTED_MIDDLEWARE = {
+    "default": [
+        "django.contrib.sessions.middleware.SessionMiddleware",
+        "django.middleware.csrf.CsrfViewMiddleware",
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "accounts.auth.middleware.JWTCookieMiddleware",
+        "django.contrib.messages.middleware.MessageMiddleware",
+    ],
+    # DRF and the async account views run their own JWT authentication.
+    "/api/": [],
+    "/graphql/": [
+        "accounts.auth.middleware.JWTCookieMiddleware",
+    ],
+}
+
+# The admin checks look for session/auth/messages middleware in MIDDLEWARE
+# itself; they are present in the default routed chain used by /admin/.
+SILENCED_SYSTEM_CHECKS = ["admin.E408", "admin.E409", "admin.E410"]
+
 
 ROOT_URLCONF = "core.urls"
 
@@ -84,12 +107,76 @@ WSGI_APPLICATION = "core.wsgi.application"
 ASGI_APPLICATION = "core.asgi.application"
 
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# DB_ENGINE=postgresql is the production profile. With DB_POOL each worker
+# process keeps a psycopg_pool of connections and returns them after every
+# request; otherwise connections persist for DB_CONN_MAX_AGE seconds. Both
+# are health-checked before reuse. QuerySet.iterator() streams through
+# server-side cursors unless DB_DISABLE_SERVER_SIDE_CURSORS is set (needed
+# behind a transaction-pooling pgbouncer).
+DB_ENGINE = os.getenv("DB_ENGINE", "sqlite3")
+DB_POOL = os.getenv("DB_POOL", "True") == "True"
+
+if DB_ENGINE == "postgresql":
+    DATABASES = {
+        "default": {
+            "ENGINE": "core.db.backends.postgresql",
+            "NAME": os.getenv("POSTGRES_DB", "cseplug"),
+            "USER": os.getenv("POSTGRES_USER", "cseplug"),
+            "PASSWORD": os.getenv("POSTGRES_PASSWORD", ""),
+            "HOST": os.getenv("POSTGRES_HOST", "127.0.0.1"),
+            "PORT": os.getenv("POSTGRES_PORT", "5432"),
+            "CONN_MAX_AGE": 0 if DB_POOL else int(os.getenv("DB_CONN_MAX_AGE", "60")),
+            "CONN_HEALTH_CHECKS": True,
+            "DISABLE_SERVER_SIDE_CURSORS": (
+                os.getenv("DB_DISABLE_SERVER_SIDE_CURSORS", "False") == "True"
+            ),
+            "OPTIONS": {
+                "connect_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", "5")),
+                "options": f"-c statement_timeout={os.getenv('DB_STATEMENT_TIMEOUT_MS', '30000')}",
+            },
+            "POOL": (
+                {
+                    "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+                    "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+                    "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+                    "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "600")),
+                    "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),
+                }
+                if DB_POOL
+                else None
+            ),
+        }
+    }
+    # Streaming replicas, e.g. DB_REPLICA_HOSTS=replica-1,replica-2. Only
+    # read-only work (GraphQL queries, admin changelists, gradebooks and
+    # exports) is sent to them; see core.db.replicas.
+    for _index, _host in enumerate(
+        host for host in os.getenv("DB_REPLICA_HOSTS", "").split(",") if host
+    ):
+        DATABASES[f"replica_{_index}"] = {
+            **DATABASES["default"],
+            "HOST": _host,
+            "TEST": {"MIRROR": "default"},
+        }
+else:
+    # WAL, synchronous=NORMAL and mmap (see core.db.backends.sqlite3) so local
+    # load tests see concurrent readers and a single writer, as in production.
+    DATABASES = {
+        "default": {
+            "ENGINE": "core.db.backends.sqlite3",
+            "NAME": os.getenv("SQLITE_PATH", str(BASE_DIR / "db.sqlite3")),
+            "OPTIONS": {"timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", "20"))},
+            "PRAGMAS": {"mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))},
+        }
     }
-}
+
+DATABASE_ROUTERS = ["core.db.routers.ReplicaRouter"]
+DB_READ_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+# After a request that writes, the user reads from the primary this long.
+DB_REPLICA_PIN_SECONDS = int(os.getenv("DB_REPLICA_PIN_SECONDS", "5"))
+# Replicas lagging further behind, or failing to connect, are skipped until re-checked.
+DB_REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", "30"))
+DB_REPLICA_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", "15"))
 
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -144,6 +231,8 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # nginx appends the client address to X-Forwarded-For.
+    "NUM_PROXIES": int(os.getenv("DJANGO_NUM_PROXIES", "1")),
 }
 
 
@@ -151,16 +240,87 @@ GRAPHENE = {
     "SCHEMA": "graphql_api.schema.schema",
 }
 
+# Persisted query manifest emitted by the frontend build (Apollo manifest or
+# {sha256: query}); with PERSISTED_QUERIES_ONLY, ad-hoc query text is rejected.
+GRAPHQL_PERSISTED_QUERIES = os.getenv(
+    "GRAPHQL_PERSISTED_QUERIES", str(BASE_DIR / "persisted-queries.json")
+)
+GRAPHQL_PERSISTED_QUERIES_ONLY = os.getenv("GRAPHQL_PERSISTED_QUERIES_ONLY", "False") == "True"
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.getenv("GRAPHQL_DOCUMENT_CACHE_SIZE", "512"))
+
+# Static analysis run before execution. Object fields cost 1 (scalars 0),
+# list and connection fields multiply by their page size; FIELD_COSTS
+# overrides individual "Type.field" costs. USER_BUDGET is a cost rate per
+# user (or IP when anonymous); an empty value disables it.
+GRAPHQL_QUERY_LIMITS = {
+    "MAX_DEPTH": int(os.getenv("GRAPHQL_MAX_DEPTH", "10")),
+    "MAX_COST": int(os.getenv("GRAPHQL_MAX_COST", "5000")),
+    "DEFAULT_LIST_SIZE": int(os.getenv("GRAPHQL_DEFAULT_LIST_SIZE", "20")),
+    "FIELD_COSTS": {},
+    "USER_BUDGET": os.getenv("GRAPHQL_USER_BUDGET", "50000/min"),
+}
+
+# Opt-in per-user cache of query results. FIELDS lists the root fields that
+# may be cached and the tag families each reads; saves and deletes of the
+# matching models bump those tags (see core.signals). A field must list
+# every family its selections can reach, including nested ones, or nested
+# data goes stale until the timeout.
+GRAPHQL_RESPONSE_CACHE = {
+    "ENABLED": os.getenv("GRAPHQL_RESPONSE_CACHE", "False") == "True",
+    "TIMEOUT": int(os.getenv("GRAPHQL_RESPONSE_CACHE_TIMEOUT", "300")),
+    "FIELDS": {
+        "course": ("course", "membership", "assignment", "whiteboard"),
+        "courseMemberships": ("membership", "course"),
+        "assignmentsConnection": ("assignment",),
+        "whiteboardSessions": ("whiteboard",),
+    },
+}
+
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
 
 CHANNEL_LAYERS = {
     "default": {
         "BACKEND": "channels_redis.core.RedisChannelLayer",
         "CONFIG": {
-            "hosts": [os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")],
+            "hosts": [REDIS_URL],
         },
     }
 }
 
+# "default" is a per-process L1 in front of the shared cache, which is Redis
+# unless CACHE_BACKEND=locmem (single-process development only). Families in
+# L1_TIMEOUTS are held locally for that many seconds: their keys are either
+# content-addressed (gql-response) or validated against shared tags on every
+# read (course-roles), so the copy cannot outlive an invalidation.
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "redis")
+CACHE_L1_TIMEOUT = int(os.getenv("CACHE_L1_TIMEOUT", "30"))
+CACHES = {
+    "default": {
+        "BACKEND": "core.caching.TieredCache",
+        "OPTIONS": {
+            "L2": "shared",
+            "L1_MAX_ENTRIES": int(os.getenv("CACHE_L1_MAX_ENTRIES", "5000")),
+            "L1_TIMEOUTS": {
+                "course-roles": CACHE_L1_TIMEOUT,
+                "gql-response": CACHE_L1_TIMEOUT,
+            },
+        },
+    },
+    "shared": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            # Defaults to database 1 of the Channels server, so clearing the
+            # cache never drops channel groups.
+            "LOCATION": os.getenv("CACHE_REDIS_URL", urlsplit(REDIS_URL)._replace(path="/1").geturl()),
+            "KEY_PREFIX": "cseplug",
+            "TIMEOUT": 300,
+        }
+        if CACHE_BACKEND == "redis"
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "shared"}
+    ),
+}
+
 
 AUTH_USER_MODEL = "accounts.User"
 
@@ -169,6 +329,21 @@ AUTHENTICATION_BACKENDS = [
     "django.contrib.auth.backends.ModelBackend",
 ]
 
+# Password hashing for the async login flow runs on a dedicated pool so slow
+# hashes never block the event loop; requests beyond the queue get a 503.
+PASSWORD_HASHING_WORKERS = int(os.getenv("PASSWORD_HASHING_WORKERS", "4"))
+PASSWORD_HASHING_MAX_PENDING = int(os.getenv("PASSWORD_HASHING_MAX_PENDING", "64"))
+
+# Sliding-window login limits, checked before any password hashing.
+LOGIN_THROTTLE_RATES = {
+    "ip": os.getenv("LOGIN_THROTTLE_IP_RATE", "30/min"),
+    "email": os.getenv("LOGIN_THROTTLE_EMAIL_RATE", "10/min"),
+}
+
+# Dotted path to a ``(question_ids, user_ids) -> [(user_id, question_id, score)]``
+# callable feeding the gradebook; scores use AssignmentQuestion.weight units.
+GRADEBOOK_SCORE_LOADER = os.getenv("GRADEBOOK_SCORE_LOADER", "")
+
 LOGIN_REDIRECT_URL = "/"
 LOGOUT_REDIRECT_URL = "/"
 
@@ -0,0 +1,57 @@
+"""Bump shared cache tags when the models cached data depends on change."""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from courses.signals import previous_course_id
+
+from .caching import course_tags, invalidate_tags, user_tag
+
+
+def _user_tags(user):
+    return [user_tag(user.pk)]
+
+
+def _course_tags(course):
+    return course_tags("course", [course.pk])
+
+
+def _membership_tags(membership):
+    return course_tags("membership", [membership.course_id]) + [user_tag(membership.user_id)]
+
+
+def _assignment_tags(assignment):
+    # The courses app stashes the stored course in pre_save, so moving an
+    # assignment invalidates both courses' entries.
+    return course_tags("assignment", [assignment.course_id, previous_course_id(assignment)])
+
+
+def _whiteboard_tags(session):
+    return course_tags("whiteboard", [session.course_id])
+
+
+# model label -> instance -> tags to bump when it is saved or deleted
+TAGGED_MODELS = {
+    "accounts.User": _user_tags,
+    "courses.Course": _course_tags,
+    "courses.CourseMembership": _membership_tags,
+    "assignments.Assignment": _assignment_tags,
+    "whiteboard.WhiteboardSession": _whiteboard_tags,
+}
+
+
+def _connect(model_label, tags_of):
+    def changed(sender, instance, raw=False, **kwargs):
+        if raw:
+            return
+        tags = tags_of(instance)
+        # After commit, so a concurrent reader cannot re-cache the old rows.
+        transaction.on_commit(lambda: invalidate_tags(tags))
+
+    uid = f"cache-tags-{model_label}"
+    post_save.connect(changed, sender=model_label, weak=False, dispatch_uid=uid)
+    post_delete.connect(changed, sender=model_label, weak=False, dispatch_uid=uid)
+
+
+for _label, _tags_of in TAGGED_MODELS.items():
+    _connect(_label, _tags_of)
@@ -0,0 +1,53 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from core.management.commands.check_query_plans import plan_problems
+
+
+class QueryPlanTests(TestCase):
+    def test_hot_queries_use_their_indexes(self):
+        out = StringIO()
+        call_command("check_query_plans", scale=5, stdout=out)
+        self.assertNotIn("FAIL", out.getvalue())
+
+    def test_missing_table_fails(self):
+        tables = [t for t in connection.introspection.table_names() if t != "courses_upcomingwork"]
+        out = StringIO()
+        with mock.patch.object(connection.introspection, "table_names", return_value=tables):
+            with self.assertRaises(CommandError):
+                call_command("check_query_plans", scale=5, stdout=out)
+        self.assertIn("FAIL  upcoming work on a student's dashboard: table not migrated", out.getvalue())
+
+
+class PlanProblemsTests(SimpleTestCase):
+    def test_postgresql(self):
+        index_plan = (
+            "Index Scan using assignment_course_publish on assignments_assignment"
+            "  (cost=0.14..8.16 rows=1 width=8)"
+        )
+        self.assertEqual(plan_problems(index_plan, "postgresql", "assignments_assignment", True), [])
+        sorted_scan = (
+            "Sort  (cost=1.05..1.06 rows=1 width=8)\n"
+            "  ->  Seq Scan on assignments_assignment  (cost=0.00..1.04 rows=1 width=8)"
+        )
+        self.assertEqual(
+            plan_problems(sorted_scan, "postgresql", "assignments_assignment", True),
+            ["sequential scan", "sort"],
+        )
+        self.assertEqual(
+            plan_problems(sorted_scan, "postgresql", "assignments_assignment", False),
+            ["sequential scan"],
+        )
+
+    def test_sqlite(self):
+        index_plan = "2 0 0 SEARCH courses_upcomingwork USING INDEX upcoming_user_due (user_id=?)"
+        self.assertEqual(plan_problems(index_plan, "sqlite", "courses_upcomingwork", True), [])
+        scan_plan = "2 0 0 SCAN courses_upcomingwork\n8 0 0 USE TEMP B-TREE FOR ORDER BY"
+        self.assertEqual(
+            plan_problems(scan_plan, "sqlite", "courses_upcomingwork", True),
+            ["sequential scan", "sort"],
+        )
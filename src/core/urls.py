@@ -1,18 +1,24 @@
 """Core URL configuration for CSE Plug."""
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 from django.views.decorators.csrf import csrf_exempt
-from graphene_django.views import GraphQLView
+
+from core.views import CacheMetricsView
+from graphql_api.views import GraphQLMetricsView, GraphQLView
 
 
 urlpatterns = [
     path("admin/", admin.site.urls),
-    path("graphql/", csrf_exempt(GraphQLView.as_view(graphiql=True))),
+    path("graphql/", csrf_exempt(GraphQLView.as_view(graphiql=settings.DEBUG))),
+    path("graphql/metrics/", GraphQLMetricsView.as_view()),
+    path("cache/metrics/", CacheMetricsView.as_view()),
     path("api/accounts/", include("accounts.api.urls", namespace="accounts")),
     path("api/courses/", include("courses.urls", namespace="courses")),
     path("api/assignments/", include("assignments.urls", namespace="assignments")),
     path("api/notes/", include("notes.urls", namespace="notes")),
     path("api/support/", include("support.urls", namespace="support")),
+    path("api/search/", include("search.urls", namespace="search")),
 ]
 
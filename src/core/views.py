@@ -0,0 +1,16 @@
+"""Operational endpoints shared across apps."""
+
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .caching import get_cache_metrics
+
+
+class CacheMetricsView(APIView):
+    """This worker's cache counters and hit rate per key family."""
+
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request):
+        return Response(get_cache_metrics().snapshot())
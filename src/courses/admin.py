@@ -2,19 +2,89 @@
 
 from django.contrib import admin
 
-from .models import Course, CourseMembership
+from core.admin import ReplicaChangelistMixin
+from search.admin import FullTextSearchAdminMixin
+
+from .models import Course, CourseMembership, CourseStats, UpcomingWork
 
 
 @admin.register(Course)
-class CourseAdmin(admin.ModelAdmin):
-    list_display = ("title", "start_date", "end_date", "created_at")
+class CourseAdmin(ReplicaChangelistMixin, FullTextSearchAdminMixin, admin.ModelAdmin):
+    list_display = (
+        "title",
+        "start_date",
+        "end_date",
+        "student_count",
+        "staff_count",
+        "assignment_count",
+        "created_at",
+    )
+    list_select_related = ("stats",)
     search_fields = ("title", "description")
+    fulltext_lookups = {"pk": "course"}
     list_filter = ("start_date", "end_date")
 
+    def _stats(self, obj):
+        try:
+            return obj.stats
+        except CourseStats.DoesNotExist:
+            return None
+
+    @admin.display(description="Students")
+    def student_count(self, obj):
+        stats = self._stats(obj)
+        return stats.student_count if stats else "–"
+
+    @admin.display(description="Staff")
+    def staff_count(self, obj):
+        stats = self._stats(obj)
+        return stats.instructor_count + stats.teaching_assistant_count if stats else "–"
+
+    @admin.display(description="Assignments")
+    def assignment_count(self, obj):
+        stats = self._stats(obj)
+        return stats.assignment_count if stats else "–"
+
+
+@admin.register(CourseStats)
+class CourseStatsAdmin(ReplicaChangelistMixin, admin.ModelAdmin):
+    list_display = (
+        "course",
+        "instructor_count",
+        "teaching_assistant_count",
+        "student_count",
+        "assignment_count",
+        "whiteboard_session_count",
+        "last_activity_at",
+        "reconciled_at",
+    )
+    list_select_related = ("course",)
+    readonly_fields = list_display
+
 
 @admin.register(CourseMembership)
-class CourseMembershipAdmin(admin.ModelAdmin):
+class CourseMembershipAdmin(ReplicaChangelistMixin, FullTextSearchAdminMixin, admin.ModelAdmin):
     list_display = ("course", "user", "role", "joined_at")
     list_filter = ("role", "course")
+    list_select_related = ("course", "user")
     search_fields = ("course__title", "user__email", "user__first_name", "user__last_name")
+    fulltext_lookups = {"course_id": "course", "user_id": "user"}
+
+
 
+@admin.register(UpcomingWork)
+class UpcomingWorkAdmin(ReplicaChangelistMixin, admin.ModelAdmin):
+    list_display = ("title", "user", "course", "published_at", "due_at", "has_extension")
+    list_filter = ("has_extension", "course")
+    list_select_related = ("user", "course")
+    search_fields = ("title", "user__email")
+    readonly_fields = (
+        "user",
+        "course",
+        "assignment",
+        "title",
+        "points",
+        "published_at",
+        "due_at",
+        "has_extension",
+    )
@@ -6,3 +6,5 @@ class CoursesConfig(AppConfig):
     name = "courses"
     verbose_name = "Courses"
 
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,214 @@
+"""Streaming roster import for course memberships."""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from typing import Dict, IO, Iterable, Iterator, List, Set
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+
+from accounts.models import User
+from accounts.provisioning import bulk_create_users
+from core.caching import course_tags, invalidate_tags, user_tag
+from graphql_api.events import Kinds, publish_course_event
+
+from . import feed
+from .models import Course, CourseMembership
+from .permissions import invalidate_course_permissions_many
+from .stats import reconcile_course_stats
+
+
+Roles = CourseMembership.Roles
+
+ROLE_ALIASES = {
+    "instructor": Roles.INSTRUCTOR,
+    "teaching_assistant": Roles.TEACHING_ASSISTANT,
+    "ta": Roles.TEACHING_ASSISTANT,
+    "student": Roles.STUDENT,
+}
+
+
+@dataclass
+class EnrollmentReport:
+    """What a roster import changed."""
+
+    processed: int = 0
+    users_created: int = 0
+    enrolled: int = 0
+    role_changed: int = 0
+    unchanged: int = 0
+    dropped: int = 0
+    invalid: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict:
+        return asdict(self)
+
+
+def iter_enrollment_csv(stream: IO[str]) -> Iterator[Dict[str, str]]:
+    """Yield ``email, role, first_name, last_name`` rows from a CSV stream."""
+
+    for row in csv.DictReader(stream):
+        yield {
+            key: (row.get(key) or "").strip()
+            for key in ("email", "role", "first_name", "last_name")
+        }
+
+
+class RosterImporter:
+    """Upsert a course's memberships from a roster in bounded-memory batches.
+
+    Each batch resolves its emails with one ``IN`` query, creates any
+    missing users (with unusable passwords), reads the current roles for
+    those users, and writes only new or changed memberships with a single
+    ``bulk_create(update_conflicts=True)`` on ``(user, course)``.
+
+    With ``drop_missing`` enabled, members whose role is in ``drop_roles``
+    and who did not appear in the roster are removed at the end. Only user
+    ids are kept across batches.
+    """
+
+    def __init__(
+        self,
+        course: Course,
+        default_role: str = Roles.STUDENT,
+        batch_size: int = 1000,
+        create_users: bool = True,
+        drop_missing: bool = False,
+        drop_roles: Iterable[str] = (Roles.STUDENT,),
+    ):
+        self.course = course
+        self.default_role = default_role
+        self.batch_size = batch_size
+        self.create_users = create_users
+        self.drop_missing = drop_missing
+        self.drop_roles = set(drop_roles)
+        self.report = EnrollmentReport()
+        self._seen: Set[int] = set()
+        self._touched: Set[int] = set()
+
+    def run(self, rows: Iterable[Dict[str, str]]) -> EnrollmentReport:
+        self.report = EnrollmentReport()
+        self._seen = set()
+        self._touched = set()
+
+        iterator = iter(rows)
+        while batch := list(islice(iterator, self.batch_size)):
+            self._process_batch(batch)
+        if self.drop_missing:
+            self._drop_missing()
+        # bulk_create skips post_save, so recount this course's members once
+        # and refresh the feed of only the members whose enrollment changed.
+        reconcile_course_stats([self.course.pk])
+        touched = list(self._touched)
+        for start in range(0, len(touched), self.batch_size):
+            feed.refresh_enrollments(touched[start : start + self.batch_size], self.course.pk)
+
+        transaction.on_commit(lambda: invalidate_course_permissions_many(touched))
+        if touched:
+            # Nor did the signals that drop cached membership responses.
+            tags = course_tags("membership", [self.course.pk])
+            tags += [user_tag(user_id) for user_id in touched]
+            transaction.on_commit(lambda: invalidate_tags(tags))
+            # One event for the batch; every open subscription re-checks its user.
+            publish_course_event(self.course.pk, Kinds.MEMBERSHIP_CHANGED, self.course.pk)
+        return self.report
+
+    def _clean(self, batch: List[Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+        cleaned: Dict[str, Dict[str, str]] = {}
+        for row in batch:
+            self.report.processed += 1
+            email = User.objects.normalize_email(row.get("email", ""))
+            role = ROLE_ALIASES.get((row.get("role") or self.default_role).lower())
+            try:
+                validate_email(email)
+            except ValidationError:
+                role = None
+            if role is None:
+                self.report.invalid += 1
+                self.report.errors.append(f"Invalid row {self.report.processed}: {row!r}")
+                continue
+            cleaned[email] = {**row, "role": role}
+        return cleaned
+
+    def _process_batch(self, batch: List[Dict[str, str]]) -> None:
+        rows = self._clean(batch)
+        user_ids = dict(User.objects.filter(email__in=rows).values_list("email", "id"))
+
+        missing = [email for email in rows if email not in user_ids]
+        if missing and self.create_users:
+            unusable = make_password(None)
+            created = bulk_create_users(
+                [
+                    User(
+                        email=email,
+                        first_name=rows[email].get("first_name", ""),
+                        last_name=rows[email].get("last_name", ""),
+                        password=unusable,
+                    )
+                    for email in missing
+                ]
+            )
+            self.report.users_created += len(created)
+            # Pick up ids for anything created concurrently as well.
+            user_ids.update(User.objects.filter(email__in=missing).values_list("email", "id"))
+
+        for email in missing:
+            if email not in user_ids:
+                self.report.invalid += 1
+                self.report.errors.append(f"No account for {email!r}.")
+
+        current = dict(
+            CourseMembership.objects.filter(
+                course=self.course, user_id__in=user_ids.values()
+            ).values_list("user_id", "role")
+        )
+
+        upserts = []
+        for email, user_id in user_ids.items():
+            role = rows[email]["role"]
+            self._seen.add(user_id)
+            existing_role = current.get(user_id)
+            if existing_role == role:
+                self.report.unchanged += 1
+                continue
+            if existing_role is None:
+                self.report.enrolled += 1
+            else:
+                self.report.role_changed += 1
+            upserts.append(CourseMembership(user_id=user_id, course=self.course, role=role))
+            self._touched.add(user_id)
+
+        if upserts:
+            CourseMembership.objects.bulk_create(
+                upserts,
+                update_conflicts=True,
+                unique_fields=["user", "course"],
+                update_fields=["role"],
+            )
+
+    def _drop_missing(self) -> None:
+        members = (
+            CourseMembership.objects.filter(course=self.course, role__in=self.drop_roles)
+            .values_list("user_id", flat=True)
+            .iterator(chunk_size=self.batch_size)
+        )
+        stale = [user_id for user_id in members if user_id not in self._seen]
+        for start in range(0, len(stale), self.batch_size):
+            chunk = stale[start : start + self.batch_size]
+            _, deleted = CourseMembership.objects.filter(
+                course=self.course, user_id__in=chunk
+            ).delete()
+            self.report.dropped += deleted.get(CourseMembership._meta.label, 0)
+            self._touched.update(chunk)
+
+
+def import_roster(course: Course, rows: Iterable[Dict[str, str]], **options) -> EnrollmentReport:
+    """Convenience wrapper around :class:`RosterImporter`."""
+
+    return RosterImporter(course, **options).run(rows)
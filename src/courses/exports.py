@@ -0,0 +1,27 @@
+"""Row generators for course CSV exports."""
+
+from __future__ import annotations
+
+from typing import Iterator, Optional, Tuple
+
+from .models import CourseMembership
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+ROSTER_HEADER = ("email", "first_name", "last_name", "role", "joined_at")
+
+
+def iter_roster_rows(course_id: int, using: Optional[str] = None) -> Iterator[Tuple]:
+    """One row per member, read through a server-side cursor where supported."""
+
+    queryset = (
+        CourseMembership.objects.using(using)
+        .filter(course_id=course_id)
+        .order_by("role", "user__email")
+        .values_list("user__email", "user__first_name", "user__last_name", "role", "joined_at")
+    )
+    for email, first_name, last_name, role, joined_at in queryset.iterator(
+        chunk_size=EXPORT_CHUNK_SIZE
+    ):
+        yield email, first_name, last_name, role, joined_at.isoformat()
@@ -0,0 +1,227 @@
+"""Materialized per-student upcoming-work feed."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import CourseMembership, UpcomingWork
+
+
+# Items stay on the feed for this long after their deadline passes.
+RETENTION = timedelta(days=1)
+
+FEED_FIELDS = ("course", "title", "points", "published_at", "due_at", "has_extension")
+
+
+def _assignments():
+    return apps.get_model("assignments", "Assignment")
+
+
+def _extensions():
+    return apps.get_model("assignments", "AssignmentExtension")
+
+
+def _is_published(assignment, now: datetime) -> bool:
+    return assignment.publish_at is None or assignment.publish_at <= now
+
+
+def _items(
+    assignment, student_ids: Iterable[int], extensions: dict, now: datetime
+) -> List[UpcomingWork]:
+    # Deadlines past retention are what prune() removes; never write them back.
+    cutoff = now - RETENTION
+    items = []
+    for user_id in student_ids:
+        due_at = extensions.get(user_id, assignment.due_at)
+        if due_at is not None and due_at < cutoff:
+            continue
+        items.append(
+            UpcomingWork(
+                user_id=user_id,
+                course_id=assignment.course_id,
+                assignment_id=assignment.pk,
+                title=assignment.title,
+                points=assignment.points,
+                published_at=assignment.publish_at,
+                due_at=due_at,
+                has_extension=user_id in extensions,
+            )
+        )
+    return items
+
+
+def _write(items: List[UpcomingWork]) -> None:
+    if items:
+        UpcomingWork.objects.bulk_create(
+            items,
+            update_conflicts=True,
+            unique_fields=["user", "assignment"],
+            update_fields=FEED_FIELDS,
+        )
+
+
+def _student_ids(course_id: int, user_ids: Optional[Iterable[int]] = None) -> List[int]:
+    students = CourseMembership.objects.filter(
+        course_id=course_id, role=CourseMembership.Roles.STUDENT
+    )
+    if user_ids is not None:
+        students = students.filter(user_id__in=list(user_ids))
+    return list(students.values_list("user_id", flat=True))
+
+
+@transaction.atomic
+def refresh_assignment(assignment_id: int, now: Optional[datetime] = None) -> int:
+    """Rewrite one assignment's rows for every student in its course."""
+
+    now = now or timezone.now()
+    assignment = _assignments().objects.filter(pk=assignment_id).first()
+    if assignment is None or not _is_published(assignment, now):
+        UpcomingWork.objects.filter(assignment_id=assignment_id).delete()
+        return 0
+
+    extensions = dict(
+        _extensions().objects.filter(assignment_id=assignment_id).values_list("user_id", "due_at")
+    )
+    items = _items(assignment, _student_ids(assignment.course_id), extensions, now)
+    # Drop rows for students who left or are past retention, or for a course
+    # the assignment moved from.
+    UpcomingWork.objects.filter(assignment_id=assignment_id).filter(
+        ~Q(course_id=assignment.course_id) | ~Q(user_id__in=[item.user_id for item in items])
+    ).delete()
+    _write(items)
+    return len(items)
+
+
+@transaction.atomic
+def refresh_enrollments(
+    user_ids: Iterable[int], course_id: int, now: Optional[datetime] = None
+) -> int:
+    """Rebuild the given users' rows for one course after their enrollments change."""
+
+    now = now or timezone.now()
+    user_ids = list(user_ids)
+    UpcomingWork.objects.filter(user_id__in=user_ids, course_id=course_id).delete()
+    student_ids = list(
+        CourseMembership.objects.filter(
+            user_id__in=user_ids, course_id=course_id, role=CourseMembership.Roles.STUDENT
+        ).values_list("user_id", flat=True)
+    )
+    if not student_ids:
+        return 0
+
+    assignments = _assignments().objects.filter(course_id=course_id).filter(
+        Q(publish_at__isnull=True) | Q(publish_at__lte=now)
+    )
+    extensions = defaultdict(dict)
+    for assignment_id, user_id, due_at in (
+        _extensions()
+        .objects.filter(user_id__in=student_ids, assignment__course_id=course_id)
+        .values_list("assignment_id", "user_id", "due_at")
+    ):
+        extensions[assignment_id][user_id] = due_at
+    items = []
+    for assignment in assignments:
+        items.extend(_items(assignment, student_ids, extensions.get(assignment.pk, {}), now))
+    _write(items)
+    return len(items)
+
+
+def refresh_enrollment(user_id: int, course_id: int, now: Optional[datetime] = None) -> int:
+    """Rebuild one student's rows for one course after their enrollment changes."""
+
+    return refresh_enrollments([user_id], course_id, now)
+
+
+@transaction.atomic
+def refresh_extension(assignment_id: int, user_id: int, now: Optional[datetime] = None) -> int:
+    """Re-resolve one student's deadline after an extension is granted or revoked.
+
+    The row is rebuilt rather than updated in place, so an extension that
+    moves a pruned deadline back into range brings the item back.
+    """
+
+    now = now or timezone.now()
+    rows = UpcomingWork.objects.filter(assignment_id=assignment_id, user_id=user_id)
+    assignment = _assignments().objects.filter(pk=assignment_id).first()
+    if (
+        assignment is None
+        or not _is_published(assignment, now)
+        or user_id not in _student_ids(assignment.course_id, [user_id])
+    ):
+        rows.delete()
+        return 0
+
+    extensions = dict(
+        _extensions()
+        .objects.filter(assignment_id=assignment_id, user_id=user_id)
+        .values_list("user_id", "due_at")
+    )
+    items = _items(assignment, [user_id], extensions, now)
+    if not items:
+        rows.delete()
+    _write(items)
+    return len(items)
+
+
+def publish_due(since: datetime, until: datetime) -> List[int]:
+    """Materialize assignments whose ``publish_at`` falls in ``(since, until]``."""
+
+    assignment_ids = list(
+        _assignments()
+        .objects.filter(publish_at__gt=since, publish_at__lte=until)
+        .values_list("pk", flat=True)
+    )
+    for assignment_id in assignment_ids:
+        refresh_assignment(assignment_id, now=until)
+    return assignment_ids
+
+
+def next_publish_at(after: datetime) -> Optional[datetime]:
+    return (
+        _assignments()
+        .objects.filter(publish_at__gt=after)
+        .order_by("publish_at")
+        .values_list("publish_at", flat=True)
+        .first()
+    )
+
+
+def prune(now: Optional[datetime] = None) -> int:
+    """Remove items whose deadline passed more than ``RETENTION`` ago."""
+
+    cutoff = (now or timezone.now()) - RETENTION
+    deleted, _ = UpcomingWork.objects.filter(due_at__lt=cutoff).delete()
+    return deleted
+
+
+def rebuild(course_ids: Optional[Iterable[int]] = None) -> int:
+    """Recompute the feed from scratch for the given courses (all by default)."""
+
+    assignments = _assignments().objects.all()
+    if course_ids is not None:
+        course_ids = list(course_ids)
+        assignments = assignments.filter(course_id__in=course_ids)
+        UpcomingWork.objects.filter(course_id__in=course_ids).delete()
+    else:
+        UpcomingWork.objects.all().delete()
+    total = 0
+    for assignment_id in assignments.order_by("pk").values_list("pk", flat=True).iterator():
+        total += refresh_assignment(assignment_id)
+    return total
+
+
+def upcoming_for(user, now: Optional[datetime] = None, include_past_due: bool = False):
+    """The student's feed, read from the ``(user, due_at)`` index."""
+
+    now = now or timezone.now()
+    queryset = UpcomingWork.objects.filter(user=user).select_related("course")
+    if not include_past_due:
+        queryset = queryset.filter(Q(due_at__gte=now) | Q(due_at__isnull=True))
+    return queryset.order_by(F("due_at").asc(nulls_last=True), "assignment_id")
@@ -0,0 +1,80 @@
+"""Import or sync a course roster from CSV."""
+
+from __future__ import annotations
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from courses.enrollment import ROLE_ALIASES, RosterImporter, iter_enrollment_csv
+from courses.models import Course
+
+
+class Command(BaseCommand):
+    help = (
+        "Enroll users into a course from a CSV with columns email, role "
+        "(instructor, teaching_assistant/ta, student), first_name, last_name."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("course_id", type=int)
+        parser.add_argument("roster", help="Path to the CSV roster, or '-' for stdin.")
+        parser.add_argument("--role", default="student", choices=sorted(ROLE_ALIASES))
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--no-create-users",
+            action="store_true",
+            help="Report unknown emails instead of creating accounts for them.",
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Drop members (of --drop-role roles) that are missing from the roster.",
+        )
+        parser.add_argument(
+            "--drop-role",
+            action="append",
+            dest="drop_roles",
+            choices=sorted(ROLE_ALIASES),
+            help="Role eligible for dropping with --sync; repeatable (default: student).",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Roll back after reporting.")
+
+    def handle(self, *args, **options):
+        try:
+            course = Course.objects.get(pk=options["course_id"])
+        except Course.DoesNotExist as exc:
+            raise CommandError(f"Course {options['course_id']} does not exist.") from exc
+
+        importer = RosterImporter(
+            course,
+            default_role=ROLE_ALIASES[options["role"]],
+            batch_size=options["batch_size"],
+            create_users=not options["no_create_users"],
+            drop_missing=options["sync"],
+            drop_roles=[ROLE_ALIASES[role] for role in options["drop_roles"] or ["student"]],
+        )
+
+        with transaction.atomic():
+            if options["roster"] == "-":
+                report = importer.run(iter_enrollment_csv(sys.stdin))
+            else:
+                try:
+                    with open(options["roster"], newline="", encoding="utf-8") as stream:
+                        report = importer.run(iter_enrollment_csv(stream))
+                except OSError as exc:
+                    raise CommandError(str(exc)) from exc
+            if options["dry_run"]:
+                transaction.set_rollback(True)
+
+        for error in report.errors:
+            self.stderr.write(error)
+        prefix = "[dry run] " if options["dry_run"] else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}{course}: {report.enrolled} enrolled, {report.role_changed} role changes, "
+                f"{report.dropped} dropped, {report.unchanged} unchanged, "
+                f"{report.users_created} accounts created, {report.invalid} invalid rows."
+            )
+        )
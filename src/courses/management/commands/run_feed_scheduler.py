@@ -0,0 +1,74 @@
+"""Publish assignments onto student feeds as their ``publish_at`` passes."""
+
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from core.caching import course_tags, invalidate_tags
+from courses import feed
+from graphql_api.events import publish_assignments
+
+
+class Command(BaseCommand):
+    help = (
+        "Sleep until the next Assignment.publish_at boundary, then add newly "
+        "published assignments to students' upcoming-work feeds and notify "
+        "GraphQL subscribers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-sleep",
+            type=int,
+            default=300,
+            help="Longest wait in seconds between checks, so new assignments are noticed.",
+        )
+        parser.add_argument(
+            "--catch-up",
+            type=int,
+            default=60,
+            help="On start, publish anything that became visible in the last N minutes.",
+        )
+        parser.add_argument("--once", action="store_true", help="Run a single pass and exit.")
+        parser.add_argument("--rebuild", action="store_true", help="Rebuild every feed first.")
+
+    def handle(self, *args, **options):
+        if options["rebuild"]:
+            self.stdout.write(f"Rebuilt {feed.rebuild()} feed items.")
+
+        last_tick = timezone.now() - timedelta(minutes=options["catch_up"])
+        while True:
+            now = timezone.now()
+            published = feed.publish_due(last_tick, now)
+            if published:
+                assignments = list(
+                    apps.get_model("assignments", "Assignment")
+                    .objects.filter(pk__in=published)
+                    .only("pk", "course_id")
+                )
+                # Becoming visible writes nothing, so no signal dropped the
+                # cached responses that still leave these assignments out.
+                invalidate_tags(
+                    course_tags("assignment", {assignment.course_id for assignment in assignments})
+                )
+                publish_assignments(assignments)
+            pruned = feed.prune(now)
+            if published or pruned:
+                self.stdout.write(
+                    f"{now:%Y-%m-%d %H:%M:%S} published {len(published)} assignments, "
+                    f"pruned {pruned} items"
+                )
+            last_tick = now
+            if options["once"]:
+                return
+
+            upcoming = feed.next_publish_at(now)
+            sleep_for = options["max_sleep"]
+            if upcoming is not None:
+                sleep_for = min(sleep_for, max((upcoming - timezone.now()).total_seconds(), 0))
+            close_old_connections()
+            time.sleep(sleep_for)
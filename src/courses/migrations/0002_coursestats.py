@@ -0,0 +1,40 @@
+# Generated by Django 4.2.11 on 2026-10-18 22:15
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseStats",
+            fields=[
+                (
+                    "course",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="courses.course",
+                    ),
+                ),
+                ("instructor_count", models.PositiveIntegerField(default=0)),
+                ("teaching_assistant_count", models.PositiveIntegerField(default=0)),
+                ("student_count", models.PositiveIntegerField(default=0)),
+                ("assignment_count", models.PositiveIntegerField(default=0)),
+                ("whiteboard_session_count", models.PositiveIntegerField(default=0)),
+                ("last_activity_at", models.DateTimeField(blank=True, null=True)),
+                ("reconciled_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Course Stats",
+                "verbose_name_plural": "Course Stats",
+            },
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.11 on 2026-10-18 22:28
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("courses", "0002_coursestats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UpcomingWork",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("assignment_id", models.PositiveBigIntegerField()),
+                ("title", models.CharField(max_length=255)),
+                ("points", models.DecimalField(decimal_places=2, max_digits=7)),
+                ("published_at", models.DateTimeField(blank=True, null=True)),
+                ("due_at", models.DateTimeField(blank=True, null=True)),
+                ("has_extension", models.BooleanField(default=False)),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="courses.course",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="upcoming_work",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Upcoming Work",
+                "verbose_name_plural": "Upcoming Work",
+                "ordering": ("user", "due_at"),
+                "indexes": [
+                    models.Index(
+                        fields=["user", "due_at"], name="upcoming_work_user_due"
+                    ),
+                    models.Index(
+                        fields=["assignment_id"], name="upcoming_work_assignment"
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="upcomingwork",
+            constraint=models.UniqueConstraint(
+                fields=("user", "assignment_id"), name="upcoming_work_unique_assignment"
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.11 on 2026-10-18 22:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0003_upcomingwork"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="coursemembership",
+            index=models.Index(
+                fields=["course", "role", "user"], name="course_membership_course_role"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="coursemembership",
+            name="course",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="memberships",
+                to="courses.course",
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.11 on 2026-10-18 23:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def delete_orphaned_items(apps, schema_editor):
+    # Feed rows are derived data; drop any whose assignment is gone before
+    # the foreign key constraint is added.
+    UpcomingWork = apps.get_model("courses", "UpcomingWork")
+    Assignment = apps.get_model("assignments", "Assignment")
+    UpcomingWork.objects.exclude(
+        assignment_id__in=Assignment.objects.values("pk")
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assignments", "0001_initial"),
+        ("courses", "0004_coursemembership_course_role_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_orphaned_items, migrations.RunPython.noop),
+        migrations.RemoveConstraint(
+            model_name="upcomingwork",
+            name="upcoming_work_unique_assignment",
+        ),
+        migrations.RemoveIndex(
+            model_name="upcomingwork",
+            name="upcoming_work_assignment",
+        ),
+        migrations.RenameField(
+            model_name="upcomingwork",
+            old_name="assignment_id",
+            new_name="assignment",
+        ),
+        migrations.AlterField(
+            model_name="upcomingwork",
+            name="assignment",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="assignments.assignment",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="upcomingwork",
+            constraint=models.UniqueConstraint(
+                fields=("user", "assignment"), name="upcoming_work_unique_assignment"
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.11 on 2026-10-18 23:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0005_upcomingwork_assignment_fk"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="coursemembership",
+            index=models.Index(
+                fields=["course", "-joined_at", "id"], name="course_membership_joined"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="coursemembership",
+            index=models.Index(
+                fields=["user", "-joined_at", "id"],
+                name="course_membership_user_joined",
+            ),
+        ),
+    ]
@@ -42,12 +42,25 @@ class CourseMembership(models.Model):
         Course,
         on_delete=models.CASCADE,
         related_name="memberships",
+        # Covered by the leading column of ``course_membership_course_role``.
+        db_index=False,
     )
     role = models.CharField(max_length=32, choices=Roles.choices)
     joined_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         unique_together = ("user", "course")
+        indexes = [
+            # Per-course role lookups; ``user`` last so student lists come back in
+            # gradebook order without a sort.
+            models.Index(fields=("course", "role", "user"), name="course_membership_course_role"),
+            # Keyset pages of a course's members and of a user's courses, in
+            # graphql_api.pagination.COURSE_MEMBERSHIP_ORDERING.
+            models.Index(
+                fields=("course", "-joined_at", "id"), name="course_membership_joined"
+            ),
+            models.Index(fields=("user", "-joined_at", "id"), name="course_membership_user_joined"),
+        ]
         verbose_name = "Course Membership"
         verbose_name_plural = "Course Memberships"
 
@@ -55,5 +68,85 @@ class CourseMembership(models.Model):
         return f"{self.user.email} → {self.course.title} ({self.get_role_display()})"
 
 
-__all__ = ["Course", "CourseMembership"]
+class CourseStats(models.Model):
+    """Denormalized per-course counters kept current by signals.
+
+    Lets course lists render member/assignment/session counts with a single
+    ``select_related("stats")`` query instead of COUNT aggregations.
+    ``reconcile_course_stats`` recomputes them to correct any drift.
+    """
+
+    course = models.OneToOneField(
+        Course,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+    )
+    instructor_count = models.PositiveIntegerField(default=0)
+    teaching_assistant_count = models.PositiveIntegerField(default=0)
+    student_count = models.PositiveIntegerField(default=0)
+    assignment_count = models.PositiveIntegerField(default=0)
+    whiteboard_session_count = models.PositiveIntegerField(default=0)
+    last_activity_at = models.DateTimeField(null=True, blank=True)
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Course Stats"
+        verbose_name_plural = "Course Stats"
+
+    def __str__(self) -> str:
+        return f"Stats for course {self.course_id}"
+
+    @property
+    def member_count(self) -> int:
+        return self.instructor_count + self.teaching_assistant_count + self.student_count
+
+
+class UpcomingWork(models.Model):
+    """One published assignment on a student's materialized upcoming-work feed.
+
+    ``due_at`` is already the student's effective deadline (extension or
+    assignment due date), so the dashboard is a single indexed read by
+    ``(user, due_at)``.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="upcoming_work",
+    )
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    assignment = models.ForeignKey(
+        "assignments.Assignment",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    title = models.CharField(max_length=255)
+    points = models.DecimalField(max_digits=7, decimal_places=2)
+    published_at = models.DateTimeField(null=True, blank=True)
+    due_at = models.DateTimeField(null=True, blank=True)
+    has_extension = models.BooleanField(default=False)
+
+    class Meta:
+        ordering = ("user", "due_at")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("user", "assignment"), name="upcoming_work_unique_assignment"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=("user", "due_at"), name="upcoming_work_user_due"),
+        ]
+        verbose_name = "Upcoming Work"
+        verbose_name_plural = "Upcoming Work"
+
+    def __str__(self) -> str:
+        return f"{self.title} for user {self.user_id}"
+
+
+__all__ = ["Course", "CourseMembership", "CourseStats", "UpcomingWork"]
 
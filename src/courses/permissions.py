@@ -0,0 +1,120 @@
+"""Course permission resolution backed by a per-user membership map."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional
+
+from asgiref.sync import sync_to_async
+from rest_framework.permissions import BasePermission
+
+from core.caching import cached, invalidate_tags, user_tag
+
+from .models import CourseMembership
+
+
+CACHE_TIMEOUT = 60 * 15
+
+Roles = CourseMembership.Roles
+
+
+def _cache_key(user_id: int) -> str:
+    return f"course-roles:{user_id}"
+
+
+def invalidate_course_permissions(user_id: int) -> None:
+    """Drop the cached membership map for a user."""
+
+    invalidate_tags([user_tag(user_id)])
+
+
+def invalidate_course_permissions_many(user_ids: Iterable[int]) -> None:
+    """Drop cached membership maps after bulk writes that bypass signals."""
+
+    invalidate_tags(user_tag(user_id) for user_id in user_ids)
+
+
+class CoursePermissions:
+    """Answers course access questions for one user from a single lookup.
+
+    The full ``course_id -> role`` map is loaded once (from the cache, or one
+    query on a miss) and every ``is_member`` / ``is_instructor`` / ``is_ta``
+    check is a dictionary lookup. Use :func:`get_course_permissions` to share
+    one instance per request, or keep one per WebSocket connection.
+    """
+
+    def __init__(self, user, roles: Dict[int, str]):
+        self.user = user
+        self.roles = roles
+
+    @classmethod
+    def anonymous(cls, user=None) -> "CoursePermissions":
+        return cls(user, {})
+
+    @classmethod
+    def for_user(cls, user) -> "CoursePermissions":
+        if user is None or not user.is_authenticated:
+            return cls.anonymous(user)
+        roles = cached(
+            _cache_key(user.pk),
+            lambda: dict(
+                CourseMembership.objects.filter(user_id=user.pk).values_list("course_id", "role")
+            ),
+            CACHE_TIMEOUT,
+            tags=[user_tag(user.pk)],
+        )
+        return cls(user, roles)
+
+    @classmethod
+    async def afor_user(cls, user) -> "CoursePermissions":
+        if user is None or not user.is_authenticated:
+            return cls.anonymous(user)
+        # A fill may wait on another worker's, which must not block the event loop.
+        return await sync_to_async(cls.for_user)(user)
+
+    @property
+    def course_ids(self):
+        return self.roles.keys()
+
+    def role(self, course_id) -> Optional[str]:
+        return self.roles.get(int(course_id))
+
+    def is_member(self, course_id) -> bool:
+        return self.role(course_id) is not None
+
+    def is_instructor(self, course_id) -> bool:
+        return self.role(course_id) == Roles.INSTRUCTOR
+
+    def is_ta(self, course_id) -> bool:
+        return self.role(course_id) == Roles.TEACHING_ASSISTANT
+
+    def is_student(self, course_id) -> bool:
+        return self.role(course_id) == Roles.STUDENT
+
+    def is_course_staff(self, course_id) -> bool:
+        """Instructors and teaching assistants."""
+
+        return self.role(course_id) in (Roles.INSTRUCTOR, Roles.TEACHING_ASSISTANT)
+
+
+def get_course_permissions(request) -> CoursePermissions:
+    """Return the request-scoped :class:`CoursePermissions` for ``request.user``."""
+
+    user = getattr(request, "user", None)
+    permissions = getattr(request, "_course_permissions", None)
+    if permissions is None or permissions.user is not user:
+        permissions = CoursePermissions.for_user(user)
+        request._course_permissions = permissions
+    return permissions
+
+
+class IsCourseStaff(BasePermission):
+    """Instructors and TAs of the course named by the ``course_id`` URL kwarg, or site staff."""
+
+    def has_permission(self, request, view):
+        user = request.user
+        if not user or not user.is_authenticated:
+            return False
+        if user.is_staff:
+            return True
+        course_id = view.kwargs.get("course_id")
+        return course_id is not None and get_course_permissions(request).is_course_staff(course_id)
@@ -0,0 +1,138 @@
+"""Signal handlers for the courses app."""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import feed
+from .models import Course, CourseMembership, CourseStats, UpcomingWork
+from .stats import ROLE_FIELDS, bump_course_stats
+
+
+@receiver(post_save, sender=Course)
+def course_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        CourseStats.objects.get_or_create(course=instance)
+
+
+def _remember_previous(sender, instance, fields, raw=False):
+    """Stash the stored values of ``fields`` so post_save can compute deltas."""
+
+    if raw or instance._state.adding or instance.pk is None:
+        instance._stats_previous = None
+        return
+    instance._stats_previous = (
+        sender._base_manager.filter(pk=instance.pk).values(*fields).first()
+    )
+
+
+def previous_course_id(instance):
+    """The stored ``course_id`` of an instance being saved, as stashed in pre_save."""
+
+    previous = getattr(instance, "_stats_previous", None)
+    return previous["course_id"] if previous is not None else None
+
+
+@receiver(pre_save, sender=CourseMembership)
+def membership_pre_save(sender, instance, raw=False, **kwargs):
+    _remember_previous(sender, instance, ("course_id", "role"), raw)
+
+
+@receiver(post_save, sender=CourseMembership)
+def membership_stats_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        bump_course_stats(instance.course_id, **{ROLE_FIELDS[instance.role]: 1})
+        return
+    previous = getattr(instance, "_stats_previous", None)
+    if previous is None or previous == {"course_id": instance.course_id, "role": instance.role}:
+        return
+    bump_course_stats(previous["course_id"], **{ROLE_FIELDS[previous["role"]]: -1})
+    bump_course_stats(instance.course_id, **{ROLE_FIELDS[instance.role]: 1})
+
+
+@receiver(post_delete, sender=CourseMembership)
+def membership_stats_deleted(sender, instance, **kwargs):
+    bump_course_stats(instance.course_id, **{ROLE_FIELDS[instance.role]: -1})
+
+
+def _connect_course_counter(model_label: str, field: str) -> None:
+    """Keep ``field`` in sync with rows of ``model_label`` that carry a ``course`` FK."""
+
+    def pre_save_handler(sender, instance, raw=False, **kwargs):
+        _remember_previous(sender, instance, ("course_id",), raw)
+
+    def post_save_handler(sender, instance, created, raw=False, **kwargs):
+        if raw:
+            return
+        previous = getattr(instance, "_stats_previous", None)
+        if created:
+            bump_course_stats(instance.course_id, **{field: 1})
+        elif previous is not None and previous["course_id"] != instance.course_id:
+            bump_course_stats(previous["course_id"], **{field: -1})
+            bump_course_stats(instance.course_id, **{field: 1})
+
+    def post_delete_handler(sender, instance, **kwargs):
+        bump_course_stats(instance.course_id, **{field: -1})
+
+    uid = f"course-stats-{model_label}"
+    pre_save.connect(pre_save_handler, sender=model_label, weak=False, dispatch_uid=uid)
+    post_save.connect(post_save_handler, sender=model_label, weak=False, dispatch_uid=uid)
+    post_delete.connect(post_delete_handler, sender=model_label, weak=False, dispatch_uid=uid)
+
+
+_connect_course_counter("assignments.Assignment", "assignment_count")
+_connect_course_counter("whiteboard.WhiteboardSession", "whiteboard_session_count")
+
+
+FEED_ASSIGNMENT_FIELDS = {"course", "course_id", "title", "points", "publish_at", "due_at"}
+
+
+@receiver(post_save, sender=CourseMembership)
+def membership_feed_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_stats_previous", None)
+    courses = {instance.course_id}
+    if previous is not None:
+        courses.add(previous["course_id"])
+    user_id = instance.user_id
+
+    def refresh():
+        for course_id in courses:
+            feed.refresh_enrollment(user_id, course_id)
+
+    transaction.on_commit(refresh)
+
+
+@receiver(post_delete, sender=CourseMembership)
+def membership_feed_deleted(sender, instance, **kwargs):
+    UpcomingWork.objects.filter(user_id=instance.user_id, course_id=instance.course_id).delete()
+
+
+def assignment_feed_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and not FEED_ASSIGNMENT_FIELDS.intersection(update_fields)):
+        return
+    assignment_id = instance.pk
+    transaction.on_commit(lambda: feed.refresh_assignment(assignment_id))
+
+
+def extension_feed_changed(sender, instance, **kwargs):
+    assignment_id, user_id = instance.assignment_id, instance.user_id
+    transaction.on_commit(lambda: feed.refresh_extension(assignment_id, user_id))
+
+
+post_save.connect(
+    assignment_feed_saved, sender="assignments.Assignment", dispatch_uid="upcoming-work-assignment"
+)
+post_save.connect(
+    extension_feed_changed,
+    sender="assignments.AssignmentExtension",
+    dispatch_uid="upcoming-work-extension",
+)
+post_delete.connect(
+    extension_feed_changed,
+    sender="assignments.AssignmentExtension",
+    dispatch_uid="upcoming-work-extension",
+)
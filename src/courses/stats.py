@@ -0,0 +1,112 @@
+"""Incremental maintenance and reconciliation of ``CourseStats``."""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from django.apps import apps
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from .models import Course, CourseMembership, CourseStats
+
+
+Roles = CourseMembership.Roles
+
+ROLE_FIELDS = {
+    Roles.INSTRUCTOR: "instructor_count",
+    Roles.TEACHING_ASSISTANT: "teaching_assistant_count",
+    Roles.STUDENT: "student_count",
+}
+
+COUNTER_FIELDS = (
+    "instructor_count",
+    "teaching_assistant_count",
+    "student_count",
+    "assignment_count",
+    "whiteboard_session_count",
+)
+
+
+def bump_course_stats(course_id: int, **deltas: int) -> None:
+    """Apply counter deltas to one course's stats row with a single UPDATE.
+
+    A missing row (courses created before stats existed) is left for
+    :func:`reconcile_course_stats` rather than recomputed inline.
+    """
+
+    updates = {
+        field: Greatest(F(field) + Value(delta), Value(0))
+        for field, delta in deltas.items()
+        if delta
+    }
+    if not updates:
+        return
+    CourseStats.objects.filter(course_id=course_id).update(
+        last_activity_at=timezone.now(), **updates
+    )
+
+
+def _count_subquery(model, **filters) -> Coalesce:
+    counts = (
+        model.objects.filter(course=OuterRef("pk"), **filters)
+        .order_by()
+        .values("course")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def reconcile_course_stats(
+    course_ids: Optional[Iterable[int]] = None, batch_size: int = 500
+) -> int:
+    """Recompute counters from the source tables and upsert them.
+
+    Runs one aggregate query per batch of courses. Returns the number of
+    courses reconciled.
+    """
+
+    Assignment = apps.get_model("assignments", "Assignment")
+    WhiteboardSession = apps.get_model("whiteboard", "WhiteboardSession")
+
+    courses = Course.objects.order_by("pk")
+    if course_ids is not None:
+        courses = courses.filter(pk__in=list(course_ids))
+    rows = courses.annotate(
+        **{
+            field: _count_subquery(CourseMembership, role=role)
+            for role, field in ROLE_FIELDS.items()
+        },
+        assignment_count=_count_subquery(Assignment),
+        whiteboard_session_count=_count_subquery(WhiteboardSession),
+    ).values("pk", *COUNTER_FIELDS)
+
+    now = timezone.now()
+    reconciled = 0
+    batch = []
+    for row in rows.iterator(chunk_size=batch_size):
+        batch.append(
+            CourseStats(
+                course_id=row["pk"],
+                reconciled_at=now,
+                **{field: row[field] for field in COUNTER_FIELDS},
+            )
+        )
+        if len(batch) >= batch_size:
+            reconciled += _upsert(batch)
+            batch = []
+    reconciled += _upsert(batch)
+    return reconciled
+
+
+def _upsert(batch) -> int:
+    if batch:
+        CourseStats.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=["course"],
+            update_fields=[*COUNTER_FIELDS, "reconciled_at"],
+        )
+    return len(batch)
@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import User
+from assignments.models import Assignment, AssignmentExtension
+from courses.models import Course, CourseMembership, UpcomingWork
+
+
+class RefreshExtensionTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.course = Course.objects.create(title="Compilers")
+        self.student = User.objects.create_user(email="ada@example.com", password="x")
+        CourseMembership.objects.create(
+            course=self.course, user=self.student, role=CourseMembership.Roles.STUDENT
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assignment = Assignment.objects.create(
+                course=self.course, title="Parser", due_at=self.now - timedelta(days=3)
+            )
+
+    def _rows(self):
+        return UpcomingWork.objects.filter(assignment=self.assignment, user=self.student)
+
+    def test_extension_brings_a_pruned_deadline_back(self):
+        self.assertFalse(self._rows().exists())
+        due_at = self.now + timedelta(days=2)
+        with self.captureOnCommitCallbacks(execute=True):
+            extension = AssignmentExtension.objects.create(
+                assignment=self.assignment, user=self.student, due_at=due_at
+            )
+        row = self._rows().get()
+        self.assertEqual((row.due_at, row.has_extension), (due_at, True))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            extension.delete()
+        self.assertFalse(self._rows().exists())
+
+    def test_extension_for_a_non_student_adds_nothing(self):
+        staff = User.objects.create_user(email="grace@example.com", password="x")
+        with self.captureOnCommitCallbacks(execute=True):
+            AssignmentExtension.objects.create(
+                assignment=self.assignment, user=staff, due_at=self.now + timedelta(days=2)
+            )
+        self.assertFalse(UpcomingWork.objects.filter(user=staff).exists())
@@ -2,7 +2,11 @@
 
 from django.urls import path
 
-app_name = "courses"
+from .views import RosterExportView, UpcomingWorkView
 
-urlpatterns: list = []
+app_name = "courses"
 
+urlpatterns = [
+    path("upcoming/", UpcomingWorkView.as_view(), name="upcoming-work"),
+    path("<int:course_id>/roster.csv", RosterExportView.as_view(), name="roster-export"),
+]
@@ -0,0 +1,48 @@
+"""API views for the courses app."""
+
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.db.replicas import replica_for
+from core.exports import csv_response
+
+from .exports import ROSTER_HEADER, iter_roster_rows
+from .feed import upcoming_for
+from .permissions import IsCourseStaff
+
+
+class UpcomingWorkView(APIView):
+    """The signed-in student's upcoming assignments across all their courses."""
+
+    permission_classes = (permissions.IsAuthenticated,)
+
+    def get(self, request):
+        items = [
+            {
+                "assignment_id": item.assignment_id,
+                "course_id": item.course_id,
+                "course_title": item.course.title,
+                "title": item.title,
+                "points": float(item.points),
+                "published_at": item.published_at,
+                "due_at": item.due_at,
+                "has_extension": item.has_extension,
+            }
+            for item in upcoming_for(request.user)
+        ]
+        return Response({"results": items}, status=status.HTTP_200_OK)
+
+
+class RosterExportView(APIView):
+    """Stream the course roster as CSV."""
+
+    permission_classes = (IsCourseStaff,)
+
+    def get(self, request, course_id):
+        return csv_response(
+            request,
+            f"course-{course_id}-roster.csv",
+            ROSTER_HEADER,
+            iter_roster_rows(course_id, using=replica_for(request)),
+        )
@@ -0,0 +1,193 @@
+"""GraphQL over WebSocket (graphql-ws protocols) for subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import AsyncIterator, Dict, Set
+
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from graphene_django.settings import graphene_settings
+from graphql import ExecutionResult, GraphQLError, OperationType, get_operation_ast, subscribe
+
+from .documents import get_document_cache
+from .events import course_group
+
+
+logger = logging.getLogger(__name__)
+
+# ``graphql-transport-ws`` is the protocol of the graphql-ws library;
+# ``graphql-ws`` is the older subscriptions-transport-ws protocol.
+TRANSPORT_WS = "graphql-transport-ws"
+LEGACY_WS = "graphql-ws"
+
+CONNECTION_INIT_TIMEOUT = 10
+# Events buffered per subscription before new ones are dropped for a slow client.
+MAX_PENDING_EVENTS = 100
+
+
+class GraphQLWSConsumer(AsyncJsonWebsocketConsumer):
+    """Runs subscription operations and streams their results.
+
+    Subscription resolvers get this consumer as ``info.context`` and read
+    events with :meth:`course_events`; the consumer joins a course's channel
+    group while at least one of its subscriptions listens to that course.
+    Queries and mutations stay on HTTP.
+    """
+
+    async def connect(self):
+        offered = self.scope.get("subprotocols") or []
+        protocol = next((p for p in (TRANSPORT_WS, LEGACY_WS) if p in offered), None)
+        if protocol is None:
+            await self.close(code=4406)
+            return
+        self.protocol = protocol
+        self.acknowledged = False
+        self.operations: Dict[str, asyncio.Task] = {}
+        self.listeners: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+        await self.accept(subprotocol=protocol)
+        self.init_timeout = asyncio.create_task(self._close_unless_initialised())
+
+    async def _close_unless_initialised(self):
+        await asyncio.sleep(CONNECTION_INIT_TIMEOUT)
+        if not self.acknowledged:
+            await self.close(code=4408)
+
+    async def disconnect(self, code):
+        if not hasattr(self, "operations"):
+            return
+        self.init_timeout.cancel()
+        for task in self.operations.values():
+            task.cancel()
+        self.operations.clear()
+        for course_id in list(self.listeners):
+            await self.channel_layer.group_discard(course_group(course_id), self.channel_name)
+        self.listeners.clear()
+
+    # -- protocol ------------------------------------------------------------
+
+    async def receive_json(self, content, **kwargs):
+        message_type = content.get("type") if isinstance(content, dict) else None
+        if message_type == "connection_init":
+            await self._init()
+        elif message_type == "ping":
+            await self.send_json({"type": "pong"})
+        elif message_type == "pong":
+            pass
+        elif not self.acknowledged:
+            await self.close(code=4401)
+        elif message_type in ("subscribe", "start"):
+            await self._subscribe(content.get("id"), content.get("payload") or {})
+        elif message_type in ("complete", "stop"):
+            self._stop(content.get("id"))
+        elif message_type == "connection_terminate":
+            await self.close()
+        else:
+            await self.close(code=4400)
+
+    async def _init(self):
+        if self.acknowledged:
+            await self.close(code=4429)
+            return
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated:
+            await self.close(code=4401)
+            return
+        self.acknowledged = True
+        await self.send_json({"type": "connection_ack"})
+        if self.protocol == LEGACY_WS:
+            await self.send_json({"type": "ka"})
+
+    async def _send_error(self, operation_id, errors):
+        payload = [error.formatted for error in errors]
+        if self.protocol == LEGACY_WS:
+            payload = payload[0]
+        await self.send_json({"type": "error", "id": operation_id, "payload": payload})
+
+    async def _subscribe(self, operation_id, payload):
+        if not isinstance(operation_id, str) or not operation_id:
+            await self.close(code=4400)
+            return
+        if operation_id in self.operations:
+            await self.close(code=4409)
+            return
+
+        schema = graphene_settings.SCHEMA.graphql_schema
+        document, errors = get_document_cache().get(schema, payload.get("query") or "")
+        if errors:
+            await self._send_error(operation_id, errors)
+            return
+        operation_name = payload.get("operationName")
+        operation = get_operation_ast(document, operation_name)
+        if operation is None or operation.operation != OperationType.SUBSCRIPTION:
+            await self._send_error(
+                operation_id,
+                [GraphQLError("Only subscription operations are served over WebSocket.")],
+            )
+            return
+
+        result = await subscribe(
+            schema,
+            document,
+            context_value=self,
+            variable_values=payload.get("variables"),
+            operation_name=operation_name,
+        )
+        if isinstance(result, ExecutionResult):
+            await self._send_error(operation_id, result.errors or [])
+            return
+        self.operations[operation_id] = asyncio.create_task(self._stream(operation_id, result))
+
+    async def _stream(self, operation_id: str, results: AsyncIterator[ExecutionResult]):
+        next_type = "data" if self.protocol == LEGACY_WS else "next"
+        try:
+            async for result in results:
+                await self.send_json(
+                    {"type": next_type, "id": operation_id, "payload": result.formatted}
+                )
+            await self.send_json({"type": "complete", "id": operation_id})
+        except asyncio.CancelledError:
+            raise
+        except GraphQLError as error:
+            # e.g. a permission check in the source generator before its first event.
+            await self._send_error(operation_id, [error])
+        except Exception:
+            logger.exception("GraphQL subscription %s failed", operation_id)
+            await self._send_error(operation_id, [GraphQLError("Subscription failed.")])
+        finally:
+            self.operations.pop(operation_id, None)
+            aclose = getattr(results, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _stop(self, operation_id):
+        task = self.operations.pop(operation_id, None)
+        if task is not None:
+            task.cancel()
+
+    # -- events --------------------------------------------------------------
+
+    async def course_events(self, course_id: int):
+        """Yield this course's events until the subscription ends."""
+
+        queue: asyncio.Queue = asyncio.Queue(MAX_PENDING_EVENTS)
+        listeners = self.listeners[course_id]
+        if not listeners:
+            await self.channel_layer.group_add(course_group(course_id), self.channel_name)
+        listeners.add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            listeners.discard(queue)
+            if not listeners and self.listeners.pop(course_id, None) is not None:
+                await self.channel_layer.group_discard(course_group(course_id), self.channel_name)
+
+    async def course_event(self, message):
+        event = message["event"]
+        for queue in self.listeners.get(event["courseId"], ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning("Dropping %s for a slow subscriber", event["kind"])
@@ -0,0 +1,73 @@
+"""LRU cache of parsed and validated GraphQL documents."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from graphql import DocumentNode, GraphQLError, GraphQLSchema, parse, validate
+
+
+class DocumentCache:
+    """Maps query text to its parsed ``DocumentNode`` once it has passed validation.
+
+    Only valid documents are cached, so a hit skips both ``parse`` and
+    ``validate``. Failed queries are re-checked every time and never
+    evict working ones.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._documents: "OrderedDict[str, DocumentNode]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, schema: GraphQLSchema, query: str
+    ) -> Tuple[Optional[DocumentNode], List[GraphQLError]]:
+        with self._lock:
+            document = self._documents.get(query)
+            if document is not None:
+                self._documents.move_to_end(query)
+                self.hits += 1
+                return document, []
+            self.misses += 1
+
+        try:
+            document = parse(query)
+        except GraphQLError as error:
+            return None, [error]
+        errors = validate(schema, document)
+        if errors:
+            return None, errors
+
+        with self._lock:
+            self._documents[query] = document
+            self._documents.move_to_end(query)
+            while len(self._documents) > self.maxsize:
+                self._documents.popitem(last=False)
+        return document, []
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+            self.hits = self.misses = 0
+
+    def snapshot(self):
+        with self._lock:
+            return {"size": len(self._documents), "hits": self.hits, "misses": self.misses}
+
+
+_document_cache: Optional[DocumentCache] = None
+
+
+def get_document_cache() -> DocumentCache:
+    """Return the process-wide document cache."""
+
+    global _document_cache
+    if _document_cache is None:
+        _document_cache = DocumentCache(settings.GRAPHQL_DOCUMENT_CACHE_SIZE)
+    return _document_cache
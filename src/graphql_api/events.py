@@ -0,0 +1,78 @@
+"""Course events fanned out to GraphQL subscribers through the channel layer."""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable, Optional
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+
+logger = logging.getLogger("graphql_api.events")
+
+
+class Kinds:
+    ASSIGNMENT_PUBLISHED = "assignment.published"
+    ASSIGNMENT_UPDATED = "assignment.updated"
+    ASSIGNMENT_DELETED = "assignment.deleted"
+    EXTENSION_CHANGED = "extension.changed"
+    # ``userId`` is the member whose role changed, or None after a roster import.
+    MEMBERSHIP_CHANGED = "membership.changed"
+    WHITEBOARD_STARTED = "whiteboard.started"
+    WHITEBOARD_ENDED = "whiteboard.ended"
+
+
+# Events only the named user (and course staff) should receive.
+PERSONAL_KINDS = {Kinds.EXTENSION_CHANGED, Kinds.MEMBERSHIP_CHANGED}
+
+
+def course_group(course_id) -> str:
+    return f"course-events-{course_id}"
+
+
+def _send(events: list) -> None:
+    # Runs in on_commit after the write succeeded; a channel layer outage must
+    # not turn that into an error, so fan-out is best-effort and only logged.
+    try:
+        layer = get_channel_layer()
+    except Exception:
+        logger.exception("Channel layer unavailable; dropped %d course event(s)", len(events))
+        return
+    if layer is None:
+        return
+    for event in events:
+        try:
+            async_to_sync(layer.group_send)(
+                course_group(event["courseId"]), {"type": "course.event", "event": event}
+            )
+        except Exception:
+            logger.exception(
+                "Failed to send %s event for course %s", event["kind"], event["courseId"]
+            )
+
+
+def publish_course_event(
+    course_id: int, kind: str, object_id, user_id: Optional[int] = None
+) -> None:
+    """Send an event to the course's subscribers once the current transaction commits.
+
+    Events carry ids only; clients refetch what they display, so the
+    subscription never bypasses the query permission checks.
+    """
+
+    event = {
+        "courseId": course_id,
+        "kind": kind,
+        "objectId": str(object_id),
+        "userId": user_id,
+    }
+    transaction.on_commit(lambda: _send([event]))
+
+
+def publish_assignments(assignments: Iterable) -> None:
+    """``assignment.published`` for assignments that became visible on schedule."""
+
+    for assignment in assignments:
+        publish_course_event(assignment.course_id, Kinds.ASSIGNMENT_PUBLISHED, assignment.pk)
@@ -0,0 +1,253 @@
+"""Static cost and depth analysis of GraphQL operations before execution."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
+
+from django.conf import settings
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLNonNull,
+    GraphQLSchema,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    VariableNode,
+    get_named_type,
+    is_leaf_type,
+)
+from rest_framework.throttling import BaseThrottle
+
+from accounts.auth.throttling import SlidingWindowLimiter
+
+
+logger = logging.getLogger("graphql_api.cost")
+
+# Arguments whose value bounds how many items a list or connection returns.
+PAGE_SIZE_ARGUMENTS = ("first", "last", "limit", "pageSize")
+
+# Lists on a connection that hold its page; the connection field already
+# multiplied by the page size, so these are not multiplied again.
+CONNECTION_PAGE_FIELDS = ("edges", "nodes")
+
+DEFAULT_LIST_SIZE = 20
+
+
+def default_list_size() -> int:
+    """Items an unbounded list is priced at, and the page size connections default to."""
+
+    return settings.GRAPHQL_QUERY_LIMITS.get("DEFAULT_LIST_SIZE", DEFAULT_LIST_SIZE)
+
+
+def _is_connection(named: GraphQLNamedType) -> bool:
+    return named.name.endswith("Connection")
+
+
+@dataclass(frozen=True)
+class QueryCost:
+    cost: int
+    depth: int
+
+
+class QueryLimitExceeded(GraphQLError):
+    def __init__(self, message: str, code: str, **extensions):
+        super().__init__(message, extensions={"code": code, **extensions})
+
+
+class CostAnalyzer:
+    """Walks an operation's selections with the schema to price it.
+
+    Each object field costs 1 (scalars 0) unless ``FIELD_COSTS`` overrides
+    ``"Type.field"``. A list or ``*Connection`` field multiplies the cost of
+    its subtree by its ``first``/``last``/``limit`` argument, or by
+    ``DEFAULT_LIST_SIZE`` when the client does not bound it; the ``edges``
+    inside a connection are that page, not another list. Introspection
+    fields are free.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        field_costs: Optional[Dict[str, int]] = None,
+        default_list_size: int = DEFAULT_LIST_SIZE,
+    ):
+        self.schema = schema
+        self.field_costs = field_costs or {}
+        self.default_list_size = default_list_size
+
+    def analyze(
+        self,
+        document: DocumentNode,
+        operation: OperationDefinitionNode,
+        variables: Optional[Dict] = None,
+    ) -> QueryCost:
+        self.variables = variables or {}
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        root = self.schema.get_root_type(operation.operation)
+        if root is None:
+            return QueryCost(0, 0)
+        cost, depth = self._selection_cost(root, operation.selection_set, frozenset())
+        return QueryCost(cost, depth)
+
+    def _fields(
+        self, parent: GraphQLNamedType, selection_set: SelectionSetNode, seen: frozenset
+    ) -> Iterator[Tuple[GraphQLNamedType, FieldNode, frozenset]]:
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                yield parent, selection, seen
+            elif isinstance(selection, InlineFragmentNode):
+                owner = parent
+                if selection.type_condition is not None:
+                    owner = self.schema.get_type(selection.type_condition.name.value) or parent
+                yield from self._fields(owner, selection.selection_set, seen)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in seen:
+                    continue
+                owner = self.schema.get_type(fragment.type_condition.name.value) or parent
+                yield from self._fields(owner, fragment.selection_set, seen | {name})
+
+    def _selection_cost(
+        self, parent: GraphQLNamedType, selection_set: SelectionSetNode, seen: frozenset
+    ) -> Tuple[int, int]:
+        total = 0
+        depth = 0
+        for owner, node, fragments in self._fields(parent, selection_set, seen):
+            name = node.name.value
+            if name.startswith("__"):
+                continue
+            field = getattr(owner, "fields", {}).get(name)
+            if field is None:
+                continue
+
+            field_type = field.type
+            if isinstance(field_type, GraphQLNonNull):
+                field_type = field_type.of_type
+            named = get_named_type(field_type)
+
+            cost = self.field_costs.get(f"{owner.name}.{name}", 0 if is_leaf_type(named) else 1)
+            child_depth = 0
+            if node.selection_set is not None:
+                child_cost, child_depth = self._selection_cost(named, node.selection_set, fragments)
+                cost += child_cost
+            if self._is_paged(owner, name, field_type, named):
+                cost *= self._page_size(node)
+
+            total += cost
+            depth = max(depth, 1 + child_depth)
+        return total, depth
+
+    @staticmethod
+    def _is_paged(owner: GraphQLNamedType, name: str, field_type, named: GraphQLNamedType) -> bool:
+        if _is_connection(owner) and name in CONNECTION_PAGE_FIELDS:
+            return False
+        return isinstance(field_type, GraphQLList) or _is_connection(named)
+
+    def _page_size(self, node: FieldNode) -> int:
+        for argument in node.arguments or ():
+            if argument.name.value not in PAGE_SIZE_ARGUMENTS:
+                continue
+            value = argument.value
+            if isinstance(value, IntValueNode):
+                return max(int(value.value), 1)
+            if isinstance(value, VariableNode):
+                resolved = self.variables.get(value.name.value)
+                if isinstance(resolved, int):
+                    return max(resolved, 1)
+        return self.default_list_size
+
+
+class QueryLimits:
+    """Rejects operations that are too deep, too expensive, or over the user's budget."""
+
+    def __init__(self, config: Dict):
+        self.max_depth = config["MAX_DEPTH"]
+        self.max_cost = config["MAX_COST"]
+        self.field_costs = config.get("FIELD_COSTS", {})
+        self.default_list_size = config.get("DEFAULT_LIST_SIZE", DEFAULT_LIST_SIZE)
+        budget = config.get("USER_BUDGET")
+        self.budget = (
+            SlidingWindowLimiter("user", budget, key_prefix="graphql-cost") if budget else None
+        )
+
+    def check(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        operation: OperationDefinitionNode,
+        variables: Optional[Dict],
+        request,
+    ) -> QueryCost:
+        """Price ``operation`` and charge it to the caller; raise ``QueryLimitExceeded``."""
+
+        analyzer = CostAnalyzer(schema, self.field_costs, self.default_list_size)
+        result = analyzer.analyze(document, operation, variables)
+        ident = self._ident(request)
+        operation_name = operation.name.value if operation.name else "anonymous"
+        logger.info(
+            "graphql operation=%s cost=%d depth=%d caller=%s",
+            operation_name,
+            result.cost,
+            result.depth,
+            ident,
+        )
+
+        if self.max_depth and result.depth > self.max_depth:
+            raise QueryLimitExceeded(
+                f"Query depth {result.depth} exceeds the maximum of {self.max_depth}.",
+                "QUERY_TOO_DEEP",
+                depth=result.depth,
+                maxDepth=self.max_depth,
+            )
+        if self.max_cost and result.cost > self.max_cost:
+            raise QueryLimitExceeded(
+                f"Query cost {result.cost} exceeds the maximum of {self.max_cost}.",
+                "QUERY_TOO_EXPENSIVE",
+                cost=result.cost,
+                maxCost=self.max_cost,
+            )
+        if self.budget is not None and result.cost:
+            wait = self.budget.hit(ident, result.cost)
+            if wait is not None:
+                logger.warning("graphql budget exhausted for %s (retry in %.0fs)", ident, wait)
+                raise QueryLimitExceeded(
+                    f"Query budget exhausted; retry in {int(wait) + 1} seconds.",
+                    "QUERY_BUDGET_EXHAUSTED",
+                    cost=result.cost,
+                    retryAfter=int(wait) + 1,
+                )
+        return result
+
+    @staticmethod
+    def _ident(request) -> str:
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return f"user:{user.pk}"
+        # Same client address DRF throttles use, honouring NUM_PROXIES.
+        return f"ip:{BaseThrottle().get_ident(request)}"
+
+
+_query_limits: Optional[QueryLimits] = None
+
+
+def get_query_limits() -> QueryLimits:
+    """Return the process-wide limits built from ``settings.GRAPHQL_QUERY_LIMITS``."""
+
+    global _query_limits
+    if _query_limits is None:
+        _query_limits = QueryLimits(settings.GRAPHQL_QUERY_LIMITS)
+    return _query_limits
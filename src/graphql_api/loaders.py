@@ -0,0 +1,131 @@
+"""Request-scoped DataLoaders that batch resolver lookups into one query per level."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+from django.apps import apps
+from django.db.models import QuerySet
+from graphql_sync_dataloaders import SyncDataLoader
+
+
+class ModelLoader(SyncDataLoader):
+    """Load instances by primary key; missing keys resolve to ``None``."""
+
+    def __init__(self, model_label: str, queryset: Optional[Callable[[QuerySet], QuerySet]] = None):
+        self.model_label = model_label
+        self.queryset = queryset
+        super().__init__(self.batch_load)
+
+    def batch_load(self, keys: List) -> List:
+        model = apps.get_model(self.model_label)
+        queryset = model._default_manager.all()
+        if self.queryset is not None:
+            queryset = self.queryset(queryset)
+        found = queryset.in_bulk(keys)
+        return [found.get(key) for key in keys]
+
+
+class RelatedListLoader(SyncDataLoader):
+    """Load lists of rows grouped by a foreign key (e.g. memberships by ``course_id``).
+
+    Rows keep the model's default ordering within each group.
+    """
+
+    def __init__(
+        self,
+        model_label: str,
+        field: str,
+        queryset: Optional[Callable[[QuerySet], QuerySet]] = None,
+    ):
+        self.model_label = model_label
+        self.field = field
+        self.queryset = queryset
+        super().__init__(self.batch_load)
+
+    def batch_load(self, keys: List) -> List[List]:
+        model = apps.get_model(self.model_label)
+        queryset = model._default_manager.filter(**{f"{self.field}__in": keys})
+        if self.queryset is not None:
+            queryset = self.queryset(queryset)
+        grouped: Dict = defaultdict(list)
+        for obj in queryset:
+            grouped[getattr(obj, self.field)].append(obj)
+        return [grouped.get(key, []) for key in keys]
+
+
+def _with_user(queryset):
+    return queryset.select_related("user")
+
+
+LOADERS: Dict[str, Callable[[], SyncDataLoader]] = {
+    # By primary key.
+    "user": lambda: ModelLoader("accounts.User"),
+    "course": lambda: ModelLoader("courses.Course"),
+    "course_membership": lambda: ModelLoader("courses.CourseMembership"),
+    "assignment": lambda: ModelLoader("assignments.Assignment"),
+    "assignment_question": lambda: ModelLoader("assignments.AssignmentQuestion"),
+    "assignment_extension": lambda: ModelLoader("assignments.AssignmentExtension"),
+    "free_response_question": lambda: ModelLoader("questions.FreeResponseQuestion"),
+    "multiple_choice_question": lambda: ModelLoader("questions.MultipleChoiceQuestion"),
+    # By parent foreign key.
+    "memberships_by_course": lambda: RelatedListLoader(
+        "courses.CourseMembership", "course_id", _with_user
+    ),
+    "memberships_by_user": lambda: RelatedListLoader("courses.CourseMembership", "user_id"),
+    "assignments_by_course": lambda: RelatedListLoader("assignments.Assignment", "course_id"),
+    "questions_by_assignment": lambda: RelatedListLoader(
+        "assignments.AssignmentQuestion", "assignment_id"
+    ),
+    "extensions_by_assignment": lambda: RelatedListLoader(
+        "assignments.AssignmentExtension", "assignment_id", _with_user
+    ),
+    "extensions_by_user": lambda: RelatedListLoader("assignments.AssignmentExtension", "user_id"),
+}
+
+
+class Loaders:
+    """One set of loaders per request, created on first use.
+
+    Resolvers return ``loaders.course.load(root.course_id)`` instead of
+    touching the relation; ``DeferredExecutionContext`` dispatches every
+    pending key of a level in one batch.
+    """
+
+    def __init__(self):
+        self._loaders: Dict[str, SyncDataLoader] = {}
+
+    def __getattr__(self, name: str) -> SyncDataLoader:
+        try:
+            factory = LOADERS[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        loader = self._loaders.get(name)
+        if loader is None:
+            loader = self._loaders[name] = factory()
+        return loader
+
+
+def load_by(loader_name: str, key: str = "pk") -> Callable:
+    """A resolver that loads ``loader_name`` by ``getattr(root, key)``.
+
+    ``resolve_user = load_by("user", "user_id")`` on a membership type, or
+    ``resolve_memberships = load_by("memberships_by_course")`` on a course.
+    """
+
+    def resolve(root, info, **kwargs):
+        return getattr(get_loaders(info), loader_name).load(getattr(root, key))
+
+    return resolve
+
+
+def get_loaders(info_or_request) -> Loaders:
+    """The loaders for the current request (accepts a resolver ``info`` or the request)."""
+
+    request = getattr(info_or_request, "context", info_or_request)
+    loaders = getattr(request, "_graphql_loaders", None)
+    if loaders is None:
+        loaders = Loaders()
+        request._graphql_loaders = loaders
+    return loaders
@@ -0,0 +1,265 @@
+"""Keyset (seek) pagination for Relay connection fields."""
+
+from __future__ import annotations
+
+import base64
+import datetime
+import json
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, List, Optional, Sequence, Tuple
+
+import graphene
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import F, Q, QuerySet
+from graphene import NonNull
+from graphene.relay import PageInfo
+from graphene_django.settings import graphene_settings
+from graphql import GraphQLError
+
+from .limits import default_list_size
+
+
+# Orderings for the connection fields; each ends in a unique column and
+# matches an index column for column (``assignment_course_publish``,
+# ``course_membership_joined``, ``course_membership_user_joined``) so
+# a page is a range scan of ``first + 1`` rows.
+ASSIGNMENT_ORDERING = ("-publish_at", "-created_at", "id")
+COURSE_MEMBERSHIP_ORDERING = ("-joined_at", "id")
+QUESTION_ORDERING = ("-created_at", "id")
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder rounds times to milliseconds; seeking needs exact values.
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+@dataclass(frozen=True)
+class _Key:
+    name: str
+    column: str
+    descending: bool
+    nullable: bool
+
+
+@dataclass
+class KeysetPage:
+    items: List[Any]
+    cursors: List[str]
+    has_previous_page: bool
+    has_next_page: bool
+
+
+class KeysetPaginator:
+    """Pages ``queryset`` by ``ordering`` with ``WHERE key > cursor`` instead of ``OFFSET``.
+
+    The cursor holds the ordering values of the row it points at, so a page
+    costs the same at any depth and rows inserted before the cursor do not
+    shift later pages. ``NULL``\\s sort above every value, as in a PostgreSQL
+    index: last for ascending keys and first for descending ones, so a plain
+    ``("-publish_at", "id")`` index serves the ordering in both directions.
+    """
+
+    def __init__(self, queryset: QuerySet, ordering: Sequence[str]):
+        self.queryset = queryset
+        self.model = queryset.model
+        self.keys = [self._key(name) for name in ordering]
+        if not self.model._meta.get_field(self.keys[-1].name).unique:
+            raise ValueError(f"Keyset ordering {tuple(ordering)} must end in a unique field.")
+
+    def _key(self, name: str) -> _Key:
+        descending = name.startswith("-")
+        name = name.lstrip("-")
+        field = self.model._meta.pk if name == "pk" else self.model._meta.get_field(name)
+        return _Key(field.name, field.attname, descending, field.null)
+
+    # -- cursors -------------------------------------------------------------
+
+    def encode_cursor(self, obj) -> str:
+        values = [getattr(obj, key.column) for key in self.keys]
+        raw = json.dumps(values, cls=_CursorEncoder, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> List:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if not isinstance(values, list) or len(values) != len(self.keys):
+                raise ValueError
+            return [
+                None if value is None else self.model._meta.get_field(key.name).to_python(value)
+                for key, value in zip(self.keys, values)
+            ]
+        except Exception:
+            raise GraphQLError(f"Invalid cursor: {cursor!r}.") from None
+
+    # -- queries -------------------------------------------------------------
+
+    def _order_by(self, reverse: bool):
+        expressions = []
+        for key in self.keys:
+            column = F(key.column)
+            descending = key.descending != reverse
+            # Spelled out for nullable keys only, so SQLite (where NULL is the
+            # smallest value) pages the same way; NOT NULL keys keep the plain form.
+            placement = {}
+            if key.nullable:
+                placement = {"nulls_first": True} if descending else {"nulls_last": True}
+            expressions.append(column.desc(**placement) if descending else column.asc(**placement))
+        return expressions
+
+    def _beyond(self, values: List, reverse: bool) -> Q:
+        """Rows strictly after ``values`` in the (optionally reversed) ordering."""
+
+        condition = Q()
+        matched = False
+        prefix = Q()
+        for key, value in zip(self.keys, values):
+            descending = key.descending != reverse
+            nulls_last = not descending
+            if value is None:
+                # Nothing follows NULL when NULLs sort last; everything non-null does when first.
+                step = None if nulls_last else Q(**{f"{key.column}__isnull": False})
+            else:
+                step = Q(**{f"{key.column}__{'lt' if descending else 'gt'}": value})
+                if key.nullable and nulls_last:
+                    step |= Q(**{f"{key.column}__isnull": True})
+            if step is not None:
+                condition = (condition | (prefix & step)) if matched else prefix & step
+                matched = True
+            if value is None:
+                prefix &= Q(**{f"{key.column}__isnull": True})
+            else:
+                prefix &= Q(**{key.column: value})
+        return condition if matched else Q(pk__in=[])
+
+    def window(
+        self, after: Optional[str] = None, before: Optional[str] = None, reverse: bool = False
+    ) -> QuerySet:
+        """Rows between the cursors, ordered (or reversed) for slicing a page off the front."""
+
+        queryset = self.queryset
+        if after:
+            queryset = queryset.filter(self._beyond(self.decode_cursor(after), reverse=False))
+        if before:
+            queryset = queryset.filter(self._beyond(self.decode_cursor(before), reverse=True))
+        return queryset.order_by(*self._order_by(reverse))
+
+    def page(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        last: Optional[int] = None,
+        before: Optional[str] = None,
+    ) -> KeysetPage:
+        reverse = last is not None and first is None
+        size = last if reverse else first
+        items = list(self.window(after, before, reverse)[: size + 1])
+
+        more = len(items) > size
+        items = items[:size]
+        if reverse:
+            items.reverse()
+            has_previous, has_next = more, bool(before)
+        else:
+            has_previous, has_next = bool(after), more
+            if last is not None and len(items) > last:
+                items = items[-last:]
+                has_previous = True
+        return KeysetPage(
+            items=items,
+            cursors=[self.encode_cursor(obj) for obj in items],
+            has_previous_page=has_previous,
+            has_next_page=has_next,
+        )
+
+
+def estimate_count(queryset: QuerySet) -> int:
+    """Planner row estimate on PostgreSQL; an exact ``COUNT`` elsewhere."""
+
+    if connections[queryset.db].vendor != "postgresql":
+        return queryset.count()
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetConnection(graphene.relay.Connection):
+    """Base connection with opt-in counts; neither is computed unless selected."""
+
+    class Meta:
+        abstract = True
+
+    total_count = graphene.Int(description="Exact number of rows; runs a COUNT query.")
+    estimated_count = graphene.Int(description="Planner estimate of the number of rows.")
+
+    def resolve_total_count(root, info):
+        return root.queryset.count()
+
+    def resolve_estimated_count(root, info):
+        return estimate_count(root.queryset)
+
+
+class KeysetConnectionField(graphene.relay.ConnectionField):
+    """``ConnectionField`` whose resolver returns a queryset to page by ``ordering``.
+
+    Page sizes default to ``GRAPHQL_QUERY_LIMITS["DEFAULT_LIST_SIZE"]``, the
+    size the cost analysis assumes, and are capped at
+    ``RELAY_CONNECTION_MAX_LIMIT``.
+    """
+
+    def __init__(self, type_, *args, ordering: Sequence[str], **kwargs):
+        self.ordering = tuple(ordering)
+        super().__init__(type_, *args, **kwargs)
+
+    @staticmethod
+    def _page_size(args) -> Tuple[Optional[int], Optional[int]]:
+        max_limit = graphene_settings.RELAY_CONNECTION_MAX_LIMIT
+        first, last = args.get("first"), args.get("last")
+        for name, value in (("first", first), ("last", last)):
+            if value is not None and value < 0:
+                raise GraphQLError(f"Argument '{name}' must be a non-negative integer.")
+        if first is None and last is None:
+            if graphene_settings.RELAY_CONNECTION_ENFORCE_FIRST_OR_LAST:
+                raise GraphQLError("You must provide a 'first' or 'last' value to paginate.")
+            first = default_list_size()
+        if first is not None:
+            first = min(first, max_limit)
+        if last is not None:
+            last = min(last, max_limit)
+        return first, last
+
+    @classmethod
+    def keyset_resolver(cls, resolver, connection_type, ordering, root, info, **args):
+        queryset = resolver(root, info, **args)
+        if isinstance(connection_type, NonNull):
+            connection_type = connection_type.of_type
+        if not isinstance(queryset, QuerySet):
+            queryset = queryset.all()
+
+        first, last = cls._page_size(args)
+        page = KeysetPaginator(queryset, ordering).page(
+            first=first, after=args.get("after"), last=last, before=args.get("before")
+        )
+        connection = connection_type(
+            edges=[
+                connection_type.Edge(node=obj, cursor=cursor)
+                for obj, cursor in zip(page.items, page.cursors)
+            ],
+            page_info=PageInfo(
+                start_cursor=page.cursors[0] if page.cursors else None,
+                end_cursor=page.cursors[-1] if page.cursors else None,
+                has_previous_page=page.has_previous_page,
+                has_next_page=page.has_next_page,
+            ),
+        )
+        connection.queryset = queryset
+        connection.iterable = page.items
+        return connection
+
+    def wrap_resolve(self, parent_resolver):
+        resolver = super(graphene.relay.ConnectionField, self).wrap_resolve(parent_resolver)
+        return partial(self.keyset_resolver, resolver, self.type, self.ordering)
@@ -0,0 +1,70 @@
+"""Persisted queries registered from the frontend build."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from django.conf import settings
+
+
+class PersistedQueryNotFound(Exception):
+    """The client sent a hash that is not in the manifest."""
+
+
+def query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _parse_manifest(data) -> Dict[str, str]:
+    # Apollo's persisted-query manifest, or a plain {hash: query} mapping.
+    if isinstance(data, dict) and "operations" in data:
+        return {operation["id"]: operation["body"] for operation in data["operations"]}
+    return dict(data)
+
+
+class PersistedQueryStore:
+    """Hash → query text, loaded once from ``settings.GRAPHQL_PERSISTED_QUERIES``."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = Path(path) if path else None
+        self._queries: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def queries(self) -> Dict[str, str]:
+        if self._queries is None:
+            with self._lock:
+                if self._queries is None:
+                    self._queries = self._load()
+        return self._queries
+
+    def _load(self) -> Dict[str, str]:
+        if self.path is None or not self.path.exists():
+            return {}
+        with self.path.open(encoding="utf-8") as handle:
+            return _parse_manifest(json.load(handle))
+
+    def get(self, digest: str) -> str:
+        try:
+            return self.queries[digest]
+        except KeyError:
+            raise PersistedQueryNotFound(digest) from None
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self.queries
+
+
+_store: Optional[PersistedQueryStore] = None
+
+
+def get_persisted_queries() -> PersistedQueryStore:
+    """Return the process-wide persisted query store."""
+
+    global _store
+    if _store is None:
+        _store = PersistedQueryStore(settings.GRAPHQL_PERSISTED_QUERIES)
+    return _store
@@ -0,0 +1,151 @@
+"""Per-user cache of GraphQL query results with tag-based invalidation."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import Counter
+from typing import Dict, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    OperationType,
+    StringValueNode,
+    VariableNode,
+)
+
+from core.caching import ALL_COURSES, tag_versions
+from courses.permissions import get_course_permissions
+
+
+# Root fields whose course comes from an argument other than ``courseId``.
+COURSE_ID_ARGUMENTS = {"course": "id"}
+
+
+class ResponseCache:
+    """Caches the ``data`` of query operations built only from opted-in root fields.
+
+    ``FIELDS`` maps each cacheable root field to the tag families it reads,
+    e.g. ``assignmentsConnection -> ("assignment", "course")``. A response is
+    tagged ``family:<course_id>`` when the field is scoped to one course, or
+    ``family:*`` otherwise; the model signals in :mod:`core.signals` bump
+    both. The response key folds in the tags' current versions, so bumping a
+    tag orphans every entry that depended on it without having to find them.
+    Keys also include the user, their course roles, the query text,
+    operation name and variables, so one user never sees another's data and
+    role changes start a fresh entry.
+    """
+
+    def __init__(self, config: Dict):
+        self.enabled = config.get("ENABLED", False)
+        self.timeout = config.get("TIMEOUT", 300)
+        self.fields = {name: tuple(families) for name, families in config.get("FIELDS", {}).items()}
+        self.metrics: Counter = Counter()
+        self._metrics_lock = threading.Lock()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._metrics_lock:
+            self.metrics[name] += amount
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._metrics_lock:
+            return dict(self.metrics)
+
+    # -- keys ----------------------------------------------------------------
+
+    def tags_for(
+        self, operation: OperationDefinitionNode, variables: Optional[Dict]
+    ) -> Optional[Set[str]]:
+        """Tags the operation depends on, or ``None`` if it is not cacheable."""
+
+        if not self.enabled or operation.operation != OperationType.QUERY:
+            return None
+        tags = set()
+        for selection in operation.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                return None
+            name = selection.name.value
+            if name == "__typename":
+                continue
+            families = self.fields.get(name)
+            if families is None:
+                return None
+            course_id = self._course_id(selection, variables or {})
+            tags.update(f"{family}:{course_id or ALL_COURSES}" for family in families)
+        return tags or None
+
+    @staticmethod
+    def _course_id(field: FieldNode, variables: Dict) -> Optional[str]:
+        argument_name = COURSE_ID_ARGUMENTS.get(field.name.value, "courseId")
+        for argument in field.arguments or ():
+            if argument.name.value != argument_name:
+                continue
+            value = argument.value
+            if isinstance(value, (IntValueNode, StringValueNode)):
+                return str(value.value)
+            if isinstance(value, VariableNode) and variables.get(value.name.value) is not None:
+                return str(variables[value.name.value])
+        return None
+
+    def _key(self, request, query: str, operation_name, variables, tags: Set[str]) -> str:
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            roles = sorted(get_course_permissions(request).roles.items())
+            scope = [user.pk, user.is_staff, roles]
+        else:
+            scope = [None]
+        ordered = sorted(tags)
+        versions = tag_versions(ordered)
+        payload = json.dumps(
+            [
+                scope,
+                query,
+                operation_name,
+                variables or {},
+                [versions[tag] for tag in ordered],
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return f"gql-response:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+    # -- lookups -------------------------------------------------------------
+
+    def get(self, request, query, operation, operation_name, variables):
+        """Return ``(key, cached result)``; the key is ``None`` when the operation is not cacheable."""
+
+        tags = self.tags_for(operation, variables)
+        if tags is None:
+            self._count("bypass")
+            return None, None
+        key = self._key(request, query, operation_name, variables, tags)
+        data = cache.get(key)
+        if data is None:
+            self._count("misses")
+            return key, None
+        self._count("hits")
+        return key, ExecutionResult(data=data)
+
+    def set(self, key: str, result: ExecutionResult) -> None:
+        if result.errors or result.data is None:
+            return
+        cache.set(key, result.data, self.timeout)
+        self._count("stores")
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache."""
+
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(settings.GRAPHQL_RESPONSE_CACHE)
+    return _response_cache
@@ -0,0 +1,10 @@
+"""Routing configuration for GraphQL subscriptions."""
+
+from django.urls import re_path
+
+from .consumers import GraphQLWSConsumer
+
+
+websocket_urlpatterns = [
+    re_path(r"^ws/graphql/$", GraphQLWSConsumer.as_asgi()),
+]
@@ -0,0 +1,92 @@
+"""Subscription events driven by model signals.
+
+Response-cache invalidation uses the shared cache tags bumped in
+:mod:`core.signals`.
+"""
+
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .events import Kinds, publish_course_event
+
+
+def _is_published(assignment) -> bool:
+    return assignment.publish_at is None or assignment.publish_at <= timezone.now()
+
+
+@receiver(post_save, sender="assignments.Assignment", dispatch_uid="graphql-events-assignment")
+def assignment_saved(sender, instance, created, raw=False, **kwargs):
+    # Assignments scheduled for later are announced by run_feed_scheduler.
+    if raw or not _is_published(instance):
+        return
+    kind = Kinds.ASSIGNMENT_PUBLISHED if created else Kinds.ASSIGNMENT_UPDATED
+    publish_course_event(instance.course_id, kind, instance.pk)
+
+
+@receiver(post_delete, sender="assignments.Assignment", dispatch_uid="graphql-events-assignment")
+def assignment_deleted(sender, instance, **kwargs):
+    publish_course_event(instance.course_id, Kinds.ASSIGNMENT_DELETED, instance.pk)
+
+
+def _extension_course_id(extension):
+    assignment = extension._state.fields_cache.get("assignment")
+    if assignment is not None:
+        return assignment.course_id
+    return (
+        apps.get_model("assignments", "Assignment")
+        ._base_manager.filter(pk=extension.assignment_id)
+        .values_list("course_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender="assignments.AssignmentExtension", dispatch_uid="graphql-events-extension")
+@receiver(post_delete, sender="assignments.AssignmentExtension", dispatch_uid="graphql-events-extension")
+def extension_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    course_id = _extension_course_id(instance)
+    if course_id is not None:
+        publish_course_event(
+            course_id, Kinds.EXTENSION_CHANGED, instance.assignment_id, user_id=instance.user_id
+        )
+
+
+@receiver(post_save, sender="courses.CourseMembership", dispatch_uid="graphql-events-membership")
+@receiver(post_delete, sender="courses.CourseMembership", dispatch_uid="graphql-events-membership")
+def membership_changed(sender, instance, raw=False, **kwargs):
+    # Open subscriptions of this user re-check their access to the course.
+    if raw:
+        return
+    publish_course_event(
+        instance.course_id, Kinds.MEMBERSHIP_CHANGED, instance.pk, user_id=instance.user_id
+    )
+
+
+@receiver(pre_save, sender="whiteboard.WhiteboardSession", dispatch_uid="graphql-events-whiteboard")
+def whiteboard_pre_save(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding:
+        instance._was_active = None
+        return
+    instance._was_active = (
+        sender._base_manager.filter(pk=instance.pk).values_list("is_active", flat=True).first()
+    )
+
+
+@receiver(post_save, sender="whiteboard.WhiteboardSession", dispatch_uid="graphql-events-whiteboard")
+def whiteboard_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    was_active = getattr(instance, "_was_active", None)
+    if instance.is_active and (created or was_active is False):
+        publish_course_event(instance.course_id, Kinds.WHITEBOARD_STARTED, instance.pk)
+    elif not instance.is_active and was_active:
+        publish_course_event(instance.course_id, Kinds.WHITEBOARD_ENDED, instance.pk)
+
+
+@receiver(post_delete, sender="whiteboard.WhiteboardSession", dispatch_uid="graphql-events-whiteboard")
+def whiteboard_deleted(sender, instance, **kwargs):
+    if instance.is_active:
+        publish_course_event(instance.course_id, Kinds.WHITEBOARD_ENDED, instance.pk)
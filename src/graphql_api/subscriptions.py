@@ -0,0 +1,98 @@
+"""GraphQL subscription root for live course events."""
+
+from __future__ import annotations
+
+import graphene
+from graphql import GraphQLError
+
+from courses.models import CourseMembership
+from courses.permissions import CoursePermissions
+
+from .events import PERSONAL_KINDS, Kinds
+
+
+class CourseEventType(graphene.ObjectType):
+    """Something changed in a course; clients refetch the affected object."""
+
+    course_id = graphene.ID(required=True)
+    kind = graphene.String(required=True)
+    object_id = graphene.ID(required=True)
+    user_id = graphene.ID()
+
+    @staticmethod
+    def resolve_course_id(root, info):
+        return root["courseId"]
+
+    @staticmethod
+    def resolve_kind(root, info):
+        return root["kind"]
+
+    @staticmethod
+    def resolve_object_id(root, info):
+        return root["objectId"]
+
+    @staticmethod
+    def resolve_user_id(root, info):
+        return root["userId"]
+
+
+async def _course_access(user, course_id: int, fresh: bool = False):
+    """``(is_member, is_staff)`` for the user in the course.
+
+    ``fresh`` reads the membership row itself rather than the cached role
+    map, whose invalidation may not have landed when the change event does.
+    """
+
+    if fresh:
+        role = (
+            await CourseMembership.objects.filter(user_id=user.pk, course_id=course_id)
+            .values_list("role", flat=True)
+            .afirst()
+        )
+        permissions = CoursePermissions(user, {course_id: role} if role else {})
+    else:
+        permissions = await CoursePermissions.afor_user(user)
+    is_staff = user.is_staff or permissions.is_course_staff(course_id)
+    return is_staff or permissions.is_member(course_id), is_staff
+
+
+class Subscription(graphene.ObjectType):
+    """Merged into the schema as ``graphene.Schema(..., subscription=Subscription)``.
+
+    Resolvers run inside :class:`graphql_api.consumers.GraphQLWSConsumer`,
+    which is the ``info.context``.
+    """
+
+    course_events = graphene.Field(
+        CourseEventType,
+        course_id=graphene.ID(required=True),
+        kinds=graphene.List(graphene.NonNull(graphene.String)),
+    )
+
+    @staticmethod
+    async def subscribe_course_events(root, info, course_id, kinds=None):
+        consumer = info.context
+        user = consumer.scope.get("user")
+        if user is None or not user.is_authenticated:
+            raise GraphQLError("Authentication required.")
+        course_id = int(course_id)
+        is_member, is_staff = await _course_access(user, course_id)
+        if not is_member:
+            raise GraphQLError("Course not found.")
+
+        async for event in consumer.course_events(course_id):
+            if event["kind"] == Kinds.MEMBERSHIP_CHANGED and event["userId"] in (None, user.pk):
+                # Removed members stop receiving events; a role change
+                # updates what the subscription may see.
+                is_member, is_staff = await _course_access(user, course_id, fresh=True)
+                if not is_member:
+                    raise GraphQLError("Course membership ended.")
+            if kinds and event["kind"] not in kinds:
+                continue
+            if event["kind"] in PERSONAL_KINDS and not is_staff and event["userId"] != user.pk:
+                continue
+            yield event
+
+    @staticmethod
+    def resolve_course_events(root, info, **kwargs):
+        return root
@@ -0,0 +1,82 @@
+import graphene
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from graphql import get_operation_ast, parse
+
+from graphql_api.limits import CostAnalyzer, QueryLimits
+
+
+class Item(graphene.ObjectType):
+    title = graphene.String()
+
+
+class ItemConnection(graphene.relay.Connection):
+    class Meta:
+        node = Item
+
+
+class Course(graphene.ObjectType):
+    title = graphene.String()
+    items = graphene.relay.ConnectionField(ItemConnection)
+    tags = graphene.List(graphene.String)
+
+
+class CourseConnection(graphene.relay.Connection):
+    class Meta:
+        node = Course
+
+
+class Query(graphene.ObjectType):
+    items = graphene.relay.ConnectionField(ItemConnection)
+    courses = graphene.relay.ConnectionField(CourseConnection)
+    course_list = graphene.List(Course)
+
+
+schema = graphene.Schema(query=Query)
+
+
+def price(query, variables=None):
+    document = parse(query)
+    analyzer = CostAnalyzer(schema.graphql_schema, default_list_size=20)
+    return analyzer.analyze(document, get_operation_ast(document), variables)
+
+
+class CostAnalyzerTests(SimpleTestCase):
+    def test_connection_page_is_priced_once(self):
+        # items(1) + edges(1) + node(1), times the page of 10.
+        cost = price("{ items(first: 10) { edges { node { title } } } }")
+        self.assertEqual((cost.cost, cost.depth), (30, 4))
+
+    def test_nested_connections_multiply_by_each_page(self):
+        cost = price(
+            """
+            query ($first: Int) {
+              courses(first: $first) {
+                edges { node { items(first: 10) { edges { node { title } } } } }
+              }
+            }
+            """,
+            {"first": 5},
+        )
+        self.assertEqual(cost.cost, 5 * (1 + 1 + 1 + 30))
+
+    def test_unbounded_lists_use_the_default_size(self):
+        self.assertEqual(price("{ courseList { title } }").cost, 20)
+        self.assertEqual(price("{ items { pageInfo { hasNextPage } } }").cost, 40)
+
+
+class QueryLimitsIdentTests(SimpleTestCase):
+    def _request(self):
+        request = RequestFactory().post(
+            "/graphql/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="203.0.113.7, 10.0.0.1"
+        )
+        request.user = AnonymousUser()
+        return request
+
+    @override_settings(REST_FRAMEWORK={"NUM_PROXIES": 0})
+    def test_anonymous_callers_without_proxies_use_the_socket_address(self):
+        self.assertEqual(QueryLimits._ident(self._request()), "ip:10.0.0.1")
+
+    @override_settings(REST_FRAMEWORK={"NUM_PROXIES": 2})
+    def test_anonymous_callers_behind_proxies_use_the_forwarded_client(self):
+        self.assertEqual(QueryLimits._ident(self._request()), "ip:203.0.113.7")
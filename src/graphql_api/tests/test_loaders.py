@@ -0,0 +1,108 @@
+import graphene
+from django.test import RequestFactory, TestCase
+from graphene_django import DjangoObjectType
+
+from accounts.models import User
+from assignments.models import Assignment
+from courses.models import Course, CourseMembership
+from graphql_api.loaders import load_by
+from graphql_api.views import ExecutionContext
+
+
+class UserNode(DjangoObjectType):
+    class Meta:
+        model = User
+        fields = ("id", "email")
+
+
+class MembershipNode(DjangoObjectType):
+    user = graphene.Field(UserNode)
+
+    class Meta:
+        model = CourseMembership
+        fields = ("id", "role")
+
+    resolve_user = load_by("user", "user_id")
+
+
+class AssignmentNode(DjangoObjectType):
+    course = graphene.Field(lambda: CourseNode)
+
+    class Meta:
+        model = Assignment
+        fields = ("id", "title")
+
+    resolve_course = load_by("course", "course_id")
+
+
+class CourseNode(DjangoObjectType):
+    memberships = graphene.List(MembershipNode)
+    assignments = graphene.List(AssignmentNode)
+
+    class Meta:
+        model = Course
+        fields = ("id", "title")
+
+    resolve_memberships = load_by("memberships_by_course")
+    resolve_assignments = load_by("assignments_by_course")
+
+
+class Query(graphene.ObjectType):
+    courses = graphene.List(CourseNode)
+
+    def resolve_courses(root, info):
+        return Course.objects.order_by("pk")
+
+
+schema = graphene.Schema(query=Query)
+
+NESTED_QUERY = """
+{
+  courses {
+    title
+    memberships { role user { email } }
+    assignments { title course { title } }
+  }
+}
+"""
+
+
+class LoaderBatchingTests(TestCase):
+    def add_courses(self, count):
+        for _ in range(count):
+            course = Course.objects.create(title="Course")
+            for _ in range(3):
+                user = User.objects.create_user(email=f"{User.objects.count()}@example.com")
+                CourseMembership.objects.create(
+                    user=user, course=course, role=CourseMembership.Roles.STUDENT
+                )
+                Assignment.objects.create(course=course, title="Homework")
+
+    def execute(self, query):
+        result = schema.execute(
+            query,
+            context_value=RequestFactory().get("/graphql"),
+            execution_context_class=ExecutionContext,
+        )
+        self.assertIsNone(result.errors)
+        return result.data
+
+    def test_nested_memberships_and_users_batch_per_level(self):
+        self.add_courses(2)
+        # courses, memberships (all courses), users (all memberships)
+        with self.assertNumQueries(3):
+            data = self.execute("{ courses { memberships { role user { email } } } }")
+        self.assertEqual(len(data["courses"]), 2)
+        self.assertTrue(all(m["user"]["email"] for c in data["courses"] for m in c["memberships"]))
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.add_courses(2)
+        with self.assertNumQueries(5):
+            self.execute(NESTED_QUERY)
+        self.add_courses(10)
+        with self.assertNumQueries(5):
+            data = self.execute(NESTED_QUERY)
+        self.assertEqual(len(data["courses"]), 12)
+        first = data["courses"][0]
+        self.assertEqual(len(first["memberships"]), 3)
+        self.assertEqual(first["assignments"][0]["course"]["title"], "Course")
@@ -0,0 +1,183 @@
+"""GraphQL HTTP endpoint."""
+
+import json
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.http import HttpResponseBadRequest, HttpResponseNotAllowed
+from graphene_django.constants import MUTATION_ERRORS_FLAG
+from graphene_django.settings import graphene_settings
+from graphene_django.views import GraphQLView as BaseGraphQLView
+from graphene_django.views import HttpError
+from graphql import ExecutionResult, OperationType, execute, get_operation_ast
+from graphql.pyutils import Path
+from graphql_sync_dataloaders import DeferredExecutionContext
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.db.replicas import replica_reads
+
+from .documents import get_document_cache
+from .limits import QueryLimitExceeded, get_query_limits
+from .persisted import PersistedQueryNotFound, get_persisted_queries, query_hash
+from .response_cache import get_response_cache
+
+
+class ExecutionContext(DeferredExecutionContext):
+    """``DeferredExecutionContext`` for graphql-core releases that pass ``path`` on errors.
+
+    graphql-sync-dataloaders calls ``handle_field_error(error, return_type)``;
+    graphql-core 3.2.4+ also needs the field's ``Path``, rebuilt here from
+    the error's own path.
+    """
+
+    def handle_field_error(self, error, return_type, path=None):
+        if path is None:
+            for key in error.path or ():
+                path = Path(path, key, None)
+        return super().handle_field_error(error, return_type, path)
+
+
+class GraphQLView(BaseGraphQLView):
+    """``GraphQLView`` with persisted queries, cached documents and DataLoader batching.
+
+    Clients may send ``extensions.persistedQuery.sha256Hash`` (Apollo's
+    format) instead of the query text; the text is looked up in the manifest
+    produced by the frontend build. Parsed, validated documents are kept in
+    an LRU cache so repeated operations skip both steps. Each operation is
+    priced and depth-checked before it runs (see ``limits``); opted-in
+    queries are answered from the per-user response cache (filled from the
+    primary), and the rest of the queries read from a replica when one is
+    configured. Deferred execution lets DataLoaders batch per query level.
+    """
+
+    execution_context_class = ExecutionContext
+
+    @staticmethod
+    def _persisted_hash(request, data):
+        extensions = request.GET.get("extensions") or data.get("extensions")
+        if isinstance(extensions, str):
+            try:
+                extensions = json.loads(extensions)
+            except ValueError:
+                raise HttpError(HttpResponseBadRequest("Extensions are invalid JSON.")) from None
+        if not isinstance(extensions, dict):
+            return None
+        persisted = extensions.get("persistedQuery") or {}
+        return persisted.get("sha256Hash")
+
+    def get_graphql_params(self, request, data):
+        query, variables, operation_name, id = super().get_graphql_params(request, data)
+        store = get_persisted_queries()
+
+        digest = self._persisted_hash(request, data)
+        if digest:
+            if query and query_hash(query) != digest:
+                raise HttpError(HttpResponseBadRequest("Provided sha does not match query."))
+            try:
+                query = store.get(digest)
+            except PersistedQueryNotFound:
+                raise HttpError(HttpResponseBadRequest("PersistedQueryNotFound")) from None
+        elif (
+            query
+            and settings.GRAPHQL_PERSISTED_QUERIES_ONLY
+            and query_hash(query) not in store
+        ):
+            raise HttpError(HttpResponseBadRequest("Only persisted queries are allowed."))
+        return query, variables, operation_name, id
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, show_graphiql=False
+    ):
+        if not query:
+            if show_graphiql:
+                return None
+            raise HttpError(HttpResponseBadRequest("Must provide query string."))
+
+        document, errors = get_document_cache().get(self.schema.graphql_schema, query)
+        if errors:
+            return ExecutionResult(errors=errors)
+
+        operation_ast = get_operation_ast(document, operation_name)
+        if request.method.lower() == "get" and operation_ast:
+            if operation_ast.operation != OperationType.QUERY:
+                if show_graphiql:
+                    return None
+                raise HttpError(
+                    HttpResponseNotAllowed(
+                        ["POST"],
+                        "Can only perform a {} operation from a POST request.".format(
+                            operation_ast.operation.value
+                        ),
+                    )
+                )
+
+        # Cached responses are served before pricing: they cost no execution,
+        # so they must not spend the caller's budget.
+        cache_key = None
+        if operation_ast and operation_ast.operation == OperationType.QUERY:
+            cache_key, cached = get_response_cache().get(
+                request, query, operation_ast, operation_name, variables
+            )
+            if cached is not None:
+                return cached
+
+        if operation_ast:
+            try:
+                get_query_limits().check(
+                    self.schema.graphql_schema, document, operation_ast, variables, request
+                )
+            except QueryLimitExceeded as error:
+                return ExecutionResult(errors=[error])
+
+        options = {
+            "schema": self.schema.graphql_schema,
+            "document": document,
+            "root_value": self.get_root_value(request),
+            "context_value": self.get_context(request),
+            "variable_values": variables,
+            "operation_name": operation_name,
+            "middleware": self.get_middleware(request),
+            "execution_context_class": self.execution_context_class,
+        }
+        try:
+            if (
+                operation_ast
+                and operation_ast.operation == OperationType.MUTATION
+                and (
+                    graphene_settings.ATOMIC_MUTATIONS is True
+                    or connection.settings_dict.get("ATOMIC_MUTATIONS", False) is True
+                )
+            ):
+                with transaction.atomic():
+                    result = execute(**options)
+                    if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+                        transaction.set_rollback(True)
+                return result
+            # Cacheable queries fill a shared entry, so they read from the primary.
+            is_query = operation_ast and operation_ast.operation == OperationType.QUERY
+            if is_query and cache_key is None:
+                with replica_reads(request):
+                    result = execute(**options)
+            else:
+                result = execute(**options)
+        except Exception as e:
+            return ExecutionResult(errors=[e])
+        if cache_key is not None:
+            get_response_cache().set(cache_key, result)
+        return result
+
+
+class GraphQLMetricsView(APIView):
+    """In-process counters for this worker's document and response caches."""
+
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request):
+        return Response(
+            {
+                "documents": get_document_cache().snapshot(),
+                "responses": get_response_cache().snapshot(),
+            }
+        )
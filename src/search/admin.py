@@ -0,0 +1,40 @@
+"""Admin integration for full-text search."""
+
+from django.contrib import admin
+from django.db.models import Q
+
+from core.admin import ReplicaChangelistMixin
+
+from .indexing import search_ids
+from .models import SearchEntry
+
+
+class FullTextSearchAdminMixin:
+    """Replace ``icontains`` changelist search with the full-text index.
+
+    ``fulltext_lookups`` maps a queryset lookup (``"pk"``, ``"user_id"``…) to
+    the search kind whose ids it should be matched against; rows matching
+    any of them are returned.
+    """
+
+    fulltext_lookups = {}
+    fulltext_limit = 1000
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip() or not self.fulltext_lookups:
+            return super().get_search_results(request, queryset, search_term)
+
+        condition = Q()
+        for lookup, kind in self.fulltext_lookups.items():
+            ids = search_ids(search_term, kind, limit=self.fulltext_limit)
+            condition |= Q(**{f"{lookup}__in": ids})
+        return queryset.filter(condition), False
+
+
+@admin.register(SearchEntry)
+class SearchEntryAdmin(ReplicaChangelistMixin, admin.ModelAdmin):
+    list_display = ("kind", "object_id", "title", "course", "updated_at")
+    list_filter = ("kind",)
+    list_select_related = ("course",)
+    readonly_fields = ("kind", "object_id", "course", "title", "body", "updated_at")
+    exclude = ("search_vector",)
@@ -0,0 +1,118 @@
+"""Database-specific full-text search backends."""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, List, Optional, Tuple
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, Q
+
+from .models import SearchEntry
+
+
+FTS_TABLE = "search_searchentry_fts"
+
+Hit = Tuple[str, int, str, float]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class BaseSearchBackend:
+    def refresh(self, entry_ids: Iterable[int]) -> None:
+        """Bring derived index data up to date after entries were written."""
+
+    def search(
+        self,
+        query: str,
+        kinds: Optional[Iterable[str]] = None,
+        course_ids: Optional[Iterable[int]] = None,
+        limit: int = 50,
+    ) -> List[Hit]:
+        raise NotImplementedError
+
+    def _scope(self, queryset, kinds, course_ids):
+        if kinds:
+            queryset = queryset.filter(kind__in=list(kinds))
+        if course_ids is not None:
+            queryset = queryset.filter(course_id__in=list(course_ids))
+        return queryset
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """Weighted ``tsvector`` column with a GIN index, ranked by ``ts_rank``."""
+
+    vector = SearchVector("title", weight="A", config="english") + SearchVector(
+        "body", weight="B", config="english"
+    )
+
+    def refresh(self, entry_ids):
+        SearchEntry.objects.filter(pk__in=list(entry_ids)).update(search_vector=self.vector)
+
+    def search(self, query, kinds=None, course_ids=None, limit=50):
+        search_query = SearchQuery(query, search_type="websearch", config="english")
+        queryset = self._scope(SearchEntry.objects.all(), kinds, course_ids)
+        rows = (
+            queryset.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
+            .order_by("-rank", "pk")
+            .values_list("kind", "object_id", "title", "rank")[:limit]
+        )
+        return list(rows)
+
+
+class SqliteSearchBackend(BaseSearchBackend):
+    """FTS5 external-content table kept in sync by triggers, ranked by ``bm25``."""
+
+    def search(self, query, kinds=None, course_ids=None, limit=50):
+        tokens = _TOKEN_RE.findall(query)
+        if not tokens:
+            return []
+        # Quote every token so user input can never be parsed as FTS syntax.
+        match = " ".join('"{}"*'.format(token.replace('"', "")) for token in tokens)
+        sql = [
+            f"SELECT e.kind, e.object_id, e.title, -bm25({FTS_TABLE}, 10.0, 1.0) AS rank",
+            f"FROM {FTS_TABLE} JOIN search_searchentry e ON e.id = {FTS_TABLE}.rowid",
+            f"WHERE {FTS_TABLE} MATCH %s",
+        ]
+        params: list = [match]
+        if kinds:
+            kinds = list(kinds)
+            sql.append(f"AND e.kind IN ({', '.join(['%s'] * len(kinds))})")
+            params.extend(kinds)
+        if course_ids is not None:
+            course_ids = list(course_ids)
+            if not course_ids:
+                return []
+            sql.append(f"AND e.course_id IN ({', '.join(['%s'] * len(course_ids))})")
+            params.extend(course_ids)
+        sql.append("ORDER BY rank DESC, e.id LIMIT %s")
+        params.append(limit)
+        with connection.cursor() as cursor:
+            cursor.execute(" ".join(sql), params)
+            return [tuple(row) for row in cursor.fetchall()]
+
+
+class FallbackSearchBackend(BaseSearchBackend):
+    """``icontains`` over the single entry table for other databases."""
+
+    def search(self, query, kinds=None, course_ids=None, limit=50):
+        tokens = _TOKEN_RE.findall(query)
+        if not tokens:
+            return []
+        condition = Q()
+        for token in tokens:
+            condition &= Q(title__icontains=token) | Q(body__icontains=token)
+        queryset = self._scope(SearchEntry.objects.filter(condition), kinds, course_ids)
+        rows = queryset.order_by("pk").values_list("kind", "object_id", "title")[:limit]
+        return [(kind, object_id, title, 1.0) for kind, object_id, title in rows]
+
+
+def get_search_backend() -> BaseSearchBackend:
+    vendor = connection.vendor
+    if vendor == "postgresql":
+        return PostgresSearchBackend()
+    if vendor == "sqlite":
+        return SqliteSearchBackend()
+    return FallbackSearchBackend()
@@ -0,0 +1,126 @@
+"""Mapping of indexed models to search entries and incremental updates."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from django.apps import apps
+from django.db import models
+
+from .backends import get_search_backend
+from .models import SearchEntry
+
+
+@dataclass(frozen=True)
+class IndexedModel:
+    """How one model is turned into a ``SearchEntry``."""
+
+    kind: str
+    model_label: str
+    fields: Tuple[str, ...]
+    document: Callable[[models.Model], Tuple[str, str]]
+    course_id: Callable[[models.Model], Optional[int]]
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+
+def _join(*parts: str) -> str:
+    return "\n".join(part for part in parts if part)
+
+
+INDEXED_MODELS: Dict[str, IndexedModel] = {
+    index.kind: index
+    for index in (
+        IndexedModel(
+            kind=SearchEntry.Kinds.COURSE,
+            model_label="courses.Course",
+            fields=("title", "description", "syllabus"),
+            document=lambda course: (course.title, _join(course.description, course.syllabus)),
+            course_id=lambda course: course.pk,
+        ),
+        IndexedModel(
+            kind=SearchEntry.Kinds.ASSIGNMENT,
+            model_label="assignments.Assignment",
+            fields=("title", "instructions_md", "course"),
+            document=lambda assignment: (assignment.title, assignment.instructions_md),
+            course_id=lambda assignment: assignment.course_id,
+        ),
+        IndexedModel(
+            kind=SearchEntry.Kinds.USER,
+            model_label="accounts.User",
+            fields=("first_name", "last_name", "email"),
+            document=lambda user: (user.get_full_name() or user.email, user.email),
+            course_id=lambda user: None,
+        ),
+    )
+}
+
+
+def index_objects(index: IndexedModel, objects: Iterable[models.Model]) -> int:
+    """Upsert search entries for ``objects``; returns how many were written."""
+
+    entries = []
+    for obj in objects:
+        title, body = index.document(obj)
+        entries.append(
+            SearchEntry(
+                kind=index.kind,
+                object_id=obj.pk,
+                course_id=index.course_id(obj),
+                title=title[:512],
+                body=body,
+            )
+        )
+    if not entries:
+        return 0
+    SearchEntry.objects.bulk_create(
+        entries,
+        update_conflicts=True,
+        unique_fields=["kind", "object_id"],
+        update_fields=["course", "title", "body", "updated_at"],
+    )
+    get_search_backend().refresh(
+        SearchEntry.objects.filter(
+            kind=index.kind, object_id__in=[entry.object_id for entry in entries]
+        ).values_list("pk", flat=True)
+    )
+    return len(entries)
+
+
+def remove_objects(index: IndexedModel, object_ids: Iterable[int]) -> None:
+    SearchEntry.objects.filter(kind=index.kind, object_id__in=list(object_ids)).delete()
+
+
+def rebuild_index(kinds: Optional[Iterable[str]] = None, batch_size: int = 1000) -> Dict[str, int]:
+    """Re-index every object of the given kinds (all by default)."""
+
+    counts = {}
+    for kind in kinds or INDEXED_MODELS:
+        index = INDEXED_MODELS[kind]
+        total = 0
+        batch = []
+        for obj in index.model._default_manager.order_by("pk").iterator(chunk_size=batch_size):
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                total += index_objects(index, batch)
+                batch = []
+        total += index_objects(index, batch)
+        existing = index.model._default_manager.values("pk")
+        SearchEntry.objects.filter(kind=kind).exclude(object_id__in=existing).delete()
+        counts[str(kind)] = total
+    return counts
+
+
+def search(query: str, kinds=None, course_ids=None, limit: int = 50):
+    """Ranked ``(kind, object_id, title, rank)`` hits for ``query``."""
+
+    return get_search_backend().search(query, kinds=kinds, course_ids=course_ids, limit=limit)
+
+
+def search_ids(query: str, kind: str, limit: int = 1000):
+    """Matching object ids of one kind, best first."""
+
+    return [hit[1] for hit in search(query, kinds=[kind], limit=limit)]
@@ -0,0 +1,19 @@
+"""Rebuild the full-text search index from the source tables."""
+
+from django.core.management.base import BaseCommand
+
+from search.indexing import INDEXED_MODELS, rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Re-index courses, assignments and users (or only the given kinds)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kinds", nargs="*", choices=sorted(INDEXED_MODELS))
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        counts = rebuild_index(options["kinds"] or None, batch_size=options["batch_size"])
+        for kind, count in counts.items():
+            self.stdout.write(f"  {kind}: {count} entries")
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
@@ -0,0 +1,3 @@
+"""Search models package exports."""
+
+from .definitions import *  # noqa: F401,F403
@@ -0,0 +1,46 @@
+"""Full-text search index models."""
+
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+class SearchEntry(models.Model):
+    """One searchable document per indexed object.
+
+    On PostgreSQL ``search_vector`` holds the weighted ``tsvector`` (GIN
+    indexed); on SQLite an FTS5 table mirrors ``title``/``body`` through
+    triggers. Both are created by this app's migrations.
+    """
+
+    class Kinds(models.TextChoices):
+        COURSE = "course", "Course"
+        ASSIGNMENT = "assignment", "Assignment"
+        USER = "user", "User"
+
+    kind = models.CharField(max_length=32, choices=Kinds.choices)
+    object_id = models.PositiveBigIntegerField()
+    course = models.ForeignKey(
+        "courses.Course",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="Course the object belongs to, used to scope results.",
+    )
+    title = models.CharField(max_length=512)
+    body = models.TextField(blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=("kind", "object_id"), name="search_entry_unique_object"),
+        ]
+        verbose_name = "Search Entry"
+        verbose_name_plural = "Search Entries"
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.object_id} {self.title}"
+
+
+__all__ = ["SearchEntry"]
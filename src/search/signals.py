@@ -0,0 +1,27 @@
+"""Keep search entries in step with the indexed models."""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .indexing import INDEXED_MODELS, index_objects, remove_objects
+
+
+def _connect(index):
+    def saved(sender, instance, raw=False, update_fields=None, **kwargs):
+        if raw:
+            return
+        # e.g. update_last_login() saves only last_login; nothing to re-index.
+        if update_fields is not None and not set(update_fields) & set(index.fields):
+            return
+        transaction.on_commit(lambda: index_objects(index, [instance]))
+
+    def deleted(sender, instance, **kwargs):
+        remove_objects(index, [instance.pk])
+
+    uid = f"search-{index.kind}"
+    post_save.connect(saved, sender=index.model_label, weak=False, dispatch_uid=uid)
+    post_delete.connect(deleted, sender=index.model_label, weak=False, dispatch_uid=uid)
+
+
+for _index in INDEXED_MODELS.values():
+    _connect(_index)
@@ -0,0 +1,47 @@
+"""Ranked full-text search API."""
+
+from rest_framework import permissions, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from courses.permissions import get_course_permissions
+
+from .indexing import INDEXED_MODELS, search
+from .models import SearchEntry
+
+
+class SearchView(APIView):
+    """``GET ?q=…&kind=course&kind=assignment&limit=20``.
+
+    Staff see every entry; everyone else only sees courses and assignments
+    of courses they belong to, and never user entries.
+    """
+
+    permission_classes = (permissions.IsAuthenticated,)
+    max_limit = 100
+
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise ValidationError({"q": ["This parameter is required."]})
+        kinds = request.query_params.getlist("kind") or list(INDEXED_MODELS)
+        unknown = set(kinds) - set(INDEXED_MODELS)
+        if unknown:
+            raise ValidationError({"kind": [f"Unknown kind(s): {', '.join(sorted(unknown))}."]})
+        try:
+            limit = max(1, min(int(request.query_params.get("limit", 20)), self.max_limit))
+        except ValueError as exc:
+            raise ValidationError({"limit": ["Must be an integer."]}) from exc
+
+        course_ids = None
+        if not request.user.is_staff:
+            kinds = [kind for kind in kinds if kind != SearchEntry.Kinds.USER]
+            course_ids = list(get_course_permissions(request).course_ids)
+
+        hits = search(query, kinds=kinds, course_ids=course_ids, limit=limit) if kinds else []
+        results = [
+            {"kind": kind, "id": object_id, "title": title, "rank": round(float(rank), 4)}
+            for kind, object_id, title, rank in hits
+        ]
+        return Response({"query": query, "results": results}, status=status.HTTP_200_OK)
@@ -6,7 +6,7 @@ from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
-from courses.models import CourseMembership
+from courses.permissions import CoursePermissions
 from .models import WhiteboardSession, WhiteboardStroke
 
 User = get_user_model()
@@ -28,8 +28,9 @@ class WhiteboardConsumer(AsyncJsonWebsocketConsumer):
             await self.close(code=4404)
             return
 
-        course = session.course
-        is_member = await CourseMembership.objects.filter(course=course, user=user).aexists()
+        # Resolved once per connection; later checks are dictionary lookups.
+        self.permissions = await CoursePermissions.afor_user(user)
+        is_member = self.permissions.is_member(session.course_id)
         if not (user.is_superuser or session.instructor_id == user.id or is_member):
             await self.close(code=4403)
             return
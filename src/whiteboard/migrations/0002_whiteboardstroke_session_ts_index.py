@@ -0,0 +1,30 @@
+# Generated by Django 4.2.11 on 2026-10-18 22:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("whiteboard", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="whiteboardstroke",
+            index=models.Index(
+                fields=["session", "ts"], name="whiteboard_stroke_session_ts"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="whiteboardstroke",
+            name="session",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="strokes",
+                to="whiteboard.whiteboardsession",
+            ),
+        ),
+    ]
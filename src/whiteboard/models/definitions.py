@@ -41,6 +41,8 @@ class WhiteboardStroke(models.Model):
         WhiteboardSession,
         on_delete=models.CASCADE,
         related_name="strokes",
+        # Covered by the leading column of ``whiteboard_stroke_session_ts``.
+        db_index=False,
     )
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -54,6 +56,9 @@ class WhiteboardStroke(models.Model):
 
     class Meta:
         ordering = ("session", "ts")
+        indexes = [
+            models.Index(fields=("session", "ts"), name="whiteboard_stroke_session_ts"),
+        ]
         verbose_name = "Whiteboard Stroke"
         verbose_name_plural = "Whiteboard Strokes"
 